@@ -6,333 +6,3100 @@
 # Implement the Array Class (6 points)
 # Adapt your implementation to work with 2D Arrays (3 points)
 
+import mmap as mmap_module
+import multiprocessing
+import operator
+import os
+import sys
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import accumulate, chain, compress, islice, product, repeat, starmap
+from math import ceil, isfinite, isnan, nan, prod, sqrt
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the pure Python backend is used without it
+    np = None
+
+# Element types allowed in an Array and the name of the matching dtype
+_DTYPES = {bool: "bool", int: "int64", float: "float64"}
+
+# dtype name -> struct/memoryview format of the flat storage buffer, ordered
+# from the narrowest to the widest dtype (see _result_dtype)
+_TYPECODES = {"bool": "?", "int8": "b", "int16": "h", "int32": "i", "int64": "q", "float32": "f", "float64": "d"}
+
+# dtype name -> kind: "b" (bool), "i" (signed int) or "f" (float)
+_KINDS = {"bool": "b", "int8": "i", "int16": "i", "int32": "i", "int64": "i", "float32": "f", "float64": "f"}
+
+# dtype name -> the dtypes its values can be cast to without losing information
+_SAFE_CASTS = {
+    "bool": set(_TYPECODES),
+    "int8": {"int8", "int16", "int32", "int64", "float32", "float64"},
+    "int16": {"int16", "int32", "int64", "float32", "float64"},
+    "int32": {"int32", "int64", "float64"},
+    "int64": {"int64", "float64"},
+    "float32": {"float32", "float64"},
+    "float64": {"float64"},
+}
+
+# Marks the end of an iterator of values
+_END = object()
+
+# Maximum number of elements packed at a time when writing into an existing
+# buffer, which bounds the size of the temporary buffers
+_CHUNK_SIZE = 65536
+
+# Array files (see Array.save) start with this magic string, followed by a
+# format version byte, the header length and an ASCII header
+_FILE_MAGIC = b"\x93ARRAY"
+_FILE_VERSION = 1
+
+# The raw data of an Array file starts at a multiple of this many bytes
+_FILE_ALIGNMENT = 64
+
+# Arrays with more elements than this are summarised by str() and repr(),
+# which then only show this many rows and elements at each end of every axis
+_PRINT_THRESHOLD = 1000
+_PRINT_EDGE_ITEMS = 3
+
+# Stands in for every NaN in Array.__hash__
+_NAN_KEY = "nan"
+
+# Arrays smaller than this are not split up when running in parallel
+_PARALLEL_MIN_SIZE = 1 << 16
+
+# Side length of the square tiles of the pure Python matrix product
+_MATMUL_BLOCK = 64
+
+
+def _buffer(dtype, values):
+    """Packs values into a flat, typed buffer.
+
+    The stdlib array module has no bool typecode, so bool arrays are packed
+    as unsigned bytes and viewed through the "?" format.
+
+    Args:
+        dtype (str): name of the dtype, a key of _TYPECODES.
+        values (iterable): the values to pack.
+
+    Returns:
+        memoryview: 1-dimensional buffer with one item per value.
+    """
+    code = _TYPECODES[dtype]
+    if code == "?":
+        return memoryview(array("B", values)).cast("?")
+    return memoryview(array(code, values))
+
+
+def _from_bytes(dtype, raw):
+    """Returns a flat, typed buffer holding a copy of the raw bytes of
+    elements (bytes or a memoryview of bytes)."""
+    data = array("B" if dtype == "bool" else _TYPECODES[dtype])
+    data.frombytes(raw)
+    return memoryview(data).cast("?") if dtype == "bool" else memoryview(data)
+
+
+def _zeros(dtype, size):
+    """Returns a flat, typed buffer of size zeros (False for bool)."""
+    code = _TYPECODES[dtype]
+    if code == "?":
+        return memoryview(array("B", bytes(size))).cast("?")
+    return memoryview(array(code, bytes(size*array(code).itemsize)))
+
+
+def _full(dtype, value, size):
+    """Returns a flat, typed buffer of size copies of value."""
+    code = _TYPECODES[dtype]
+    if code == "?":
+        return memoryview(array("B", (value,))*size).cast("?")
+    return memoryview(array(code, (value,))*size)
+
+
+def _check_shape(shape):
+    """Checks that shape is a tuple of non-negative ints.
+
+    Raises:
+        TypeError: If shape is not a tuple of ints.
+        ValueError: If shape has negative values.
+    """
+    if not isinstance(shape, tuple):
+        raise TypeError("Argument shape must be of type tuple.")
+    if set(map(type, shape)) != {int}:
+        raise TypeError("shape value(s) must be of one type: int.")
+    if min(shape) < 0:
+        raise ValueError("shape value(s) must be non-negative.")
+
+
+def _check_dtype(dtype):
+    """Raises a TypeError if dtype is not the name of a supported dtype."""
+    if dtype not in _TYPECODES:
+        raise TypeError(f"Unsupported dtype {dtype!r}, must be one of {', '.join(_TYPECODES)}.")
+
+
+def _defers(other):
+    """Checks if the operators of Array should return NotImplemented for
+    other, so that its reflected method runs instead. As with NumPy arrays,
+    a class asks for this by setting __array_ufunc__ = None."""
+    return getattr(type(other), "__array_ufunc__", False) is None
+
+
+def _unpickle(shape, dtype, raw):
+    """Recreates a pickled Array from its shape, dtype and raw bytes, see Array.__reduce__."""
+    return Array._from_buffer(shape, dtype, memoryview(bytearray(raw)).cast(_TYPECODES[dtype]))
+
+
+def _result_dtype(*dtypes, scalars=()):
+    """Returns the dtype of an arithmetic result.
+
+    That is the narrowest dtype all the dtypes of the operand arrays can be
+    cast to without losing information, e.g. int16 for int8 and int16, and
+    float64 for int32 and float32. As in NumPy, Python numbers (scalars) do
+    not widen the result, they only raise its kind: a float turns a bool or
+    int result into float64 and an int turns a bool result into int64.
+    """
+    dtype = next(dtype for dtype in _TYPECODES if all(dtype in _SAFE_CASTS[d] for d in dtypes))
+    scalar_kinds = {_KINDS[_DTYPES[type(scalar)]] for scalar in scalars}
+    if "f" in scalar_kinds and _KINDS[dtype] != "f":
+        return "float64"
+    if "i" in scalar_kinds and dtype == "bool":
+        return "int64"
+    return dtype
+
+
+def _can_cast(dtype, to_dtype, weak=False):
+    """Checks if values of dtype can be stored in an array of to_dtype
+    without losing information, see _SAFE_CASTS.
+
+    With weak, dtype is that of a Python number, which can be stored in an
+    array of the same or a higher kind (bool, int, float) of any width, e.g.
+    an int in an int8 array. Whether the value fits is checked when storing it.
+    """
+    if weak:
+        return "bif".index(_KINDS[dtype]) <= "bif".index(_KINDS[to_dtype])
+    return to_dtype in _SAFE_CASTS[dtype]
+
+
+def _check_value_types(value_types, dtype):
+    """Checks that values of the given Python types can be stored in an array of dtype.
+
+    Raises:
+        TypeError: If a type is not int, float or bool, or cannot be stored as dtype.
+    """
+    if not value_types <= _DTYPES.keys():
+        raise TypeError("Values must be of one type: int, float or bool.")
+    for value_type in value_types:
+        if not _can_cast(_DTYPES[value_type], dtype, weak=True):
+            raise TypeError(f"Cannot store {_DTYPES[value_type]} values in an array of dtype {dtype}.")
+
+
+def _sum_dtype(dtype):
+    """Returns the dtype of sums of elements of dtype: int64 for all ints, so
+    that sums of narrow ints do not overflow, and dtype itself for floats."""
+    return "int64" if _KINDS[dtype] == "i" else dtype
+
+
+def _rsub(a, b):
+    """Reflected subtraction, b - a."""
+    return b - a
+
+
+def _contiguous_strides(shape):
+    """Returns the row-major strides (counted in elements) for a shape."""
+    strides = []
+    step = 1
+    for n in reversed(shape):
+        strides.append(step)
+        step *= n
+    return tuple(reversed(strides))
+
+
+def _is_contiguous(shape, strides):
+    """Checks if shape and strides describe a row-major, gap-free layout.
+
+    Axes of length 1 are never stepped along, so their stride is ignored.
+    """
+    step = 1
+    for n, stride in zip(reversed(shape), reversed(strides)):
+        if n != 1 and stride != step:
+            return False
+        step *= n
+    return True
+
+
+def _run_values(data, start, count, step):
+    """Returns `count` items of `data` from index `start` in steps of `step`.
+
+    A memoryview slice is returned, so no elements are copied. A step of 0
+    (a broadcast axis) repeats the item at `start`.
+    """
+    if step == 0:
+        return repeat(data[start], count)
+    return data[_run_slice(start, count, step)]
+
+
+def _run_slice(start, count, step):
+    """Returns the slice of `count` buffer items from `start` in steps of `step`."""
+    stop = start + count*step
+    return slice(start, stop if stop >= 0 else None, step)
+
+
+def _broadcast_shapes(*shapes):
+    """Returns the shape that arrays of the given shapes broadcast to.
+
+    Shapes are aligned at their last axis, and missing leading axes count as
+    length 1. Along each axis the lengths must be equal or 1.
+
+    Raises:
+        ValueError: If the shapes cannot be broadcast together.
+    """
+    ndim = max(map(len, shapes))
+    result = []
+    for lengths in zip(*((1,)*(ndim - len(shape)) + shape for shape in shapes)):
+        other_lengths = set(lengths) - {1}
+        if len(other_lengths) > 1:
+            raise ValueError(f"Arrays have different shapes: {' and '.join(map(str, shapes))} cannot be broadcast together.")
+        result.append(other_lengths.pop() if other_lengths else 1)
+    return tuple(result)
+
+
+def _nest(flat, shape):
+    """Splits a flat row-major list into nested lists of the given shape."""
+    for axis in range(len(shape) - 1, 0, -1):
+        n = shape[axis]
+        flat = [flat[i*n: (i+1)*n] for i in range(prod(shape[:axis]))]
+    return flat
+
+
+def _format_nested(array, edge_items=None):
+    """Formats an array like str() formats its nested list of values.
+
+    With edge_items, axes longer than 2*edge_items only show their first and
+    last edge_items entries, with "..." in between, so only those elements
+    are read.
+    """
+    n = array.shape[0]
+    if edge_items is None or n <= 2*edge_items:
+        if array.ndim == 1:
+            return "[" + ", ".join(map(str, array._flat())) + "]"
+        indices = range(n)
+    else:
+        indices = chain(range(edge_items), (None,), range(n - edge_items, n))
+    parts = ("..." if i is None else str(array[i]) if array.ndim == 1 else _format_nested(array[i], edge_items)
+             for i in indices)
+    return "[" + ", ".join(parts) + "]"
+
+
+def _chunks(values):
+    """Splits an iterable of values into sequences of at most _CHUNK_SIZE.
+
+    Slices of a memoryview are views, so contiguous data is not copied.
+    """
+    if isinstance(values, memoryview):
+        for start in range(0, len(values), _CHUNK_SIZE):
+            yield values[start: start + _CHUNK_SIZE]
+        return
+    values = iter(values)
+    while chunk := list(islice(values, _CHUNK_SIZE)):
+        yield chunk
+
+
+class _Moments:
+    """Count, mean, sum of squared deviations from the mean (m2), min and max
+    of a stream of numbers, read once in chunks of _CHUNK_SIZE.
+
+    Each chunk is summarised with two passes over it (its mean, then the
+    squared deviations from that mean), and merged into the running totals
+    with the pairwise update of Chan et al., which keeps the variance
+    accurate for large counts and large offsets.
+    """
+
+    def __init__(self, values=()):
+        """Collects the moments of values (any iterable of numbers)."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+        for chunk in _chunks(values):
+            self._add_chunk(chunk)
+
+    def _add_chunk(self, chunk):
+        """Merges the moments of a non-empty sequence of numbers."""
+        other = _Moments()
+        other.count = len(chunk)
+        other.mean = sum(chunk)/other.count
+        deviations = [v - other.mean for v in chunk]
+        other.m2 = sum(map(operator.mul, deviations, deviations))
+        other.min = _min(chunk)
+        other.max = _max(chunk)
+        self.merge(other)
+
+    def merge(self, other):
+        """Merges the moments of another stream into these.
+
+        Args:
+            other (_Moments): moments of the other stream.
+
+        Returns:
+            _Moments: self, for chaining.
+        """
+        if not other.count:
+            return self
+        if not self.count:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta*other.count/count
+        self.m2 += other.m2 + delta*delta*self.count*other.count/count
+        self.count = count
+        self.min = _min((self.min, other.min))
+        self.max = _max((self.max, other.max))
+        return self
+
+    def var(self, ddof=0):
+        """Returns the variance, nan if count <= ddof."""
+        return self.m2/(self.count - ddof) if self.count > ddof else nan
+
+    def describe(self, ddof=0):
+        """Returns the collected statistics as a dict."""
+        var = self.var(ddof)
+        return {"count": self.count, "mean": self.mean, "std": sqrt(var), "var": var,
+                "min": self.min, "max": self.max}
+
+
+def _mean(values):
+    """Returns the mean of an iterable of numbers."""
+    return _Moments(values).mean
+
+
+def _var(values, ddof=0):
+    """Returns the variance of an iterable of numbers."""
+    return _Moments(values).var(ddof)
+
+
+def _std(values, ddof=0):
+    """Returns the standard deviation of an iterable of numbers."""
+    return sqrt(_Moments(values).var(ddof))
+
+
+def _sequence(values):
+    """Returns values as a sequence that can be read more than once."""
+    return values if isinstance(values, (memoryview, list, tuple)) else list(values)
+
+
+def _has_nan(values):
+    """Checks if a sequence of numbers has a NaN."""
+    if isinstance(values, memoryview) and values.format not in ("f", "d"):
+        return False
+    return any(map(isnan, values))
+
+
+def _min(values):
+    """Returns the smallest item of an iterable, NaN if there is one (as in NumPy)."""
+    values = _sequence(values)
+    return nan if _has_nan(values) else min(values)
+
+
+def _max(values):
+    """Returns the largest item of an iterable, NaN if there is one (as in NumPy)."""
+    values = _sequence(values)
+    return nan if _has_nan(values) else max(values)
+
+
+def _argmin(values):
+    """Returns the position of the first smallest item of an iterable,
+    or of the first NaN (as in NumPy)."""
+    values = _sequence(values)
+    if _has_nan(values):
+        return next(i for i, value in enumerate(values) if isnan(value))
+    return min(range(len(values)), key=values.__getitem__)
+
+
+def _argmax(values):
+    """Returns the position of the first largest item of an iterable,
+    or of the first NaN (as in NumPy)."""
+    values = _sequence(values)
+    if _has_nan(values):
+        return next(i for i, value in enumerate(values) if isnan(value))
+    return max(range(len(values)), key=values.__getitem__)
+
+
+def _matmul_values(left, right, block=_MATMUL_BLOCK):
+    """Yields the elements of the matrix product of two 2D arrays, row by row.
+
+    The right operand is transposed once into a list of its columns, so each
+    element is a dot product of two lists computed by sum/map in C. The
+    product is computed in tiles of `block` rows of `left` by `block`
+    columns of `right`, so each tile of columns is reused for a whole tile of
+    rows while it is still in the cache.
+
+    Args:
+        left (Array): array of shape (n, m).
+        right (Array): array of shape (m, p).
+        block (int): side length of the tiles.
+    """
+    columns = [list(column) for column in right.T._lines()]
+    p = len(columns)
+    row_tiles = (left[i0: i0 + block] for i0 in range(0, left.shape[0], block))
+    for tile in row_tiles:
+        rows = [list(row) for row in tile._lines()]
+        result = [[0]*p for _ in rows]
+        for j0 in range(0, p, block):
+            column_tile = columns[j0: j0 + block]
+            for row, result_row in zip(rows, result):
+                result_row[j0: j0 + block] = [sum(map(operator.mul, row, column)) for column in column_tile]
+        yield from chain.from_iterable(result)
+
+
+def _equal_or_nan(a, b):
+    """Checks if a and b are equal or both NaN."""
+    return a == b or (a != a and b != b)
+
+
+def _close(a, b, rtol, atol, equal_nan):
+    """Checks if a is close to b, see Array.allclose."""
+    if a == b:
+        return True
+    if isfinite(b) and abs(a - b) <= atol + rtol*abs(b):
+        return True
+    return equal_nan and a != a and b != b
+
+
+def _diff(values, n=1):
+    """Returns the n-th differences of consecutive items of an iterable."""
+    values = list(values)
+    for _ in range(n):
+        values = list(map(operator.sub, values[1:], values[:-1]))
+    return values
+
+
+def _rolling_sum(values, window):
+    """Returns the sums of all windows of consecutive items of an iterable,
+    as differences of the running sums."""
+    sums = [0, *accumulate(values)]
+    return map(operator.sub, sums[window:], sums[:-window])
+
+
+def _rolling_mean(values, window):
+    """Returns the means of all windows of consecutive items of an iterable."""
+    return [total/window for total in _rolling_sum(values, window)]
+
+
+def _rolling_extreme(values, window, keeps):
+    """Returns the extremes of all windows of consecutive items of an iterable.
+
+    A deque holds the positions of the candidates in the window, whose
+    values are in monotonic order with the extreme first. Each position is
+    pushed and popped at most once, so this is O(n) for any window.
+
+    Args:
+        values (iterable): the items.
+        window (int): the number of items in a window.
+        keeps (callable): operator.lt for minima and operator.gt for maxima,
+            keeps(a, b) is true if a candidate a beats a later item b.
+    """
+    values = list(values)
+    candidates = deque()
+    extremes = []
+    last_nan = -window  # a window with a NaN has a NaN extreme, as in NumPy
+    for i, value in enumerate(values):
+        if value != value:
+            last_nan = i
+        while candidates and not keeps(values[candidates[-1]], value):
+            candidates.pop()
+        candidates.append(i)
+        if candidates[0] <= i - window:
+            candidates.popleft()
+        if i >= window - 1:
+            extremes.append(nan if last_nan > i - window else values[candidates[0]])
+    return extremes
+
+
+def _count_nonzero(values):
+    """Returns the number of truthy items of an iterable."""
+    return sum(map(bool, values))
+
+
+def _select(selected, x, y):
+    """Returns x if selected is true, y otherwise."""
+    return x if selected else y
+
+
+# Pure Python reducers by name, see Array._reduce
+_REDUCERS = {
+    "count_nonzero": _count_nonzero,
+    "any": any,
+    "all": all,
+    "sum": sum,
+    "min": _min,
+    "max": _max,
+    "argmin": _argmin,
+    "argmax": _argmax,
+    "mean": _mean,
+    "var": _var,
+    "std": _std,
+}
+
+# Reducers that work for every dtype and for empty arrays
+_LOGICAL_REDUCERS = {"count_nonzero", "any", "all"}
+
+# Pure Python scans by name, from the items of a line to those of the result line, see Array._scan
+_SCANS = {
+    "cumsum": accumulate,
+    "cumprod": partial(accumulate, func=operator.mul),
+    "diff": _diff,
+    "rolling_sum": _rolling_sum,
+    "rolling_mean": _rolling_mean,
+    "rolling_min": partial(_rolling_extreme, keeps=operator.lt),
+    "rolling_max": partial(_rolling_extreme, keeps=operator.gt),
+}
+
+
 class Array:
 
-    def __init__(self, shape, *values):
-        """Initialize an array of 1- or 2-dimensionality. Elements can only be of type:
+    def __init__(self, shape, *values, dtype=None):
+        """Initialize an array of any (non-zero) dimensionality. Elements can only be of type:
         - int
         - float
         - bool
         Make sure the values and shape are of the correct type.
         Make sure that you check that your array actually is an array, which means it is homogeneous (one data type).
 
+        The values are stored in a flat, typed buffer together with the shape
+        and the row-major strides. The nested list representation is only
+        built when `values` is accessed.
+
+        The dtype of the buffer is int64, float64 or bool after the type of
+        the values, unless a dtype is given: bool, int8, int16, int32, int64,
+        float32 or float64. The values may then be of any type of the same or
+        a lower kind (bool < int < float), e.g. ints and floats for float32.
+
+        Slicing, `reshape` and `transpose` return views: arrays with their own
+        shape, strides and offset that share the buffer of this array.
+
         Args:
-            shape (tuple): shape of the array as a tuple. A 1D array with n elements will have shape = (n,).
+            shape (tuple): shape of the array as a tuple. A 1D array with n elements will have shape = (n,),
+                a 2D array with n rows and m columns shape = (n, m), and so on.
             *values: The values in the array. These should all be the same data type. Either int, float or boolean.
+            dtype (str): the dtype to store the values as, keyword only.
 
         Raises:
-            TypeError: If "shape" or "values" are of the wrong type.
-            ValueError: If the values are not all of the same type.
+            TypeError: If "shape", "values" or dtype are of the wrong type.
+            ValueError: If the values are not all of the same type and no dtype is given.
             ValueError: If the number of values does not fit with the shape.
+            ValueError: If the shape has negative values.
+            OverflowError: If an int value does not fit in the dtype.
         """  
         # Check if the values are of valid types
-        # - get disticnt types of values into a list = value_types
+        # - get distinct types of values into a set = value_types
+        # - if any of value_types is not one of int, float or bool => TypeError
         # - if len(value_types) != 1 => values are not of one type => ValueError
-        # - if value_types[0] not one of int, float or bool => TypeError
 
-        value_types = list(set([type(v) for v in [*values]]))
-        if value_types[0] not in (int, float, bool):
+        value_types = set(map(type, values))
+        if dtype is not None:
+            _check_dtype(dtype)
+            _check_value_types(value_types, dtype)
+        elif not value_types <= _DTYPES.keys():
             raise TypeError("Values must be of one type: int, float or bool.")
         elif len(value_types) != 1:
             raise ValueError("Array values must be of one type.")
-        
-        is_bool_array = value_types[0] == bool
-        
-        if not isinstance(shape, tuple):
-                raise TypeError("Argument shape must be of type tuple.")
-
-        shape_types = list(set([type(v) for v in shape]))
-        if not shape_types[0] == int:
-            raise TypeError("shape value(s) must be of one type: int.")
-        elif len(shape_types) != 1:
-            raise ValueError("shape value(s) must be of one type: int.")
-
-        is_1D_array = len(shape)==1
-        is_2D_array = len(shape)==2
-
-        if is_1D_array:            
-            # Check that the amount of values corresponds to the shape
-            if not len([*values])==shape[0]:
-                raise ValueError("The number of values does not fit with the shape.")
-            # Set instance attributes
-            array_values = [*values]    
-        elif is_2D_array:        
-            # Check that the amount of values corresponds to the shape
-            if not len([*values])==shape[0]*shape[1]:
-                raise ValueError("The number of values does not fit with the shape.")
-            
-            nrows = shape[0]
-            ncols = shape[1]
-            array_values = [[*values][i*ncols: (i+1)*ncols] for i in range(nrows)]
-        else:
-            raise TypeError("Argument shape must be of type tuple and length 1 or 2.")
-        
+
+        _check_shape(shape)
+
+        # Check that the amount of values corresponds to the shape
+        if len(values) != prod(shape):
+            raise ValueError("The number of values does not fit with the shape.")
+
         # Set instance attributes
         self.shape = shape
-        self.values = array_values
-        self.is_1D_array = is_1D_array # if False it is a 2D array 
-        self.is_bool_array = is_bool_array # if False is in an array of numbers
+        self.dtype = dtype or _DTYPES[value_types.pop()]
+        self.strides = _contiguous_strides(shape)
+        self._offset = 0
+        self._data = _buffer(self.dtype, values)
+
+    @classmethod
+    def _from_buffer(cls, shape, dtype, data, strides=None, offset=0):
+        """Creates an Array around an existing flat buffer without any checks.
+
+        This is the trusted constructor used for results of the operators,
+        whose operands have already been validated, and for views. The buffer
+        is not copied.
+
+        Args:
+            shape (tuple): shape of the new array.
+            dtype (str): dtype name matching the format of `data`.
+            data (memoryview): flat buffer as returned by `_buffer`.
+            strides (tuple): strides in elements, row-major if not given.
+            offset (int): index in `data` of the first element.
+
+        Returns:
+            Array: a new array sharing `data`.
+        """
+        new = cls.__new__(cls)
+        new.shape = shape
+        new.dtype = dtype
+        new.strides = _contiguous_strides(shape) if strides is None else strides
+        new._offset = offset
+        new._data = data
+        return new
+
+    @classmethod
+    def from_iterable(cls, shape, iterable, dtype=None):
+        """Creates an array from any iterable of values, such as a generator.
+
+        Unlike `Array(shape, *values)`, the values are never collected into
+        an argument tuple: they are packed chunk by chunk into a buffer that
+        is allocated up front, in a single pass, so besides the array only
+        one chunk of values is held in memory.
+
+        Args:
+            shape (tuple): shape of the array.
+            iterable (iterable): the elements in row-major order.
+            dtype (str): the dtype of the array, see `Array`. If not given, the
+                type of the first value decides (float64 if there are no values)
+                and all values must have that type.
+
+        Returns:
+            Array: the new array.
+
+        Raises:
+            TypeError: If shape, dtype or a value is of the wrong type.
+            ValueError: If the values are not all of the same type and no dtype is given.
+            ValueError: If the number of values does not fit with the shape.
+            OverflowError: If an int value does not fit in the dtype.
+        """
+        _check_shape(shape)
+        size = prod(shape)
+        values = iter(iterable)
+        first = next(values, _END)
+        if first is not _END:
+            values = chain((first,), values)
+        inferred = dtype is None
+        if inferred:
+            dtype = "float64" if first is _END else _DTYPES.get(type(first))
+            if dtype is None:
+                raise TypeError("Values must be of one type: int, float or bool.")
+        _check_dtype(dtype)
+
+        data = _zeros(dtype, size)
+        filled = 0
+        for chunk in _chunks(islice(values, size)):
+            value_types = set(map(type, chunk))
+            if inferred and value_types <= _DTYPES.keys() and value_types != {type(first)}:
+                raise ValueError("Array values must be of one type.")
+            _check_value_types(value_types, dtype)
+            data[filled: filled + len(chunk)] = _buffer(dtype, chunk)
+            filled += len(chunk)
+        if filled != size or next(values, _END) is not _END:
+            raise ValueError("The number of values does not fit with the shape.")
+        return cls._from_buffer(shape, dtype, data)
+
+    @classmethod
+    def from_buffer(cls, shape, buffer, dtype=None):
+        """Creates an array over an object supporting the buffer protocol,
+        such as bytes, bytearray, array.array, memoryview or mmap.
+
+        The buffer is not copied: the array shares it, and is read-only if
+        the buffer is (bytes, for example).
+
+        Args:
+            shape (tuple): shape of the array.
+            buffer: contiguous buffer holding the elements in row-major order,
+                in native byte order.
+            dtype (str): the dtype of the elements, see `Array`. If not given,
+                it is taken from the format of the buffer (e.g. "q" for int64).
+
+        Returns:
+            Array: an array sharing the buffer.
+
+        Raises:
+            TypeError: If buffer is not a buffer or dtype is missing or unsupported.
+            ValueError: If the buffer is not contiguous or its size does not fit with the shape.
+        """
+        _check_shape(shape)
+        view = memoryview(buffer)
+        if dtype is None:
+            dtype = {code: name for name, code in _TYPECODES.items()}.get(view.format)
+            if dtype is None:
+                raise TypeError(f"Cannot tell the dtype of a buffer of format {view.format!r}, pass dtype.")
+        _check_dtype(dtype)
+        if not view.c_contiguous:
+            raise ValueError("The buffer must be contiguous.")
+        if view.nbytes != prod(shape)*_buffer(dtype, ()).itemsize:
+            raise ValueError(f"A buffer of {view.nbytes} bytes does not fit with shape {shape} and dtype {dtype}.")
+        return cls._from_buffer(shape, dtype, view.cast("B").cast(_TYPECODES[dtype]))
+
+    @classmethod
+    def zeros(cls, shape, dtype="float64"):
+        """Returns a new array of the given shape filled with zeros (False for bool)."""
+        _check_shape(shape)
+        _check_dtype(dtype)
+        return cls._from_buffer(shape, dtype, _zeros(dtype, prod(shape)))
+
+    @classmethod
+    def ones(cls, shape, dtype="float64"):
+        """Returns a new array of the given shape filled with ones (True for bool)."""
+        _check_shape(shape)
+        _check_dtype(dtype)
+        return cls._from_buffer(shape, dtype, _full(dtype, 1, prod(shape)))
+
+    @classmethod
+    def full(cls, shape, fill_value, dtype=None):
+        """Returns a new array of the given shape filled with fill_value.
+
+        Args:
+            shape (tuple): shape of the array.
+            fill_value (int, float or bool): the value of every element.
+            dtype (str): dtype of the array, the dtype of fill_value if not given.
+
+        Raises:
+            TypeError: If fill_value is of the wrong type or cannot be stored as dtype.
+            OverflowError: If fill_value does not fit in the dtype.
+        """
+        _check_shape(shape)
+        if type(fill_value) not in _DTYPES:
+            raise TypeError("fill_value must be of type int, float or bool.")
+        value_dtype = _DTYPES[type(fill_value)]
+        dtype = value_dtype if dtype is None else dtype
+        _check_dtype(dtype)
+        if not _can_cast(value_dtype, dtype, weak=True):
+            raise TypeError(f"Cannot fill a {dtype} array with a {value_dtype} value.")
+        return cls._from_buffer(shape, dtype, _full(dtype, fill_value, prod(shape)))
+
+    @classmethod
+    def arange(cls, start, stop=None, step=1, dtype=None):
+        """Returns a 1D array of evenly spaced values, like range().
+
+        `arange(n)` gives 0, 1, ..., n - 1 and `arange(start, stop, step)` the
+        values start + i*step that lie before stop. Floats are allowed.
+
+        Args:
+            start (int or float): the first value, or stop if stop is not given.
+            stop (int or float): the end, which is not included.
+            step (int or float): the spacing, not 0.
+            dtype (str): an int or float dtype, float64 if any argument is a
+                float and int64 otherwise if not given.
+
+        Raises:
+            TypeError: If an argument is not an int or float, or they cannot be stored as dtype.
+            ValueError: If step is 0.
+        """
+        if stop is None:
+            start, stop = 0, start
+        argument_dtypes = {_DTYPES.get(type(value)) for value in (start, stop, step)}
+        if not argument_dtypes <= {"int64", "float64"}:
+            raise TypeError("The arguments of arange must be ints or floats.")
+        if step == 0:
+            raise ValueError("The step of arange cannot be 0.")
+        if dtype is None:
+            dtype = _result_dtype(*argument_dtypes)
+        _check_dtype(dtype)
+        if dtype == "bool" or not all(_can_cast(value_dtype, dtype, weak=True) for value_dtype in argument_dtypes):
+            raise TypeError(f"Cannot create a {dtype} range from these arguments.")
+
+        if argument_dtypes == {"int64"}:
+            values = range(start, stop, step)
+        else:
+            count = max(ceil((stop - start)/step), 0)
+            values = map(partial(operator.add, start), map(partial(operator.mul, step), range(count)))
+        data = memoryview(array(_TYPECODES[dtype], values))
+        return cls._from_buffer((len(data),), dtype, data)
+
+    def _view(self, shape, strides, offset):
+        """Returns an Array with the given layout over the buffer of this array."""
+        return Array._from_buffer(shape, self.dtype, self._data, strides, offset)
+
+    def _is_contiguous(self):
+        """bool: True if the elements are a gap-free, row-major slice of the buffer."""
+        return _is_contiguous(self.shape, self.strides)
+
+    def _line_starts(self):
+        """Yields the buffer index of the first element of each line along the last axis, in row-major order."""
+        *outer, _ = self.shape
+        *outer_strides, _ = self.strides
+        for index in product(*map(range, outer)):
+            yield self._offset + sum(map(operator.mul, index, outer_strides))
+
+    def _runs(self):
+        """Yields (start, count, step) covering the elements in row-major order.
+
+        A contiguous array is a single run, otherwise there is one run per
+        line along the last axis.
+        """
+        if self._is_contiguous():
+            yield self._offset, self.size, 1
+            return
+        count, step = self.shape[-1], self.strides[-1]
+        for start in self._line_starts():
+            yield start, count, step
+
+    def _lines(self):
+        """Yields the elements of each line along the last axis without copying them."""
+        count, step = self.shape[-1], self.strides[-1]
+        for start in self._line_starts():
+            yield _run_values(self._data, start, count, step)
+
+    def _flat(self):
+        """Returns the elements in row-major order without copying them.
+
+        Returns:
+            memoryview or iterator: a memoryview slice of the buffer for a
+            contiguous array, otherwise an iterator over the elements.
+        """
+        if self._is_contiguous():
+            return self._data[self._offset: self._offset + self.size]
+        data = self._data
+        return chain.from_iterable(starmap(_run_values, ((data, *run) for run in self._runs())))
+
+    @property
+    def ndim(self):
+        """int: The number of dimensions."""
+        return len(self.shape)
+
+    @property
+    def is_1D_array(self):
+        """bool: True for a 1D array, False for an array with more dimensions."""
+        return len(self.shape) == 1
+
+    @property
+    def is_bool_array(self):
+        """bool: True for an array of booleans, False for an array of numbers."""
+        return self.dtype == "bool"
+
+    @property
+    def size(self):
+        """int: The number of elements in the array."""
+        return prod(self.shape)
+
+    @property
+    def nbytes(self):
+        """int: The number of bytes taken by the elements of the array."""
+        return self.size*self._data.itemsize
+
+    @property
+    def T(self):
+        """Array: The transposed array, see `transpose`."""
+        return self.transpose()
+
+    @property
+    def values(self):
+        """The elements as a (nested) list.
+
+        The list is built from the flat buffer on every access, so prefer
+        indexing or the Array methods over `values` for large arrays.
+
+        Returns:
+            list: A list of values for a 1D array, a list of rows for a 2D array,
+                  a list of lists of rows for a 3D array and so on.
+        """
+        return _nest(self.flatten2d(), self.shape)
+
+    def __len__(self):
+        """Returns the length of the first axis."""
+        return self.shape[0]
+
+    def _locate(self, index):
+        """Returns the shape, strides and offset selected by a basic index.
+
+        Args:
+            index: an int or a slice, or a tuple of those with at most one entry per axis.
+
+        Raises:
+            IndexError: If an index is out of range or there are too many indices.
+            TypeError: If an index is not an int or a slice.
+        """
+        if not isinstance(index, tuple):
+            index = (index,)
+        if len(index) > self.ndim:
+            raise IndexError("Too many indices for the array.")
+
+        offset = self._offset
+        shape = []
+        strides = []
+        for axis, i in enumerate(index):
+            n = self.shape[axis]
+            stride = self.strides[axis]
+            if isinstance(i, slice):
+                start, stop, step = i.indices(n)
+                shape.append(len(range(start, stop, step)))
+                strides.append(stride*step)
+                offset += start*stride
+            elif type(i) is int:
+                if not -n <= i < n:
+                    raise IndexError(f"Index {i} is out of range for axis {axis} with length {n}.")
+                offset += (i % n)*stride
+            else:
+                raise TypeError("Indices must be int or slice, or an int or bool Array.")
+        shape += self.shape[len(index):]
+        strides += self.strides[len(index):]
+        return tuple(shape), tuple(strides), offset
+
+    def __getitem__(self, index):
+        """Makes the Array subscriptable.
+
+        The index is an int or a slice, or a tuple of those with one entry
+        per axis (missing trailing axes are taken whole). Slices never copy:
+        they return a view that shares the buffer of this array.
+
+        The index can also be a boolean Array (a mask), which selects the
+        elements where it is True if it has the shape of this array, or the
+        rows where it is True if it is 1D with one entry per row. Finally it
+        can be an int Array or a list of ints, which selects rows by their
+        index. These return a new array.
+
+        Returns:
+            The return value. Element of the Array at the given index if every
+            axis is indexed by an int, otherwise an Array.
+
+        Raises:
+            IndexError: If an index is out of range, there are too many indices
+                        or a mask does not match the shape of this array.
+            TypeError: If an index is not an int or a slice, or an int or bool Array.
+        """
+        if isinstance(index, list):
+            index = Array.from_iterable((len(index),), index, None if index else "int64")
+        if isinstance(index, Array):
+            if index.is_bool_array:
+                return self._masked(index)
+            return self.take(index)
+
+        shape, strides, offset = self._locate(index)
+        if not shape:
+            return self._data[offset]
+        return self._view(shape, strides, offset)
+
+    def __setitem__(self, index, value):
+        """Assigns a number or an Array to the selected elements.
+
+        Args:
+            index: a basic index as for `__getitem__`, or a boolean mask of the
+                   shape of this array.
+            value (Array, float, int, bool): a number, or an Array that is broadcast to the
+                   selected shape (to one value per True element for a mask).
+
+        Raises:
+            IndexError: If the index is invalid, see `__getitem__`.
+            TypeError: If the value cannot be stored in this array (e.g. a float in an int array).
+            ValueError: If an Array value cannot be broadcast to the selection,
+                        or the array is read-only.
+        """
+        self._check_writable()
+        masked = isinstance(index, Array) and index.is_bool_array
+        if masked:
+            if index.shape != self.shape:
+                raise IndexError(f"Boolean mask of shape {index.shape} does not match the array of shape {self.shape}.")
+            selected = (index.count_nonzero(),)
+        else:
+            target = self._view(*self._locate(index))
+            selected = target.shape
+
+        if isinstance(value, Array):
+            dtype = value.dtype
+            values = value.broadcast_to(selected)._operand_for(self)._flat()
+        elif type(value) in _DTYPES:
+            dtype = _DTYPES[type(value)]
+            values = repeat(value)
+        else:
+            raise TypeError("Value must be an Array or of type int, float or bool.")
+        if not _can_cast(dtype, self.dtype, weak=not isinstance(value, Array)):
+            raise TypeError(f"Cannot store {dtype} values in an array of dtype {self.dtype}.")
+
+        if masked:
+            data = self._data
+            values = iter(values)
+            for position in compress(self._positions(), index._flat()):
+                data[position] = next(values)
+        else:
+            target._assign(values)
+
+    def _positions(self):
+        """Yields the buffer index of every element, in row-major order."""
+        for start, count, step in self._runs():
+            yield from range(start, start + count*step, step) if step else repeat(start, count)
+
+    def _masked(self, mask):
+        """Returns the elements (or rows, for a 1D mask) where mask is True as a new array."""
+        if mask.shape == self.shape:
+            values = _buffer(self.dtype, compress(self._flat(), mask._flat()))
+            return Array._from_buffer((len(values),), self.dtype, values)
+        if mask.ndim == 1 and self.ndim > 1 and mask.shape[0] == self.shape[0]:
+            rows = [i for i, selected in enumerate(mask._flat()) if selected]
+            return self.take(Array._from_buffer((len(rows),), "int64", _buffer("int64", rows)))
+        raise IndexError(f"Boolean mask of shape {mask.shape} does not match the array of shape {self.shape}.")
+
+    def take(self, indices):
+        """Selects rows (elements of a 1D array) by their index along the first axis.
+
+        Args:
+            indices (Array): int Array of indices, negative indices count from the end.
+
+        Returns:
+            Array: a new array of shape indices.shape + self.shape[1:].
+
+        Raises:
+            IndexError: If the indices are not ints or are out of range.
+        """
+        if _KINDS[indices.dtype] != "i":
+            raise IndexError("Arrays used as indices must be of integer or boolean type.")
+        n = self.shape[0]
+        stride = self.strides[0]
+        starts = []
+        for i in indices._flat():
+            if not -n <= i < n:
+                raise IndexError(f"Index {i} is out of range for axis 0 with length {n}.")
+            starts.append(self._offset + (i % n)*stride)
+        if self.ndim == 1:
+            values = map(self._data.__getitem__, starts)
+        else:
+            rows = (self._view(self.shape[1:], self.strides[1:], start)._flat() for start in starts)
+            values = chain.from_iterable(rows)
+        return Array._from_buffer(indices.shape + self.shape[1:], self.dtype, _buffer(self.dtype, values))
+
+    @staticmethod
+    def where(mask, x, y):
+        """Chooses element-wise from x where mask is True and from y elsewhere.
+
+        Args:
+            mask (Array): boolean array.
+            x, y (Array, float, int, bool): values to choose from. mask, x and y are
+                broadcast together.
+
+        Returns:
+            Array: a new array of the broadcast shape.
+
+        Raises:
+            TypeError: If mask is not a boolean Array, x or y are of an unsupported type,
+                       or only one of x and y is boolean.
+            ValueError: If the shapes cannot be broadcast together.
+        """
+        if not isinstance(mask, Array) or not mask.is_bool_array:
+            raise TypeError("mask must be a boolean Array.")
+        dtypes, scalars = [], []
+        for value in (x, y):
+            if isinstance(value, Array):
+                dtypes.append(value.dtype)
+            elif type(value) in _DTYPES:
+                scalars.append(value)
+            else:
+                raise TypeError("x and y must be Arrays or of type int, float or bool.")
+        kinds = [_KINDS[dtype] for dtype in dtypes] + [_KINDS[_DTYPES[type(value)]] for value in scalars]
+        if kinds.count("b") == 1:
+            raise TypeError("x and y must both be boolean or both be numbers.")
+        dtype = _result_dtype(*dtypes, scalars=scalars)
+
+        shape = _broadcast_shapes(*(value.shape for value in (mask, x, y) if isinstance(value, Array)))
+        mask, x, y = (value.broadcast_to(shape) if isinstance(value, Array) else value for value in (mask, x, y))
+        return _backend.where(mask, x, y, dtype)
+
+    def __str__(self):
+        """Returns a nicely printable string representation of the array.
+
+        Arrays with more than _PRINT_THRESHOLD elements are summarised: only
+        the first and last _PRINT_EDGE_ITEMS rows and elements of every axis
+        are shown, with "..." in between, so printing or logging a large
+        array stays cheap. Use `to_text` to write all elements.
+
+        Returns:
+            str: A string representation of the array.
+
+        """
+        edge_items = _PRINT_EDGE_ITEMS if self.size > _PRINT_THRESHOLD else None
+        return "".join(self._text_blocks(_CHUNK_SIZE, edge_items))
+
+    def __repr__(self):
+        """Returns the shape, dtype and (summarised) elements, see `__str__`."""
+        return f"Array(shape={self.shape}, dtype={self.dtype}, values={self})"
+
+    def _text_blocks(self, chunk_rows, edge_items=None):
+        """Yields the text of the array in pieces of at most chunk_rows rows
+        (elements of a 1D array). With edge_items, the text is summarised, see
+        `__str__` and _format_nested."""
+        n = self.shape[0]
+        if edge_items is None or n <= 2*edge_items:
+            parts = [range(n)]
+        else:
+            parts = [range(edge_items), None, range(n - edge_items, n)]
+        separator = "," if self.is_1D_array else ",\n"
+
+        yield "["
+        first = True
+        for rows in parts:
+            if rows is None:
+                yield separator + "..."
+                continue
+            for start in range(rows.start, rows.stop, chunk_rows):
+                stop = min(start + chunk_rows, rows.stop)
+                if self.is_1D_array:
+                    text = ",".join(map(str, self[start:stop]._flat()))
+                else:
+                    text = separator.join(_format_nested(self[i], edge_items) for i in range(start, stop))
+                yield text if first else separator + text
+                first = False
+        yield "]"
+
+    def to_text(self, file, chunk_rows=1000):
+        """Writes all elements as text, in the format of `__str__` but never summarised.
+
+        The text is formatted and written a block of rows at a time, so
+        it needs little memory however large the array is.
+
+        Args:
+            file (file object, str or pathlib.Path): a text file opened for
+                writing, or the path of the file to write.
+            chunk_rows (int): the number of rows (elements of a 1D array) per block.
+        """
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "w") as f:
+                self.to_text(f, chunk_rows)
+            return
+        for block in self._text_blocks(chunk_rows):
+            file.write(block)
+
+    def flatten2d(self):
+        """Flattens values of a 2D (or N-dimensional) array into a new list.
+        In case of 1D array returns a list of its values.
+
+        Use `ravel` to flatten without copying.
+
+        Returns:
+            list: 1-dimensional list
+        """
+        flat = self._flat()
+        return flat.tolist() if isinstance(flat, memoryview) else list(flat)
+
+    def ravel(self):
+        """Returns the elements as a 1D array.
+
+        Returns:
+            Array: a view if the array is contiguous, otherwise a copy.
+        """
+        return self.reshape(self.size)
+
+    def _assign(self, values):
+        """Writes values into the elements of this array, in row-major order.
+
+        The values are packed chunk by chunk (at most _CHUNK_SIZE at a time),
+        so an iterator is consumed without building a full-size temporary.
+
+        Args:
+            values (iterable): at least `size` values of a dtype that can be
+                               stored in this array.
+        """
+        values = iter(values)
+        data = self._data
+        for start, count, step in self._runs():
+            for first in range(0, count, _CHUNK_SIZE):
+                n = min(_CHUNK_SIZE, count - first)
+                data[_run_slice(start + first*step, n, step)] = _buffer(self.dtype, islice(values, n))
+
+    def _check_out(self, out, shape, dtype):
+        """Validates an `out` array for a result of the given shape and dtype.
+
+        Raises:
+            TypeError: If `out` is not an Array or cannot hold values of dtype.
+            ValueError: If `out` has the wrong shape or repeats elements (a broadcast view).
+        """
+        if not isinstance(out, Array):
+            raise TypeError("out must be an Array.")
+        out._check_writable()
+        if out.shape != shape:
+            raise ValueError(f"out has shape {out.shape}, but the result has shape {shape}.")
+        if not _can_cast(dtype, out.dtype):
+            raise TypeError(f"Cannot store a {dtype} result in an out array of dtype {out.dtype}.")
+        if any(stride == 0 and n > 1 for n, stride in zip(out.shape, out.strides)):
+            raise ValueError("out must not be a broadcast view.")
+
+    def _check_writable(self):
+        """Raises ValueError if the buffer is read-only, e.g. a memory-mapped file."""
+        if self._data.readonly:
+            raise ValueError("The Array is read-only.")
+
+    def _operand_for(self, out):
+        """Returns this array, or a copy of it if writing into `out` while
+        reading this array would overwrite elements before they are read."""
+        if self._data is out._data and (self.shape, self.strides, self._offset) != (out.shape, out.strides, out._offset):
+            return self.copy()
+        return self
+
+    def broadcast_to(self, shape):
+        """Broadcasts the array to a larger shape without copying.
+
+        Axes of length 1 are repeated by giving them a stride of 0, and new
+        leading axes may be added, following the NumPy broadcasting rules.
+
+        Args:
+            shape (tuple): the shape to broadcast to.
+
+        Returns:
+            Array: a view sharing the buffer of this array. Several of its
+                   elements may refer to the same item in the buffer.
+
+        Raises:
+            ValueError: If the array cannot be broadcast to the shape.
+        """
+        if shape == self.shape:
+            return self
+        extra = len(shape) - self.ndim
+        if extra < 0 or any(n not in (1, m) for n, m in zip(self.shape, shape[extra:])):
+            raise ValueError(f"Array of shape {self.shape} cannot be broadcast to {shape}.")
+        strides = (0,)*extra + tuple(stride if n == m else 0
+                                     for n, m, stride in zip(self.shape, shape[extra:], self.strides))
+        return self._view(shape, strides, self._offset)
+
+    def copy(self):
+        """Returns a contiguous copy of the array with its own buffer.
+
+        The elements are copied as raw bytes, not one by one: in a single
+        block for a contiguous array, otherwise by the backend.
+        """
+        if self._is_contiguous():
+            raw = self._data[self._offset: self._offset + self.size].cast("B")
+            return Array._from_buffer(self.shape, self.dtype, _from_bytes(self.dtype, raw))
+        return _backend.copy(self)
+
+    def astype(self, dtype):
+        """Returns a contiguous copy of the array converted to dtype.
+
+        Floats are converted to ints by truncating towards zero, and numbers
+        to bool by comparing with zero. Values that do not fit in the new
+        dtype raise an OverflowError, unlike in NumPy.
+
+        Args:
+            dtype (str): the new dtype, see `Array`.
+
+        Returns:
+            Array: the converted array.
+
+        Raises:
+            TypeError: If dtype is not supported.
+            ValueError: If a NaN is converted to an int.
+            OverflowError: If a value does not fit in dtype.
+        """
+        _check_dtype(dtype)
+        return _backend.astype(self, dtype)
+
+    def reshape(self, *shape):
+        """Gives the array a new shape without changing its elements.
+
+        One of the dimensions may be -1, it is then inferred from the size
+        of the array and the remaining dimensions.
+
+        Args:
+            *shape: the new shape, as a tuple or as separate ints.
+
+        Returns:
+            Array: a view sharing the buffer of this array if it is contiguous,
+                   otherwise (e.g. for a transposed array) a reshaped copy.
+
+        Raises:
+            TypeError: If the shape values are not ints.
+            ValueError: If the new shape does not fit with the size of the array.
+        """
+        if len(shape) == 1 and isinstance(shape[0], tuple):
+            shape = shape[0]
+        if not shape or set(map(type, shape)) != {int}:
+            raise TypeError("shape value(s) must be of one type: int.")
+        if shape.count(-1) == 1:
+            known = -prod(shape)
+            if known == 0 or self.size % known:
+                raise ValueError(f"Cannot reshape array of size {self.size} into shape {shape}.")
+            shape = tuple(self.size//known if n == -1 else n for n in shape)
+        if min(shape) < 0 or prod(shape) != self.size:
+            raise ValueError(f"Cannot reshape array of size {self.size} into shape {shape}.")
+
+        if self._is_contiguous():
+            return self._view(shape, _contiguous_strides(shape), self._offset)
+        return self.copy().reshape(shape)
+
+    def transpose(self, *axes):
+        """Permutes the axes of the array without copying.
+
+        Args:
+            *axes: the new order of the axes, as a tuple or separate ints.
+                   Reverses the axes if not given.
+
+        Returns:
+            Array: a view sharing the buffer of this array.
+
+        Raises:
+            ValueError: If axes is not a permutation of the axes of the array.
+        """
+        if len(axes) == 1 and isinstance(axes[0], tuple):
+            axes = axes[0]
+        if not axes:
+            axes = tuple(reversed(range(self.ndim)))
+        if sorted(axes) != list(range(self.ndim)):
+            raise ValueError(f"{axes} is not a permutation of the axes of the array.")
+        return self._view(tuple(self.shape[i] for i in axes),
+                          tuple(self.strides[i] for i in axes),
+                          self._offset)
+
+    def _arithmetic(self, other, op, out=None):
+        """Applies an arithmetic operator element-wise in a single pass.
+
+        The operands are validated once, then the current backend (see
+        `set_backend`) computes the result into the buffer of a new array or
+        into `out`. Arrays of different shapes are broadcast against each
+        other (see `broadcast_to`) without copying, e.g. shapes (n, m) and
+        (m,) or (n, 1) and (1, m) give shape (n, m).
+
+        Args:
+            other (Array, float, int): the right-hand operand.
+            op (callable): binary function applied to each pair of elements.
+            out (Array): optional array to write the result into.
+
+        Returns:
+            Array: the result as a new array, or `out`.
+
+        Raises:
+            NotImplementedError: if either operand is boolean or `other` is of an unsupported type.
+            ValueError: if the shapes of the arrays cannot be broadcast together.
+            TypeError, ValueError: if `out` cannot hold the result, see `_check_out`.
+        """
+        # check that the method supports the given arguments (check for data type and shape of array)
+        if isinstance(other, LazyArray) or _defers(other):
+            return NotImplemented  # the reflected method of other builds the result
+        if self.is_bool_array:
+            raise NotImplementedError("This method is not implemented for a boolean Array.")
+
+        if isinstance(other, Array):
+            shape = _broadcast_shapes(self.shape, other.shape)
+            if other.is_bool_array:
+                raise NotImplementedError("The method does not support given value types.")
+            dtype = _result_dtype(self.dtype, other.dtype)
+        elif type(other) in (int, float):
+            shape = self.shape
+            dtype = _result_dtype(self.dtype, scalars=(other,))
+        else:
+            raise NotImplementedError("The method does not support given value types.")
+
+        return self._binary(other, op, shape, dtype, out)
+
+    def _binary(self, other, op, shape, dtype, out=None):
+        """Broadcasts the validated operands and hands them to the backend.
+
+        Args:
+            other (Array, float, int): the right-hand operand.
+            op (callable): binary function applied to each pair of elements.
+            shape (tuple): the broadcast shape of the operands.
+            dtype (str): dtype of the result.
+            out (Array): optional array to write the result into.
+
+        Returns:
+            Array: the result as a new array, or `out`.
+        """
+        left = self.broadcast_to(shape)
+        if isinstance(other, Array):
+            other = other.broadcast_to(shape)
+        if out is not None:
+            self._check_out(out, shape, dtype)
+            left = left._operand_for(out)
+            if isinstance(other, Array):
+                other = other._operand_for(out)
+        return _backend.binary(op, left, other, dtype, out)
+
+    def __add__(self, other, out=None):
+        """Element-wise adds Array with another Array or number.
+
+        If the method does not support the operation with the supplied arguments
+        (specific data type or shape), it should return NotImplemented.
+
+        Args:
+            other (Array, float, int): The array or number to add element-wise to this array.
+            out (Array): optional array (of the result shape) to write the sum into.
+
+        Returns:
+            Array: the sum as a new array, or `out`.
+        """
+        return self._arithmetic(other, operator.add, out=out)
+
+    def __radd__(self, other, out=None):
+        """Element-wise adds Array with another Array or number.
+
+        If the method does not support the operation with the supplied arguments
+        (specific data type or shape), it should return NotImplemented.
+
+        Args:
+            other (Array, float, int): The array or number to add element-wise to this array.
+            out (Array): optional array (of the result shape) to write the sum into.
+
+        Returns:
+            Array: the sum as a new array, or `out`.
+        """
+        return self.__add__(other, out=out)
+
+    def __sub__(self, other, out=None):
+        """Element-wise subtracts an Array or number from this Array.
+        If the method does not support the operation with the supplied arguments
+        (specific data type or shape), it should return NotImplemented.
+
+        Args:
+            other (Array, float, int): The array or number to subtract element-wise from this array.
+            out (Array): optional array (of the result shape) to write the difference into.
+
+        Returns:
+            Array: the difference as a new array, or `out`.
+        """
+        return self._arithmetic(other, operator.sub, out=out)
+
+    def __rsub__(self, other, out=None):
+        """Element-wise subtracts this Array from a number or Array.
+
+        If the method does not support the operation with the supplied arguments
+        (specific data type or shape), it should return NotImplemented.
+
+        Args:
+            other (Array, float, int): The array or number being subtracted from.
+            out (Array): optional array (of the result shape) to write the difference into.
+
+        Returns:
+            Array: the difference as a new array, or `out`.
+        """
+        return self._arithmetic(other, _rsub, out=out)
+
+    def __mul__(self, other, out=None):
+        """Element-wise multiplies this Array with a number or array.
+
+        If the method does not support the operation with the supplied arguments
+        (specific data type or shape), it should return NotImplemented.
+
+        Args:
+            other (Array, float, int): The array or number to multiply element-wise to this array.
+            out (Array): optional array (of the result shape) to write the product into.
+
+        Returns:
+            Array: a new array with every element multiplied with `other`, or `out`.
+
+        """
+        return self._arithmetic(other, operator.mul, out=out)
+
+    def __rmul__(self, other, out=None):
+        """Element-wise multiplies this Array with a number or array.
+
+        If the method does not support the operation with the supplied arguments
+        (specific data type or shape), it should return NotImplemented.
+
+        Args:
+            other (Array, float, int): The array or number to multiply element-wise to this array.
+            out (Array): optional array (of the result shape) to write the product into.
+
+        Returns:
+            Array: a new array with every element multiplied with `other`, or `out`.
+        """
+        # Hint: this solution/logic applies for all r-methods
+        return self.__mul__(other, out=out)
+
+    def __iadd__(self, other):
+        """Element-wise adds an Array or number to this Array in place.
+
+        Args:
+            other (Array, LazyArray, float, int): The array, expression or number to add,
+                broadcast to the shape of this array.
+
+        Returns:
+            Array: this array, with the sum written into its buffer.
+
+        Raises:
+            TypeError: if the sum cannot be stored in this array (e.g. a float sum in an int array).
+        """
+        if isinstance(other, LazyArray):
+            return (self.lazy() + other).compute(out=self)
+        return self.__add__(other, out=self)
+
+    def __isub__(self, other):
+        """Element-wise subtracts an Array or number from this Array in place.
+
+        Args:
+            other (Array, LazyArray, float, int): The array, expression or number to subtract,
+                broadcast to the shape of this array.
+
+        Returns:
+            Array: this array, with the difference written into its buffer.
+
+        Raises:
+            TypeError: if the difference cannot be stored in this array.
+        """
+        if isinstance(other, LazyArray):
+            return (self.lazy() - other).compute(out=self)
+        return self.__sub__(other, out=self)
+
+    def __imul__(self, other):
+        """Element-wise multiplies this Array with an Array or number in place.
+
+        Args:
+            other (Array, LazyArray, float, int): The array, expression or number to multiply with,
+                broadcast to the shape of this array.
+
+        Returns:
+            Array: this array, with the product written into its buffer.
+
+        Raises:
+            TypeError: if the product cannot be stored in this array.
+        """
+        if isinstance(other, LazyArray):
+            return (self.lazy() * other).compute(out=self)
+        return self.__mul__(other, out=self)
+
+    def lazy(self):
+        """Starts a lazy expression on this array, see `LazyArray`.
+
+        Returns:
+            LazyArray: an expression that evaluates to this array.
+        """
+        return LazyArray(None, (self,), self.shape, self.dtype)
+
+    def __matmul__(self, other):
+        """Matrix multiplication of this Array with another Array.
+
+        Follows the NumPy rules for 1D operands: a 1D left operand is a row
+        vector, a 1D right operand a column vector, and the added axis is
+        removed from the result.
+
+        Args:
+            other (Array): the array to multiply with, of shape (m, p) or (m,)
+                           for this array of shape (n, m) or (m,).
+
+        Returns:
+            Array: the matrix product, or a number if both arrays are 1D.
+
+        Raises:
+            NotImplementedError: if either array is boolean or `other` is not an Array.
+            ValueError: if an array has more than 2 dimensions or the inner dimensions differ.
+        """
+        if _defers(other):
+            return NotImplemented
+        if self.is_bool_array or not isinstance(other, Array) or other.is_bool_array:
+            raise NotImplementedError("The method does not support given value types.")
+        if self.ndim > 2 or other.ndim > 2:
+            raise ValueError("Matrix multiplication is only implemented for 1D and 2D arrays.")
+
+        left = self if self.ndim == 2 else self.reshape(1, -1)
+        right = other if other.ndim == 2 else other.reshape(-1, 1)
+        if left.shape[1] != right.shape[0]:
+            raise ValueError(f"Shapes {self.shape} and {other.shape} are not aligned for matrix multiplication.")
+
+        result = _backend.matmul(left, right, _result_dtype(self.dtype, other.dtype))
+        shape = self.shape[:-1] + other.shape[1:]
+        if not shape:
+            return result[0, 0]
+        return result.reshape(shape)
+
+    def dot(self, other):
+        """Returns the dot product, which for 1D and 2D arrays is the matrix product, see `__matmul__`."""
+        return self @ other
+
+    def __eq__(self, other):
+        """Compares an Array with another Array.
+
+        If the two array shapes do not match, it should return False.
+        If `other` is an unexpected type, return False.
+
+        Args:
+            other (Array, LazyArray): The array to compare with this array.
+
+        Returns:
+            bool: True if the two arrays are equal (identical). False otherwise.
+        """
+        if _defers(other):
+            return NotImplemented
+        return self.array_equal(other)
+
+    def array_equal(self, other, equal_nan=False):
+        """Checks if other is an array of the same shape with equal elements.
+
+        The pure Python backend compares the elements a chunk (or line) at
+        a time, stopping at the first one with a difference, without
+        building a boolean array.
+
+        Args:
+            other (Array, LazyArray): the array to compare with this array.
+            equal_nan (bool): if True, NaNs in the same position compare equal.
+
+        Returns:
+            bool: True if the shapes and all elements are equal, False otherwise
+                  (also if other is not an array).
+        """
+        if isinstance(other, LazyArray):
+            other = other.compute()
+        if not isinstance(other, Array) or other.shape != self.shape:
+            return False
+        return _backend.array_equal(self, other, equal_nan)
+
+    def __hash__(self):
+        """Returns a hash of the shape and elements, so that arrays can be
+        used in sets and as dict keys.
+
+        The hash is consistent with `__eq__`: equal arrays have equal
+        hashes, also when their dtypes differ (1 == 1.0). It is computed in
+        one pass over the elements every time, as the buffer may be shared
+        with other objects (such as an ndarray from `__array__`) that change
+        it, but do not change the elements of an array while it is in a set
+        or dict. All NaNs hash alike (the hash of a NaN float depends on the
+        object), so arrays that are equal with equal_nan hash alike too.
+        """
+        value = hash(self.shape)
+        for chunk in _chunks(self._flat()):
+            if _KINDS[self.dtype] == "f" and any(map(isnan, chunk)):
+                chunk = [_NAN_KEY if isnan(v) else v for v in chunk]
+            value = hash((value, *chunk))
+        return value
+
+    def allclose(self, other, rtol=1e-05, atol=1e-08, equal_nan=False):
+        """Checks if all elements are close to those of another Array or a number.
+
+        Elements a and b are close if |a - b| <= atol + rtol*|b|, as in NumPy.
+        Infinities are only close to an equal infinity. The arrays are
+        broadcast together (see `broadcast_to`), and the pure Python
+        backend stops at the first element that is not close.
+
+        Args:
+            other (Array, float, int): the values to compare with.
+            rtol (float): relative tolerance.
+            atol (float): absolute tolerance.
+            equal_nan (bool): if True, NaNs in the same position are close.
+
+        Returns:
+            bool: True if all elements are close.
+
+        Raises:
+            NotImplementedError: If either array is boolean or other is of an unsupported type.
+            ValueError: If the shapes cannot be broadcast together.
+        """
+        if self.is_bool_array:
+            raise NotImplementedError("This method is not implemented for a boolean Array.")
+        if isinstance(other, Array):
+            if other.is_bool_array:
+                raise NotImplementedError("The method does not support given value types.")
+            shape = _broadcast_shapes(self.shape, other.shape)
+            other = other.broadcast_to(shape)
+        elif type(other) in (int, float):
+            shape = self.shape
+        else:
+            raise NotImplementedError("The method does not support given value types.")
+        return _backend.allclose(self.broadcast_to(shape), other, rtol, atol, equal_nan)
+
+    def is_equal(self, other):
+        """Compares an Array element-wise with another Array or number.
+
+        If `other` is an Array and the two array shapes do not match, this method should raise ValueError.
+        Shapes that can be broadcast together (see `broadcast_to`) are compared after broadcasting.
+        If `other` is not an Array or a number, it should return TypeError.
+
+        Args:
+            other (Array, float, int): The array or number to compare with this array.
+
+        Returns:
+            Array: An Array of booleans with True where the two arrays match and False where they do not.
+                   Or if `other` is a number, it returns True where the array is equal to the number and False
+                   where it is not.
+
+        Raises:
+            ValueError: if the shapes of self and other cannot be broadcast together.
+        """
+
+        if isinstance(other, LazyArray):
+            other = other.compute()
+        if _defers(other):
+            return other.is_equal(self)  # equality is symmetric, so other builds the result
+        if isinstance(other, Array):
+            shape = _broadcast_shapes(self.shape, other.shape)
+        elif type(other) in (int, float):
+            shape = self.shape
+        else:
+            raise TypeError("This type is not supported.")
+        return self._binary(other, operator.eq, shape, "bool")
+
+    def _check_axis(self, axis):
+        """Returns axis as a non-negative int.
+
+        Raises:
+            ValueError: If axis is not an axis of the array.
+        """
+        if type(axis) is not int or not -self.ndim <= axis < self.ndim:
+            raise ValueError(f"axis {axis} is out of bounds for an array with {self.ndim} dimension(s).")
+        return axis % self.ndim
+
+    def _reduce(self, name, axis=None, dtype=None, **kwargs):
+        """Reduces the array, or each line along an axis, with the named reducer.
+
+        With the pure Python backend the reducer (see _REDUCERS) gets the
+        elements straight from the buffer (a memoryview slice, or an iterator
+        for a non-contiguous array), so nothing is flattened or copied first.
+
+        Args:
+            name (str): name of the reduction, a key of _REDUCERS.
+            axis (int): axis to reduce along, or None to reduce all elements.
+            dtype (str): dtype of the result if axis is given, that of the array if None.
+            **kwargs: extra arguments for the reducer, e.g. ddof.
+
+        Returns:
+            The reduced value if axis is None or the array is 1D, otherwise an
+            Array with the shape of this array without `axis`.
+
+        Raises:
+            NotImplementedError: If the array is a boolean array.
+            ValueError: If the array is empty or axis is out of bounds.
+        """
+        axis = self._check_reduce(axis, logical=name in _LOGICAL_REDUCERS)
+        if self.ndim == 1:
+            axis = None
+        return _backend.reduce(self, name, axis, dtype or self.dtype, **kwargs)
+
+    def _check_reduce(self, axis, logical=False):
+        """Checks that the array can be reduced along axis (None for all elements).
+
+        Logical reductions (count_nonzero, any, all) work for every dtype and
+        for empty arrays.
+
+        Returns:
+            int: axis as a non-negative int, or None.
+        """
+        if self.is_bool_array and not logical:
+            raise NotImplementedError("This method is not implemented for a boolean Array.")
+        if axis is not None:
+            axis = self._check_axis(axis)
+        if self.size == 0 and not logical:
+            raise ValueError("Cannot reduce an empty array.")
+        return axis
+
+    def _axis_lines(self, axis):
+        """Returns the shape left after reducing along axis, and the lines
+        along that axis as views, in row-major order of the remaining axes."""
+        # Move the axis last, so the lines are those of the transposed view
+        axes = tuple(i for i in range(self.ndim) if i != axis) + (axis,)
+        return self.shape[:axis] + self.shape[axis+1:], self.transpose(axes)._lines()
+
+    def _scan(self, name, axis, length, dtype, **kwargs):
+        """Maps each line along an axis to a new line with the named scan.
+
+        Args:
+            name (str): name of the scan, a key of _SCANS.
+            axis (int): axis to scan along, or None to scan the flattened array.
+            length (callable): the length of the result lines, given that of the lines.
+            dtype (str): dtype of the result.
+            **kwargs: extra arguments for the scan, e.g. window.
+
+        Returns:
+            Array: the result, with the shape of the array (1D if axis is
+                   None) except `length` along axis.
+
+        Raises:
+            NotImplementedError: If the array is a boolean array.
+            ValueError: If axis is out of bounds.
+        """
+        if self.is_bool_array:
+            raise NotImplementedError("This method is not implemented for a boolean Array.")
+        array = self
+        if axis is None:
+            array, axis = self.ravel(), 0
+        axis = array._check_axis(axis)
+        shape = array.shape[:axis] + (length(array.shape[axis]),) + array.shape[axis+1:]
+        return _backend.scan(array, name, axis, shape, dtype, **kwargs)
+
+    def cumsum(self, axis=None):
+        """Returns the running sums of the elements, in a single pass.
+
+        Args:
+            axis (int): axis to sum along, or None (default) to sum the flattened array.
+
+        Returns:
+            Array: the running sums, int64 for int arrays.
+        """
+        return self._scan("cumsum", axis, int, _sum_dtype(self.dtype))
+
+    def cumprod(self, axis=None):
+        """Returns the running products of the elements, in a single pass.
+
+        Args:
+            axis (int): axis to multiply along, or None (default) to multiply the flattened array.
+
+        Returns:
+            Array: the running products, int64 for int arrays.
+        """
+        return self._scan("cumprod", axis, int, _sum_dtype(self.dtype))
+
+    def diff(self, n=1, axis=-1):
+        """Returns the n-th differences of consecutive elements along an axis.
+
+        Args:
+            n (int): the number of times to take the differences.
+            axis (int): axis to take the differences along, the last by default.
+
+        Returns:
+            Array: the differences, n shorter along axis (empty if n is at
+                   least the length of the axis).
+
+        Raises:
+            ValueError: If n is negative.
+        """
+        if type(n) is not int or n < 0:
+            raise ValueError(f"n must be a non-negative int, not {n!r}.")
+        return self._scan("diff", axis, lambda length: max(length - n, 0), self.dtype, n=n)
+
+    def rolling(self, window, axis=-1):
+        """Returns the windows of `window` consecutive elements along an axis,
+        to compute a statistic of each with `sum`, `mean`, `min` or `max`.
+
+        Every statistic takes O(n) time, independent of the window size.
+        Only the full windows are used, so the results are window - 1
+        shorter along axis than the array.
+
+        Args:
+            window (int): the number of elements in a window.
+            axis (int): axis to slide the window along, the last by default.
+
+        Returns:
+            Rolling: the windows.
+
+        Raises:
+            ValueError: If window is not between 1 and the length of the axis.
+        """
+        axis = self._check_axis(axis)
+        if type(window) is not int or not 1 <= window <= self.shape[axis]:
+            raise ValueError(f"window must be an int between 1 and {self.shape[axis]}, not {window!r}.")
+        return Rolling(self, window, axis)
+
+    def sum(self, axis=None):
+        """Returns the sum of the elements.
+
+        Args:
+            axis (int): axis to sum along, or None (default) to sum all elements.
+
+        Returns:
+            int or float, or an Array of sums if axis is given.
+        """
+        return self._reduce("sum", axis, _sum_dtype(self.dtype))
+
+    def min(self, axis=None):
+        """Returns the smallest element, keeping the dtype of the array.
+
+        Args:
+            axis (int): axis to search along, or None (default) for all elements.
+
+        Returns:
+            int or float, or an Array of minima if axis is given.
+        """
+        return self._reduce("min", axis)
+
+    def max(self, axis=None):
+        """Returns the largest element, keeping the dtype of the array.
+
+        Args:
+            axis (int): axis to search along, or None (default) for all elements.
+
+        Returns:
+            int or float, or an Array of maxima if axis is given.
+        """
+        return self._reduce("max", axis)
+
+    def argmin(self, axis=None):
+        """Returns the index of the (first) smallest element.
+
+        Args:
+            axis (int): axis to search along, or None (default) for all elements.
+
+        Returns:
+            int: index into the row-major flattened array if axis is None,
+                 or an Array of indices along `axis`.
+        """
+        return self._reduce("argmin", axis, "int64")
+
+    def argmax(self, axis=None):
+        """Returns the index of the (first) largest element.
+
+        Args:
+            axis (int): axis to search along, or None (default) for all elements.
+
+        Returns:
+            int: index into the row-major flattened array if axis is None,
+                 or an Array of indices along `axis`.
+        """
+        return self._reduce("argmax", axis, "int64")
+
+    def count_nonzero(self, axis=None):
+        """Counts the elements that are not zero (or not False).
+
+        Args:
+            axis (int): axis to count along, or None (default) for all elements.
+
+        Returns:
+            int, or an Array of counts if axis is given.
+        """
+        return self._reduce("count_nonzero", axis, "int64")
+
+    def any(self, axis=None):
+        """Checks if any element is not zero (or is True).
+
+        Args:
+            axis (int): axis to check along, or None (default) for all elements.
+
+        Returns:
+            bool, or a boolean Array if axis is given.
+        """
+        return self._reduce("any", axis, "bool")
+
+    def all(self, axis=None):
+        """Checks if all elements are not zero (or are True).
+
+        Args:
+            axis (int): axis to check along, or None (default) for all elements.
+
+        Returns:
+            bool, or a boolean Array if axis is given.
+        """
+        return self._reduce("all", axis, "bool")
+
+    def mean(self, axis=None):
+        """Returns the arithmetic mean of the elements.
+
+        Args:
+            axis (int): axis to average along, or None (default) for all elements.
+
+        Returns:
+            float, or an Array of means if axis is given.
+        """
+        return self._reduce("mean", axis, "float64")
+
+    def var(self, axis=None, ddof=0):
+        """Returns the variance of the elements.
+
+        The elements are read once, in chunks: each chunk is summarised with
+        two passes over it (mean, then squared deviations), and the chunks
+        are combined with the pairwise update of Chan et al., see _Moments.
+        This stays accurate for large offsets, unlike the sum of squares.
+
+        Args:
+            axis (int): axis to compute along, or None (default) for all elements.
+            ddof (int): delta degrees of freedom, the divisor is count - ddof.
+
+        Returns:
+            float, or an Array of variances if axis is given. nan if count <= ddof.
+        """
+        return self._reduce("var", axis, "float64", ddof=ddof)
+
+    def std(self, axis=None, ddof=0):
+        """Returns the standard deviation of the elements, see `var`.
+
+        Args:
+            axis (int): axis to compute along, or None (default) for all elements.
+            ddof (int): delta degrees of freedom, the divisor is count - ddof.
+
+        Returns:
+            float, or an Array of standard deviations if axis is given.
+        """
+        return self._reduce("std", axis, "float64", ddof=ddof)
+
+    def describe(self, axis=None, ddof=0):
+        """Computes count, mean, std, var, min and max together.
+
+        The pure Python backend collects them in a single pass over the
+        elements (see _Moments), the numpy backend with NumPy reductions.
+
+        Args:
+            axis (int): axis to compute along, or None (default) for all elements.
+            ddof (int): delta degrees of freedom for std and var.
+
+        Returns:
+            dict: the statistics by name. With an axis, every statistic except
+                  count is an Array of the values along that axis.
+        """
+        axis = self._check_reduce(axis)
+        if self.ndim == 1:
+            axis = None
+        return _backend.describe(self, axis, ddof)
+
+    def __reduce__(self):
+        """Pickles the elements as raw bytes, packed contiguously."""
+        flat = self._flat()
+        raw = flat.tobytes() if isinstance(flat, memoryview) else _buffer(self.dtype, flat).tobytes()
+        return _unpickle, (self.shape, self.dtype, raw)
+
+    @staticmethod
+    def set_backend(name):
+        """Selects the backend that computes the operators and reductions.
+
+        "python" uses pure Python kernels over the flat buffers. "numpy" is
+        available when NumPy is installed, and is then the default: it wraps
+        the buffers in ndarrays without copying and uses ufuncs. Both give
+        the same results and raise the same errors:
+
+        - NaNs propagate through min, max and the rolling extremes, and
+          argmin and argmax give the position of the first NaN, as in NumPy.
+        - float32 is summed in float64, also in mean, var and the running sums.
+        - An int result that does not fit in its dtype (e.g. int8 100 + 100)
+          raises an OverflowError with both. The numpy backend bounds int results
+          from the smallest and largest elements of the operands, and when
+          that cannot rule out an overflow it recomputes them exactly (in
+          int64 for narrower ints, with the python backend for int64).
+
+        Args:
+            name (str): "python" or "numpy".
+
+        Raises:
+            ValueError: If the backend is unknown or not available.
+        """
+        global _backend
+        if name not in _BACKENDS:
+            raise ValueError(f"Unknown or unavailable backend {name!r}, choose from {sorted(_BACKENDS)}.")
+        if isinstance(_backend, _ParallelBackend):
+            _backend.close()
+            _backend = _ParallelBackend(_BACKENDS[name], _backend.num_threads, _backend.executor_argument)
+        else:
+            _backend = _BACKENDS[name]
+
+    @staticmethod
+    def get_backend():
+        """Returns the name of the current backend, see `set_backend`."""
+        return _backend.name
+
+    @staticmethod
+    def set_num_threads(n, executor=None):
+        """Runs element-wise operations and reductions in parallel.
+
+        Arrays with at least _PARALLEL_MIN_SIZE elements are split along their
+        longest axis into n parts, which are computed in parallel and then
+        combined (partial sums added, partial moments merged and so on).
+        This applies to the arithmetic operators, `is_equal` and the
+        reductions over all elements (`sum`, `min`, `max`, `mean`, `var`,
+        `std`, `count_nonzero`, `any`, `all` and hence `min_element` and
+        `mean_element`). Other operations run as before.
+
+        The numpy backend releases the GIL, so it runs in a thread pool and
+        writes straight into the result. The pure Python backend runs in a
+        process pool, which costs a copy of every part to and from the
+        workers, so it pays off mostly for the reductions. Its workers are
+        started with the spawn method, which imports the __main__ module in
+        every worker, so a script using it needs an
+        `if __name__ == "__main__":` guard.
+
+        Args:
+            n (int): the number of parts, 1 to turn parallel execution off.
+            executor (concurrent.futures.Executor): optional pool to run the
+                parts in, instead of a pool of n workers created on first use.
+
+        Raises:
+            ValueError: If n is smaller than 1.
+        """
+        global _backend
+        if type(n) is not int or n < 1:
+            raise ValueError("The number of threads must be a positive int.")
+        inner = _backend
+        if isinstance(_backend, _ParallelBackend):
+            _backend.close()
+            inner = _backend.inner
+        if n == 1 and executor is None:
+            _backend = inner
+        else:
+            _backend = _ParallelBackend(inner, n, executor)
+
+    @staticmethod
+    def get_num_threads():
+        """Returns the number of parts operations are split into, see `set_num_threads`."""
+        return _backend.num_threads if isinstance(_backend, _ParallelBackend) else 1
+
+    def __array__(self, dtype=None, copy=None):
+        """Returns the array as a NumPy ndarray sharing the same buffer.
+
+        Views (including transposed and broadcast arrays) keep their strides,
+        so no elements are copied unless a different dtype or copy=True is
+        requested.
+        """
+        base = np.frombuffer(self._data, dtype=self.dtype)
+        itemsize = base.itemsize
+        result = np.lib.stride_tricks.as_strided(base[self._offset:], shape=self.shape,
+                                                 strides=tuple(s*itemsize for s in self.strides))
+        if dtype is not None and np.dtype(dtype) != result.dtype:
+            return result.astype(dtype)
+        return result.copy() if copy else result
+
+    @classmethod
+    def from_numpy(cls, ndarray):
+        """Creates an Array from a NumPy ndarray, sharing its buffer.
+
+        Args:
+            ndarray (numpy.ndarray): array with a supported dtype and at least one dimension.
+
+        Returns:
+            Array: a view of the ndarray data if it is C- or Fortran-contiguous,
+                   otherwise an Array over a contiguous copy.
+
+        Raises:
+            TypeError: If ndarray is not an ndarray or has an unsupported dtype.
+            ValueError: If ndarray has no dimensions.
+        """
+        if np is None or not isinstance(ndarray, np.ndarray):
+            raise TypeError("from_numpy expects a numpy.ndarray.")
+        dtype = ndarray.dtype.name
+        if dtype not in _TYPECODES:
+            raise TypeError(f"Unsupported dtype {dtype}, must be one of {', '.join(_TYPECODES)}.")
+        if ndarray.ndim == 0:
+            raise ValueError("Cannot create an Array without dimensions.")
+        if not ndarray.dtype.isnative:
+            ndarray = ndarray.astype(ndarray.dtype.newbyteorder("="))
+        if not ndarray.flags.c_contiguous and ndarray.flags.f_contiguous:
+            return cls._from_ndarray(ndarray.T).T
+        return cls._from_ndarray(np.ascontiguousarray(ndarray))
+
+    @classmethod
+    def _from_ndarray(cls, ndarray):
+        """Wraps a C-contiguous ndarray of a supported dtype without copying."""
+        flat = memoryview(ndarray.reshape(-1)).cast("B").cast(_TYPECODES[ndarray.dtype.name])
+        return cls._from_buffer(ndarray.shape, ndarray.dtype.name, flat)
+
+    def save(self, path):
+        """Writes the array to a binary file that `load` can read back.
+
+        The file has a small header with the dtype, byte order and shape,
+        followed by the raw elements in row-major order, starting at a
+        multiple of 64 bytes so the data can be memory-mapped efficiently.
+
+        Args:
+            path (str or pathlib.Path): the file to write.
+        """
+        header = f"dtype={self.dtype} order={sys.byteorder} shape={','.join(map(str, self.shape))}".encode("ascii")
+        prefix = len(_FILE_MAGIC) + 3
+        padding = -(prefix + len(header) + 1) % _FILE_ALIGNMENT
+        header += b" "*padding + b"\n"
 
+        with open(path, "wb") as f:
+            f.write(_FILE_MAGIC + bytes([_FILE_VERSION]) + len(header).to_bytes(2, "little"))
+            f.write(header)
+            flat = self._flat()
+            if isinstance(flat, memoryview):
+                f.write(flat)
+            else:
+                for chunk in _chunks(flat):
+                    f.write(_buffer(self.dtype, chunk))
 
-    def __getitem__(self, index):
-        """Makes the Array subscriptable.
+    @classmethod
+    def load(cls, path, mmap=True):
+        """Reads an array written by `save`.
+
+        Args:
+            path (str or pathlib.Path): the file to read.
+            mmap (bool): if True (default), the elements are memory-mapped
+                from the file instead of read into memory, so pages are only
+                loaded when used and are shared with other processes mapping
+                the same file. The array is then read-only.
 
         Returns:
-            The return value. Element of the Array at the given index.
+            Array: the loaded array.
 
+        Raises:
+            ValueError: If the file is not an Array file, is truncated or has a malformed header.
         """
-        return self.values[index]
-    
-    def __str__(self):
-        """Returns a nicely printable string representation of the array.
+        with open(path, "rb") as f:
+            prefix = f.read(len(_FILE_MAGIC) + 3)
+            if len(prefix) < len(_FILE_MAGIC) + 3 or prefix[:len(_FILE_MAGIC)] != _FILE_MAGIC \
+                    or prefix[len(_FILE_MAGIC)] != _FILE_VERSION:
+                raise ValueError(f"{path} is not an Array file.")
+            header_length = int.from_bytes(prefix[-2:], "little")
+            header = f.read(header_length)
+            if len(header) < header_length:
+                raise ValueError(f"{path} is truncated.")
+            try:
+                fields = dict(field.split("=") for field in header.decode("ascii").split())
+                dtype = fields["dtype"]
+                shape = tuple(int(n) for n in fields["shape"].split(","))
+                _check_dtype(dtype)
+                _check_shape(shape)
+                if fields["order"] not in ("little", "big"):
+                    raise ValueError(f"Unknown byte order {fields['order']!r}.")
+            except (KeyError, TypeError, ValueError) as error:
+                raise ValueError(f"{path} has a malformed header: {error}") from error
+            start = len(prefix) + header_length
+            nbytes = prod(shape)*_buffer(dtype, ()).itemsize
+            swap = fields["order"] != sys.byteorder and dtype != "bool"
 
-        Returns:
-            str: A string representation of the array.
+            if mmap and not swap:
+                raw = memoryview(mmap_module.mmap(f.fileno(), 0, access=mmap_module.ACCESS_READ))
+            else:
+                raw = bytearray(nbytes)
+                raw = memoryview(raw)[:f.readinto(raw)]
+                start = 0
+        if len(raw) < start + nbytes:
+            raise ValueError(f"{path} is truncated.")
+
+        data = raw[start: start + nbytes].cast(_TYPECODES[dtype])
+        if swap:
+            swapped = array(_TYPECODES[dtype])
+            swapped.frombytes(data)
+            swapped.byteswap()
+            data = memoryview(swapped)
+        return cls._from_buffer(shape, dtype, data)
+
+    def min_element(self):
+        """Returns the smallest value of the array.
+
+        Only needs to work for type int and float (not boolean).
 
+        Returns:
+            float: The value of the smallest element in the array.
         """
-        if self.is_1D_array:
-            return '['+','.join([str(v) for v in self.values])+']'
+
+        if self.is_bool_array:
+            raise NotImplementedError("This method is not implemented for a boolean Array.")        
         else:
-            return '['+',\n'.join([str(v) for v in self.values])+']'
+            return float(self.min())
 
-    def flatten2d(self):
-        """Flattens values of a 2D array. 
-        In case of 1D array returns its values without any change.
+    def mean_element(self):
+        """Returns the mean value of an array
+
+        Only needs to work for type int and float (not boolean).
 
         Returns:
-            list: 1-dimensional list
+            float: the mean value
         """
-        if self.is_1D_array:
-            return self.values
-        
-        flat_values = []
-        for sublist in self.values:
-            flat_values += sublist
-        return flat_values
 
-    def __add__(self, other):
-        """Element-wise adds Array with another Array or number.
+        if self.is_bool_array:
+            raise NotImplementedError("This method is not implemented for a boolean Array.")        
+        else:
+            return self.mean()
 
-        If the method does not support the operation with the supplied arguments
-        (specific data type or shape), it should return NotImplemented.
+
+def _shares_buffer(expression, array):
+    """Checks if any leaf of a LazyArray uses the buffer of array."""
+    if expression._op is None:
+        return expression._operands[0]._data is array._data
+    return any(_shares_buffer(operand, array) for operand in expression._operands
+               if isinstance(operand, LazyArray))
+
+
+class LazyArray:
+    """An arithmetic expression on Arrays that is evaluated on demand.
+
+    The operators +, - and * with Arrays, LazyArrays or numbers build an
+    expression tree instead of computing a new Array for every operation, e.g.
+
+        expression = a.lazy()*2 + b - c
+
+    The tree is evaluated in a single fused pass when `compute()`, indexing,
+    `==` or `str()` is called. The pure Python backend streams every element
+    through the whole expression, so no intermediate arrays are created; the
+    numpy backend reuses one temporary for all intermediate results. The
+    result is cached, so changes to the operands after the first evaluation
+    are not seen.
+
+    The operands are validated when the tree is built, with the same errors as
+    the Array operators.
+
+    Attributes:
+        shape (tuple): shape of the result.
+        dtype (str): dtype of the result.
+    """
+
+    def __init__(self, op, operands, shape, dtype):
+        """Creates a node of the tree. Use `Array.lazy` to start an expression.
 
         Args:
-            other (Array, float, int): The array or number to add element-wise to this array.
+            op (callable): binary function of the node, None for a leaf.
+            operands (tuple): the Array of a leaf, or the two operands (LazyArray or number) of op.
+            shape (tuple): shape of the result.
+            dtype (str): dtype of the result.
+        """
+        self._op = op
+        self._operands = operands
+        self.shape = shape
+        self.dtype = dtype
+        self._result = None
 
-        Returns:
-            Array: the sum as a new array.
+    def _combine(self, other, op):
+        """Returns the node applying op to this expression and other.
+
+        Raises:
+            NotImplementedError: if either operand is boolean or `other` is of an unsupported type.
+            ValueError: if the shapes cannot be broadcast together.
         """
-        # check that the method supports the given arguments (check for data type and shape of array)
-        # if the array is a boolean you should return NotImplemented
-        
-        if self.is_bool_array:
+        if self.dtype == "bool":
             raise NotImplementedError("This method is not implemented for a boolean Array.")
-            # return NotImplemented
-
         if isinstance(other, Array):
-            if not other.shape == self.shape:
-                raise ValueError("Arrays have different shapes.")
-            elif other.is_bool_array:
+            other = other.lazy()
+        if isinstance(other, LazyArray):
+            shape = _broadcast_shapes(self.shape, other.shape)
+            if other.dtype == "bool":
                 raise NotImplementedError("The method does not support given value types.")
-                # return NotImplemented
-            return Array(self.shape, *[v+w for v,w in zip(self.flatten2d(), other.flatten2d())])
+            dtype = _result_dtype(self.dtype, other.dtype)
         elif type(other) in (int, float):
-            return Array(self.shape, *[v+other for v in self.flatten2d()])
+            shape = self.shape
+            dtype = _result_dtype(self.dtype, scalars=(other,))
         else:
             raise NotImplementedError("The method does not support given value types.")
-            # return NotImplemented
+        return LazyArray(op, (self, other), shape, dtype)
+
+    def __add__(self, other):
+        """Returns the expression self + other."""
+        return self._combine(other, operator.add)
 
     def __radd__(self, other):
-        """Element-wise adds Array with another Array or number.
+        """Returns the expression other + self."""
+        return self._combine(other, operator.add)
 
-        If the method does not support the operation with the supplied arguments
-        (specific data type or shape), it should return NotImplemented.
+    def __sub__(self, other):
+        """Returns the expression self - other."""
+        return self._combine(other, operator.sub)
+
+    def __rsub__(self, other):
+        """Returns the expression other - self."""
+        return self._combine(other, _rsub)
+
+    def __mul__(self, other):
+        """Returns the expression self * other."""
+        return self._combine(other, operator.mul)
+
+    def __rmul__(self, other):
+        """Returns the expression other * self."""
+        return self._combine(other, operator.mul)
+
+    def _values(self, shape):
+        """Returns an iterator over the values of the expression broadcast to shape.
+
+        Broadcasting is pushed down to the leaves, which are read as
+        broadcast views, so no operand is ever expanded in memory.
+        """
+        if self._op is None:
+            return self._operands[0].broadcast_to(shape)._flat()
+        left, right = self._operands
+        right = right._values(shape) if isinstance(right, LazyArray) else repeat(right)
+        return map(self._op, left._values(shape), right)
+
+    def compute(self, out=None):
+        """Evaluates the expression.
 
         Args:
-            other (Array, float, int): The array or number to add element-wise to this array.
+            out (Array): optional array of the result shape to write the result into.
 
         Returns:
-            Array: the sum as a new array.
+            Array: the result, or `out`.
+
+        Raises:
+            TypeError, ValueError: If `out` cannot hold the result.
         """
-        return self.__add__(other)
+        if self._op is None and out is None:
+            return self._operands[0]
+        if out is not None:
+            out._check_out(out, self.shape, self.dtype)
+            return _backend.evaluate(self, out)
+        if self._result is None:
+            self._result = _backend.evaluate(self)
+        return self._result
 
-    def __sub__(self, other):
-        """Element-wise subtracts an Array or number from this Array.
-        If the method does not support the operation with the supplied arguments
-        (specific data type or shape), it should return NotImplemented.
+    def __getitem__(self, index):
+        """Evaluates the expression and indexes the result, see `Array.__getitem__`."""
+        return self.compute()[index]
 
-        Args:
-            other (Array, float, int): The array or number to subtract element-wise from this array.
+    def __eq__(self, other):
+        """Evaluates the expression and compares the result with other, see `Array.__eq__`."""
+        if isinstance(other, LazyArray):
+            other = other.compute()
+        return self.compute() == other
+
+    def is_equal(self, other):
+        """Evaluates the expression and compares the result element-wise with other, see `Array.is_equal`."""
+        if isinstance(other, LazyArray):
+            other = other.compute()
+        return self.compute().is_equal(other)
+
+    def __str__(self):
+        """Evaluates the expression and returns the string of the result."""
+        return str(self.compute())
+
+    def __repr__(self):
+        """Evaluates the expression and returns the shape, dtype and (summarised) elements of the result."""
+        return f"LazyArray(shape={self.shape}, dtype={self.dtype}, values={self})"
+
+
+class Rolling:
+    """Windows of consecutive elements along an axis of an Array, see Array.rolling.
+
+    Attributes:
+        array (Array): the array the windows slide over.
+        window (int): the number of elements in a window.
+        axis (int): the axis the windows slide along.
+    """
+
+    def __init__(self, array, window, axis):
+        self.array = array
+        self.window = window
+        self.axis = axis
+
+    def _scan(self, name, dtype):
+        """Computes the named statistic of every window, see Array._scan."""
+        return self.array._scan(name, self.axis, lambda length: length - self.window + 1, dtype, window=self.window)
+
+    def sum(self):
+        """Returns the sums of the windows, from running sums.
 
         Returns:
-            Array: the difference as a new array.
+            Array: the sums, int64 for int arrays.
         """
-        if self.is_bool_array:
-            raise NotImplementedError("This method is not implemented for a boolean Array.")
-            # return NotImplemented
+        return self._scan("rolling_sum", _sum_dtype(self.array.dtype))
 
-        if isinstance(other, Array):
-            if not other.shape == self.shape:
-                raise ValueError("Arrays have different shapes.")
-            elif other.is_bool_array:
-                raise NotImplementedError("The method does not support given value types.")
-                # return NotImplemented
-            return Array(self.shape, *[v-w for v,w in zip(self.flatten2d(), other.flatten2d())])
-        elif type(other) in (int, float):
-            return Array(self.shape, *[v-other for v in self.flatten2d()])
-        else:
-            raise NotImplementedError("The method does not support given value types.")
-            # return NotImplemented
+    def mean(self):
+        """Returns the means of the windows, from running sums.
 
-    def __rsub__(self, other):
-        """Element-wise subtracts this Array from a number or Array.
+        Returns:
+            Array: the float64 means.
+        """
+        return self._scan("rolling_mean", "float64")
 
-        If the method does not support the operation with the supplied arguments
-        (specific data type or shape), it should return NotImplemented.
+    def min(self):
+        """Returns the smallest element of each window, keeping the dtype of the array.
 
-        Args:
-            other (Array, float, int): The array or number being subtracted from.
+        Returns:
+            Array: the minima.
+        """
+        return self._scan("rolling_min", self.array.dtype)
+
+    def max(self):
+        """Returns the largest element of each window, keeping the dtype of the array.
 
         Returns:
-            Array: the difference as a new array.
+            Array: the maxima.
         """
-        if self.is_bool_array:
-            raise NotImplementedError("This method is not implemented for a boolean Array.")
-            # return NotImplemented
+        return self._scan("rolling_max", self.array.dtype)
 
-        if isinstance(other, Array):
-            if not other.shape == self.shape:
-                raise ValueError("Arrays have different shapes.")
-            elif other.is_bool_array:
-                raise NotImplementedError("The method does not support given value types.")
-                # return NotImplemented
-            return Array(self.shape, *[w-v for v,w in zip(self.flatten2d(), other.flatten2d())])
-        elif type(other) in (int, float):
-            return Array(self.shape, *[other-v for v in self.flatten2d()])
-        else:
-            raise NotImplementedError("The method does not support given value types.")
-            # return NotImplemented
+    def __repr__(self):
+        return f"Rolling(window={self.window}, axis={self.axis}, array={self.array!r})"
 
-    def __mul__(self, other):
-        """Element-wise multiplies this Array with a number or array.
 
-        If the method does not support the operation with the supplied arguments
-        (specific data type or shape), it should return NotImplemented.
+def _line_axes(ndim, axis):
+    """Returns the permutation of the axes that moves the last axis to axis."""
+    axes = list(range(ndim - 1))
+    axes.insert(axis, ndim - 1)
+    return tuple(axes)
+
+
+def _rolling_extreme_numpy(values, window, ufunc):
+    """Returns the extremes of all windows along the last axis of an ndarray
+    in O(n), with the van Herk/Gil-Werman algorithm.
+
+    The lines are cut into blocks of `window` elements, and the running
+    extremes are accumulated forwards and backwards within each block. Every
+    window spans the end of one block and the start of the next, so its
+    extreme is that of a backward and a forward running extreme.
+
+    Args:
+        values (numpy.ndarray): the elements.
+        window (int): the number of elements in a window.
+        ufunc (numpy.ufunc): numpy.minimum or numpy.maximum.
+    """
+    n = values.shape[-1]
+    # Padding to whole blocks, the padded values are never in a full window
+    padding = [(0, 0)]*(values.ndim - 1) + [(0, -n % window)]
+    padded = np.pad(values, padding, mode="edge")
+    blocks = padded.reshape(padded.shape[:-1] + (-1, window))
+    forward = ufunc.accumulate(blocks, axis=-1).reshape(padded.shape)
+    backward = ufunc.accumulate(blocks[..., ::-1], axis=-1)[..., ::-1].reshape(padded.shape)
+    return ufunc(backward[..., :n - window + 1], forward[..., window - 1:n])
+
+
+def _extremes(values):
+    """Returns the smallest and largest element of an ndarray (or a number)
+    as Python numbers, (0, 0) if it is empty."""
+    if not isinstance(values, np.ndarray):
+        return values, values
+    if values.size == 0:
+        return 0, 0
+    return values.min().item(), values.max().item()
+
+
+def _interval(op, left, right):
+    """Returns the interval of the results of op (add, sub or mul) on
+    numbers from the intervals left and right, as (low, high)."""
+    (a, b), (c, d) = left, right
+    if op is operator.add:
+        return a + c, b + d
+    if op is operator.sub:
+        return a - d, b - c
+    products = (a*c, a*d, b*c, b*d)
+    return min(products), max(products)
+
+
+def _within(interval, dtype):
+    """Checks that all ints in interval fit in the int dtype."""
+    info = np.iinfo(dtype)
+    return info.min <= interval[0] and interval[1] <= info.max
+
+
+def _narrow(exact, dtype):
+    """Converts exact int64 results to the narrower int dtype.
+
+    Raises:
+        OverflowError: If a result does not fit in dtype.
+    """
+    if not _within(_extremes(exact), dtype):
+        raise OverflowError(f"A result does not fit in {dtype}.")
+    return exact.astype(dtype)
+
+
+def _scan_interval(name, extremes, length, **kwargs):
+    """Returns an interval that holds every result of an int scan of lines
+    of `length` elements within extremes, or None if there is no cheap one."""
+    low, high = extremes
+    if name in ("cumsum", "rolling_sum"):
+        count = length if name == "cumsum" else kwargs["window"]
+        return min(low, count*low), max(high, count*high)
+    if name == "diff":
+        # every difference doubles the largest possible spread
+        spread = (high - low) << max(kwargs["n"] - 1, 0)
+        return (low, high) if kwargs["n"] == 0 else (-spread, spread)
+    if name == "cumprod":
+        largest = max(abs(low), abs(high))
+        if largest <= 1 or length*largest.bit_length() < 63:
+            return -largest**length, largest**length
+        return None  # see _NumPyBackend.scan
+    return low, high
+
+
+class _PythonBackend:
+    """Kernels in pure Python: builtins and map over memoryviews of the buffers."""
+
+    name = "python"
+
+    def binary(self, op, left, right, dtype, out=None):
+        """Applies op element-wise to two operands of the same shape.
 
         Args:
-            other (Array, float, int): The array or number to multiply element-wise to this array.
+            op (callable): binary function, e.g. operator.add.
+            left (Array): left-hand operand.
+            right (Array, float, int): right-hand operand, an Array of the same shape or a number.
+            dtype (str): dtype of the result.
+            out (Array): optional (validated) array to write the result into.
 
         Returns:
-            Array: a new array with every element multiplied with `other`.
+            Array: the result as a new array, or `out`.
+        """
+        if isinstance(right, Array):
+            values = map(op, left._flat(), right._flat())
+        else:
+            values = map(op, left._flat(), repeat(right))
+        if out is not None:
+            out._assign(values)
+            return out
+        return Array._from_buffer(left.shape, dtype, _buffer(dtype, values))
+
+    def reduce(self, array, name, axis, dtype, **kwargs):
+        """Reduces all elements (axis None) or the lines along an axis.
 
+        Args:
+            array (Array): the (validated) array to reduce.
+            name (str): name of the reducer in _REDUCERS.
+            axis (int): axis to reduce along, or None.
+            dtype (str): dtype of the result Array if axis is given.
+            **kwargs: extra arguments for the reducer.
+
+        Returns:
+            The reduced value if axis is None, otherwise an Array.
         """
-        if self.is_bool_array:
-            raise NotImplementedError("This method is not implemented for a boolean Array.")
-            # return NotImplemented
+        reducer = _REDUCERS[name]
+        if kwargs:
+            reducer = partial(reducer, **kwargs)
+        if axis is None:
+            return reducer(array._flat())
+        shape, lines = array._axis_lines(axis)
+        return Array._from_buffer(shape, dtype, _buffer(dtype, map(reducer, lines)))
 
-        if isinstance(other, Array):
-            if not other.shape == self.shape:
-                raise ValueError("Arrays have different shapes.")
-            elif other.is_bool_array:
-                raise NotImplementedError("The method does not support given value types.")
-                # return NotImplemented
-            return Array(self.shape, *[v*w for v,w in zip(self.flatten2d(), other.flatten2d())])
-        elif type(other) in (int, float):
-            return Array(self.shape, *[v*other for v in self.flatten2d()])
-        else:
-            raise NotImplementedError("The method does not support given value types.")
-            # return NotImplemented
+    def scan(self, array, name, axis, shape, dtype, **kwargs):
+        """Maps each line along an axis to a new line.
 
-    def __rmul__(self, other):
-        """Element-wise multiplies this Array with a number or array.
+        Args:
+            array (Array): the (validated) array to scan.
+            name (str): name of the scan in _SCANS.
+            axis (int): axis to scan along.
+            shape (tuple): shape of the result.
+            dtype (str): dtype of the result.
+            **kwargs: extra arguments for the scan.
 
-        If the method does not support the operation with the supplied arguments
-        (specific data type or shape), it should return NotImplemented.
+        Returns:
+            Array: the result as a new array.
+        """
+        scan = _SCANS[name]
+        if kwargs:
+            scan = partial(scan, **kwargs)
+        _, lines = array._axis_lines(axis)
+        values = chain.from_iterable(map(scan, lines))
+        if axis == array.ndim - 1:
+            return Array._from_buffer(shape, dtype, _buffer(dtype, values))
+        # The lines of the result are along its last axis, move it back to axis
+        line_shape = shape[:axis] + shape[axis+1:] + (shape[axis],)
+        result = Array._from_buffer(line_shape, dtype, _buffer(dtype, values))
+        return result.transpose(_line_axes(array.ndim, axis)).copy()
+
+    def copy(self, array):
+        """Returns a contiguous copy of a strided array, copying the bytes of
+        each line along the last axis (see Array._runs) with a memoryview slice."""
+        data = array._data
+        raw = b"".join(data[start: start + 1].tobytes()*count if step == 0 else data[_run_slice(start, count, step)].tobytes()
+                       for start, count, step in array._runs())
+        return Array._from_buffer(array.shape, array.dtype, _from_bytes(array.dtype, raw))
+
+    def array_equal(self, left, right, equal_nan):
+        """Checks if two arrays of the same shape have equal elements, see Array.array_equal.
+
+        Contiguous arrays are compared in chunks, others line by line along
+        the last axis, as memoryview slices where possible, which compare
+        their items in C.
+        """
+        if left._is_contiguous() and right._is_contiguous():
+            pairs = zip(_chunks(left._flat()), _chunks(right._flat()))
+        else:
+            pairs = zip(left._lines(), right._lines())
+        compare = _equal_or_nan if equal_nan else operator.eq
+        for left_part, right_part in pairs:
+            if isinstance(left_part, memoryview) and isinstance(right_part, memoryview) and not equal_nan:
+                if left_part != right_part:
+                    return False
+            elif not all(map(compare, left_part, right_part)):
+                return False
+        return True
+
+    def describe(self, array, axis, ddof):
+        """Collects the statistics of Array.describe with _Moments.
 
         Args:
-            other (Array, float, int): The array or number to multiply element-wise to this array.
+            array (Array): the (validated) array.
+            axis (int): axis to compute along, or None for all elements.
+            ddof (int): delta degrees of freedom for std and var.
 
         Returns:
-            Array: a new array with every element multiplied with `other`.
+            dict: the statistics by name, see Array.describe.
         """
-        # Hint: this solution/logic applies for all r-methods
-        return self.__mul__(other)
+        if axis is None:
+            return _Moments(array._flat()).describe(ddof)
+        shape, lines = array._axis_lines(axis)
+        line_stats = [_Moments(line).describe(ddof) for line in lines]
+        stats = {"count": array.shape[axis]}
+        for name in ("mean", "std", "var", "min", "max"):
+            dtype = array.dtype if name in ("min", "max") else "float64"
+            values = (line[name] for line in line_stats)
+            stats[name] = Array._from_buffer(shape, dtype, _buffer(dtype, values))
+        return stats
 
-    def __eq__(self, other):
-        """Compares an Array with another Array.
+    def allclose(self, left, right, rtol, atol, equal_nan):
+        """Checks if all elements of left are close to right, stopping at the
+        first one that is not, see Array.allclose.
 
-        If the two array shapes do not match, it should return False.
-        If `other` is an unexpected type, return False.
+        Args:
+            left (Array): the array to check.
+            right (Array, float, int): an Array of the shape of left, or a number.
+        """
+        close = partial(_close, rtol=rtol, atol=atol, equal_nan=equal_nan)
+        right = right._flat() if isinstance(right, Array) else repeat(right)
+        return all(map(close, left._flat(), right))
+
+    def astype(self, array, dtype):
+        """Returns a copy of array converted to dtype, see Array.astype."""
+        values = array._flat()
+        if _KINDS[dtype] == "b":
+            values = map(bool, values)
+        elif _KINDS[dtype] == "i" and _KINDS[array.dtype] == "f":
+            values = map(int, values)
+        return Array._from_buffer(array.shape, dtype, _buffer(dtype, values))
+
+    def where(self, mask, x, y, dtype):
+        """Chooses element-wise from x where mask is True and from y elsewhere.
 
         Args:
-            other (Array): The array to compare with this array.
+            mask (Array): boolean array.
+            x, y (Array, float, int, bool): Arrays of the shape of mask, or numbers.
+            dtype (str): dtype of the result.
 
         Returns:
-            bool: True if the two arrays are equal (identical). False otherwise.
+            Array: the result as a new array.
         """
-                
-        if isinstance(other, Array):
-            if other.shape == self.shape:
-                return self.values == other.values
-            else:
-                return False
-        else:
-            return False
+        x, y = (value._flat() if isinstance(value, Array) else repeat(value) for value in (x, y))
+        values = map(_select, mask._flat(), x, y)
+        return Array._from_buffer(mask.shape, dtype, _buffer(dtype, values))
 
-    def is_equal(self, other):
-        """Compares an Array element-wise with another Array or number.
+    def matmul(self, left, right, dtype):
+        """Returns the matrix product of two 2D arrays, see _matmul_values."""
+        shape = (left.shape[0], right.shape[1])
+        return Array._from_buffer(shape, dtype, _buffer(dtype, _matmul_values(left, right)))
 
-        If `other` is an Array and the two array shapes do not match, this method should raise ValueError.
-        If `other` is not an Array or a number, it should return TypeError.
+    def evaluate(self, expression, out=None):
+        """Evaluates a LazyArray by streaming all elements through the
+        composed map iterators of its tree in a single pass.
 
         Args:
-            other (Array, float, int): The array or number to compare with this array.
+            expression (LazyArray): the expression to evaluate.
+            out (Array): optional (validated) array to write the result into.
 
         Returns:
-            Array: An Array of booleans with True where the two arrays match and False where they do not.
-                   Or if `other` is a number, it returns True where the array is equal to the number and False
-                   where it is not.
+            Array: the result as a new array, or `out`.
+        """
+        if out is not None:
+            # The operands may share the buffer of out, so read them all first
+            if _shares_buffer(expression, out):
+                values = self.evaluate(expression)._flat()
+            else:
+                values = expression._values(out.shape)
+            out._assign(values)
+            return out
+        values = expression._values(expression.shape)
+        return Array._from_buffer(expression.shape, expression.dtype, _buffer(expression.dtype, values))
 
-        Raises:
-            ValueError: if the shape of self and other are not equal.
+
+class _NumPyBackend:
+    """Kernels from NumPy, run on ndarray views of the buffers (see Array.__array__)."""
+
+    name = "numpy"
+
+    def __init__(self):
+        self.ufuncs = {operator.add: np.add, operator.sub: np.subtract,
+                       operator.mul: np.multiply, operator.eq: np.equal}
+
+    def binary(self, op, left, right, dtype, out=None):
+        """Applies op element-wise with the matching ufunc, see _PythonBackend.binary.
+
+        Ufuncs wrap around on int overflow, so for int results the interval
+        of the results is first bounded from the smallest and largest
+        elements of the operands. If it does not fit in dtype (or a number
+        operand does not), narrower ints are computed exactly in int64 and
+        then checked, and int64 is left to the python backend, so that an
+        overflow raises an OverflowError as with the python backend.
         """
+        a = left.__array__()
+        b = right.__array__() if isinstance(right, Array) else right
+        base = operator.sub if op is _rsub else op
+        ufunc = self.ufuncs[base]
+        if op is _rsub:
+            a, b = b, a
+        if _KINDS[dtype] == "i":
+            extremes = _extremes(a), _extremes(b)
+            if not (_within(_interval(base, *extremes), dtype)
+                    and all(_within(e, dtype) for e in extremes)):
+                if dtype == "int64":
+                    return _BACKENDS["python"].binary(op, left, right, dtype, out)
+                exact = _narrow(ufunc(a, b, dtype=np.int64), dtype)
+                if out is None:
+                    return Array._from_ndarray(exact)
+                np.copyto(out.__array__(), exact)
+                return out
+        result = np.empty(left.shape, dtype) if out is None else out.__array__()
+        ufunc(a, b, out=result)
+        return Array._from_ndarray(result) if out is None else out
 
-        if isinstance(other, Array):
-            if not other.shape == self.shape:
-                raise ValueError("Arrays have different shapes.")
-            return Array(self.shape, *[v == w for v,w in zip(self.flatten2d(), other.flatten2d())])
-        elif type(other) in (int, float):
-            return Array(self.shape, *[v == other for v in self.flatten2d()])
+    def reduce(self, array, name, axis, dtype, **kwargs):
+        """Reduces with the NumPy function of the same name, see _PythonBackend.reduce.
+
+        Sums of ints that may overflow int64 (bounded from the smallest and
+        largest elements, see binary) are left to the python backend.
+        """
+        values = array.__array__()
+        if array.dtype == "float32" and name in ("sum", "mean", "var", "std"):
+            # Accumulate in float64, as the python backend does
+            kwargs = dict(kwargs, dtype=np.float64)
+        if name == "sum" and _KINDS[array.dtype] == "i":
+            count = values.size if axis is None else values.shape[axis]
+            # Sums of fewer than 2**32 narrower ints always fit
+            if array.dtype == "int64" or count >= 1 << 32:
+                low, high = _extremes(values)
+                if not _within((count*low, count*high), "int64"):
+                    return _BACKENDS["python"].reduce(array, name, axis, dtype, **kwargs)
+        result = np.asarray(getattr(np, name)(values, axis=axis, **kwargs))
+        if axis is None:
+            return result.item()
+        return Array._from_ndarray(np.ascontiguousarray(result, dtype=dtype))
+
+    def scan(self, array, name, axis, shape, dtype, **kwargs):
+        """Scans with the NumPy function of the same name, with running sums
+        for rolling sums and means, and with _rolling_extreme_numpy for
+        rolling minima and maxima, see _PythonBackend.scan.
+
+        Int scans that may overflow (see _scan_interval and binary) are
+        computed exactly in int64 for narrower ints, and left to the python
+        backend for int64.
+        """
+        values = array.__array__()
+        wide = False
+        if _KINDS[dtype] == "i":
+            interval = _scan_interval(name, _extremes(values), values.shape[axis], **kwargs)
+            if interval is None:
+                # Long products, bounded by a float64 estimate (NaN fails the comparison)
+                largest = np.absolute(np.cumprod(values, axis=axis, dtype=np.float64)).max(initial=0.0)
+                interval = (-2**62, 2**62) if largest < 2.0**62 else None
+            if interval is None or not _within(interval, dtype):
+                if dtype == "int64" or name == "cumprod":
+                    return _BACKENDS["python"].scan(array, name, axis, shape, dtype, **kwargs)
+                wide = True
+        # Accumulate float32 in float64, as the python backend does
+        accumulator = np.float64 if dtype == "float32" else dtype
+        if name in ("cumsum", "cumprod"):
+            result = getattr(np, name)(values, axis=axis, dtype=accumulator)
+        elif name == "diff":
+            result = np.diff(values.astype(np.int64) if wide else values, n=kwargs["n"], axis=axis)
+            if wide:
+                result = _narrow(result, dtype)
         else:
-            raise TypeError("This type is not supported.")
+            window = kwargs["window"]
+            values = np.moveaxis(values, axis, -1)
+            if name in ("rolling_min", "rolling_max"):
+                ufunc = np.minimum if name == "rolling_min" else np.maximum
+                result = _rolling_extreme_numpy(values, window, ufunc)
+            else:
+                sums = np.cumsum(values, axis=-1, dtype=np.float64 if _KINDS[array.dtype] == "f" else "int64")
+                result = sums[..., window - 1:].copy()
+                result[..., 1:] -= sums[..., :-window]
+                if name == "rolling_mean":
+                    result = result/window
+            result = np.moveaxis(result, -1, axis)
+        return Array._from_ndarray(np.ascontiguousarray(result, dtype=dtype))
 
-    def min_element(self):
-        """Returns the smallest value of the array.
+    def copy(self, array):
+        """Returns a contiguous copy of a strided array with numpy.array."""
+        return Array._from_ndarray(np.array(array.__array__(), order="C"))
 
-        Only needs to work for type int and float (not boolean).
+    def array_equal(self, left, right, equal_nan):
+        """Checks with numpy.array_equal, see _PythonBackend.array_equal."""
+        return bool(np.array_equal(left.__array__(), right.__array__(), equal_nan=equal_nan))
 
-        Returns:
-            float: The value of the smallest element in the array.
+    def describe(self, array, axis, ddof):
+        """Computes the statistics with NumPy reductions, see _PythonBackend.describe."""
+        values = array.__array__()
+        count = values.size if axis is None else values.shape[axis]
+        shape = () if axis is None else values.shape[:axis] + values.shape[axis+1:]
+        var = values.var(axis=axis, dtype=np.float64, ddof=ddof) if count > ddof else np.full(shape, nan)
+        stats = {"count": count, "mean": values.mean(axis=axis, dtype=np.float64), "std": np.sqrt(var), "var": var,
+                 "min": values.min(axis=axis), "max": values.max(axis=axis)}
+        for name, value in stats.items():
+            if name != "count":
+                stats[name] = value.item() if axis is None else Array._from_ndarray(np.ascontiguousarray(value))
+        return stats
+
+    def allclose(self, left, right, rtol, atol, equal_nan):
+        """Checks with numpy.allclose, see _PythonBackend.allclose."""
+        right = right.__array__() if isinstance(right, Array) else right
+        return bool(np.allclose(left.__array__(), right, rtol=rtol, atol=atol, equal_nan=equal_nan))
+
+    def astype(self, array, dtype):
+        """Converts with ndarray.astype, see Array.astype.
+
+        Conversions to ints that may not fit (or of NaN) are left to the
+        python backend, see binary. Floats are truncated, so they fit if they
+        are less than 1 outside the range of dtype.
         """
+        if _KINDS[dtype] == "i" and _KINDS[array.dtype] != "b":
+            low, high = _extremes(array.__array__())
+            info = np.iinfo(dtype)
+            # NaN fails both comparisons
+            if not (info.min - 1 < low and high < info.max + 1):
+                return _BACKENDS["python"].astype(array, dtype)
+        return Array._from_ndarray(np.ascontiguousarray(array.__array__().astype(dtype)))
 
-        if self.is_bool_array:
-            raise NotImplementedError("This method is not implemented for a boolean Array.")        
-        else:
-            return float(min(self.flatten2d()))
+    def where(self, mask, x, y, dtype):
+        """Chooses with numpy.where, see _PythonBackend.where."""
+        x, y = (value.__array__() if isinstance(value, Array) else value for value in (x, y))
+        result = np.where(mask.__array__(), x, y)
+        return Array._from_ndarray(np.ascontiguousarray(np.broadcast_to(result, mask.shape), dtype=dtype))
 
-    def mean_element(self):
-        """Returns the mean value of an array
+    def matmul(self, left, right, dtype):
+        """Returns the matrix product of two 2D arrays with numpy.matmul.
 
-        Only needs to work for type int and float (not boolean).
+        Int products are bounded from the largest magnitudes of the operands,
+        see binary, and left to the python backend if they may not fit.
+        """
+        if _KINDS[dtype] == "i":
+            largest = [max(map(abs, _extremes(operand.__array__()))) for operand in (left, right)]
+            bound = left.shape[1]*largest[0]*largest[1]
+            if not _within((-bound, bound), dtype):
+                return _BACKENDS["python"].matmul(left, right, dtype)
+        result = np.empty((left.shape[0], right.shape[1]), dtype)
+        np.matmul(left.__array__(), right.__array__(), out=result)
+        return Array._from_ndarray(result)
 
-        Returns:
-            float: the mean value
+    def evaluate(self, expression, out=None):
+        """Evaluates a LazyArray with ufuncs, see _PythonBackend.evaluate.
+
+        The first intermediate result is allocated with the shape and dtype of
+        the result, and every later node writes into it in place, so one
+        temporary serves the whole tree.
+
+        Int expressions where a node may overflow its dtype are evaluated
+        with the python backend, see binary and _node_interval.
         """
+        if _KINDS[expression.dtype] == "i" and self._node_interval(expression) is None:
+            return _BACKENDS["python"].evaluate(expression, out)
+        result = self._evaluate(expression)[0]
+        if out is not None:
+            np.copyto(out.__array__(), result)
+            return out
+        if result.shape != expression.shape or not result.flags.c_contiguous or result.dtype != expression.dtype:
+            result = np.ascontiguousarray(np.broadcast_to(result, expression.shape), dtype=expression.dtype)
+        return Array._from_ndarray(result)
 
-        if self.is_bool_array:
-            raise NotImplementedError("This method is not implemented for a boolean Array.")        
+    def _node_interval(self, node):
+        """Returns an interval that holds the values of a node, from the
+        extremes of the arrays (see binary), or None if the values of an int
+        node, or a number combined with them, may not fit in its dtype."""
+        if not isinstance(node, LazyArray):
+            return node, node
+        if node._op is None:
+            return _extremes(node._operands[0].__array__())
+        if node._op is operator.eq:
+            return 0, 1
+        left, right = intervals = list(map(self._node_interval, node._operands))
+        if left is None or right is None:
+            return None
+        if node._op is _rsub:
+            interval = _interval(operator.sub, right, left)
         else:
-            if self.is_1D_array:
-                return float(sum(self.values)/self.shape[0])
+            interval = _interval(node._op, left, right)
+        if not all(_within(i, node.dtype) for i in intervals + [interval]):
+            return None
+        return interval
+
+    def _evaluate(self, node):
+        """Returns the value of a node as an ndarray (or number), and whether it
+        is a temporary that may be overwritten."""
+        if not isinstance(node, LazyArray):
+            return node, False
+        if node._op is None:
+            return node._operands[0].__array__(), False
+        (left, left_owned), (right, right_owned) = map(self._evaluate, node._operands)
+        op = node._op
+        if op is _rsub:
+            op, left, right, left_owned, right_owned = operator.sub, right, left, right_owned, left_owned
+        ufunc = self.ufuncs[op]
+        for candidate, owned in ((left, left_owned), (right, right_owned)):
+            if owned and candidate.shape == node.shape and candidate.dtype == node.dtype:
+                return ufunc(left, right, out=candidate), True
+        return ufunc(left, right, out=np.empty(node.shape, node.dtype)), True
+
+
+def _binary_task(backend, op, left, right, dtype):
+    """Runs an element-wise operation on one part in a worker, see _ParallelBackend."""
+    return _BACKENDS[backend].binary(op, left, right, dtype)
+
+
+def _reduce_task(backend, name, array):
+    """Reduces one part in a worker: the moments for mean, var and std,
+    the reduced value for the other reductions."""
+    if name not in ("mean", "var", "std"):
+        return _BACKENDS[backend].reduce(array, name, None, array.dtype)
+    if backend != "numpy":
+        return _Moments(array._flat())
+    values = array.__array__()
+    moments = _Moments()
+    moments.count = values.size
+    moments.mean = values.mean(dtype=np.float64).item()
+    moments.m2 = values.var(dtype=np.float64).item()*values.size
+    moments.min = values.min().item()
+    moments.max = values.max().item()
+    return moments
+
+
+# How the partial results of each part are combined, see _ParallelBackend.reduce
+_COMBINERS = {
+    "sum": sum,
+    "count_nonzero": sum,
+    "min": _min,
+    "max": _max,
+    "any": any,
+    "all": all,
+    "mean": lambda parts: _merge_moments(parts).mean,
+    "var": lambda parts, ddof=0: _merge_moments(parts).var(ddof),
+    "std": lambda parts, ddof=0: sqrt(_merge_moments(parts).var(ddof)),
+}
+
+
+def _merge_moments(parts):
+    """Merges a list of _Moments into one."""
+    moments = _Moments()
+    for part in parts:
+        moments.merge(part)
+    return moments
+
+
+class _ParallelBackend:
+    """Runs the element-wise operations and full reductions of another
+    backend on parts of the arrays in parallel, see Array.set_num_threads."""
+
+    def __init__(self, inner, num_threads, executor=None):
+        """Wraps a backend.
+
+        Args:
+            inner: the backend that computes each part.
+            num_threads (int): the number of parts.
+            executor (concurrent.futures.Executor): pool to use, or None to
+                create a thread pool (numpy) or process pool (python) on first use.
+        """
+        self.inner = inner
+        self.num_threads = num_threads
+        self.executor_argument = executor
+        self._executor = executor
+
+    @property
+    def name(self):
+        """str: The name of the wrapped backend."""
+        return self.inner.name
+
+    def __getattr__(self, name):
+        # Everything else (matmul, where, evaluate) runs in the wrapped backend
+        return getattr(self.inner, name)
+
+    @property
+    def executor(self):
+        """concurrent.futures.Executor: The pool the parts run in."""
+        if self._executor is None:
+            if self.inner.name == "numpy":
+                self._executor = ThreadPoolExecutor(max_workers=self.num_threads)
             else:
-                return sum(self.flatten2d())/(self.shape[0]*self.shape[1])
\ No newline at end of file
+                # Spawned, not forked: forking a process with running threads can deadlock
+                context = multiprocessing.get_context("spawn")
+                self._executor = ProcessPoolExecutor(max_workers=self.num_threads, mp_context=context)
+        return self._executor
+
+    def close(self):
+        """Shuts down the pool, unless it was passed in."""
+        if self._executor is not None and self.executor_argument is None:
+            self._executor.shutdown()
+        self._executor = self.executor_argument
+
+    def _parts(self, shape):
+        """Returns indices that split an array of the given shape along its
+        longest axis into at most num_threads parts."""
+        axis = max(range(len(shape)), key=shape.__getitem__)
+        n = shape[axis]
+        count = min(self.num_threads, n)
+        bounds = [n*i//count for i in range(count + 1)]
+        return [(slice(None),)*axis + (slice(start, stop),) for start, stop in zip(bounds, bounds[1:])]
+
+    def binary(self, op, left, right, dtype, out=None):
+        """Splits an element-wise operation into parts, see _PythonBackend.binary."""
+        if left.size < _PARALLEL_MIN_SIZE:
+            return self.inner.binary(op, left, right, dtype, out)
+        result = out if out is not None else Array._from_buffer(left.shape, dtype, _zeros(dtype, left.size))
+        parts = self._parts(left.shape)
+        right_parts = [right[index] if isinstance(right, Array) else right for index in parts]
+
+        if isinstance(self.executor, ThreadPoolExecutor):
+            # Threads share memory, so each part is written straight into the result
+            futures = [self.executor.submit(self.inner.binary, op, left[index], right_part, dtype, result[index])
+                       for index, right_part in zip(parts, right_parts)]
+            for future in futures:
+                future.result()
+        else:
+            futures = [self.executor.submit(_binary_task, self.inner.name, op, left[index], right_part, dtype)
+                       for index, right_part in zip(parts, right_parts)]
+            for index, future in zip(parts, futures):
+                result[index]._assign(future.result()._flat())
+        return result
+
+    def reduce(self, array, name, axis, dtype, **kwargs):
+        """Reduces the parts in parallel and combines the partial results, see _PythonBackend.reduce."""
+        if axis is not None or name not in _COMBINERS or array.size < _PARALLEL_MIN_SIZE:
+            return self.inner.reduce(array, name, axis, dtype, **kwargs)
+        parts = [array[index] for index in self._parts(array.shape)]
+        partials = list(self.executor.map(partial(_reduce_task, self.inner.name, name), parts))
+        return _COMBINERS[name](partials, **kwargs)
+
+
+# Available backends by name, NumPy is used by default when it is installed
+_BACKENDS = {"python": _PythonBackend()}
+if np is not None:
+    _BACKENDS["numpy"] = _NumPyBackend()
+_backend = _BACKENDS["numpy" if np is not None else "python"]
@@ -0,0 +1,179 @@
+"""
+Timing the operations of our Array class, to catch performance regressions.
+
+Times construction, the arithmetic operators, comparisons, the reductions,
+`flatten2d` and `__str__` for 1D and 2D float arrays of each size, and
+writes the results to a JSON file. Given a baseline file written earlier,
+it compares the new timings against it and reports every benchmark that
+got slower by more than a threshold.
+
+Can be executed as
+
+    python3 benchmark_array.py --output baseline.json
+    # ... change array_class.py ...
+    python3 benchmark_array.py --output new.json --compare baseline.json
+
+Each timing is the best of a few repeats, which is less sensitive to noise
+than the average. Timings below --min-seconds are too noisy to compare and
+are not reported as regressions. Note that the largest size (10^7
+elements) takes minutes with the python backend.
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from math import isqrt
+
+from array_class import Array
+
+
+def time_best(function, *arguments, repeat=3):
+    """Returns the shortest time (in seconds) of `repeat` calls of function(*arguments)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function(*arguments)
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+
+def make_shape(size, ndim):
+    """Returns a 1D shape of size elements, or a 2D shape of about size
+    elements that is as close to square as possible."""
+    if ndim == 1:
+        return (size,)
+    columns = max(isqrt(size), 1)
+    return (max(size//columns, 1), columns)
+
+
+# Name -> function of two arrays a and b of the same shape, and the values of a
+BENCHMARKS = {
+    "construct": lambda a, b, values: Array(a.shape, *values),
+    "from_iterable": lambda a, b, values: Array.from_iterable(a.shape, values),
+    "add": lambda a, b, values: a + b,
+    "add_scalar": lambda a, b, values: a + 1.5,
+    "sub": lambda a, b, values: a - b,
+    "mul": lambda a, b, values: a*b,
+    "is_equal": lambda a, b, values: a.is_equal(b),
+    "eq": lambda a, b, values: a == a.copy(),
+    "sum": lambda a, b, values: a.sum(),
+    "min": lambda a, b, values: a.min(),
+    "mean": lambda a, b, values: a.mean(),
+    "var": lambda a, b, values: a.var(),
+    "flatten2d": lambda a, b, values: a.flatten2d(),
+    "str": lambda a, b, values: str(a),
+}
+
+
+def run_benchmarks(sizes=(10, 10**3, 10**5, 10**7), ndims=(1, 2), names=None, repeat=3):
+    """Times every benchmark for arrays of each size and number of dimensions.
+
+    Args:
+        sizes (iterable): the numbers of elements.
+        ndims (iterable): 1 and/or 2.
+        names (iterable): the benchmarks to run, all in BENCHMARKS if None.
+        repeat (int): the number of runs to take the best timing of.
+
+    Returns:
+        list: one dict per timing with the benchmark name, ndim, shape,
+              size and the time in seconds.
+    """
+    names = list(BENCHMARKS) if names is None else names
+    results = []
+    for size in sizes:
+        for ndim in ndims:
+            shape = make_shape(size, ndim)
+            n = shape[0]*shape[-1] if ndim == 2 else size
+            values = [random.random() for _ in range(n)]
+            a = Array.from_iterable(shape, values)
+            b = Array.from_iterable(shape, (random.random() for _ in range(n)))
+            for name in names:
+                seconds = time_best(BENCHMARKS[name], a, b, values, repeat=repeat)
+                results.append({"name": name, "ndim": ndim, "shape": list(shape), "size": n, "seconds": seconds})
+                print(f"{name:>14} {ndim}D {n:>9}: {seconds:.3g}s")
+    return results
+
+
+def _key(result):
+    """Identifies a timing across runs."""
+    return result["name"], result["ndim"], result["size"]
+
+
+def compare(results, baseline, threshold=0.25, min_seconds=1e-4):
+    """Compares timings against those of a baseline run.
+
+    Args:
+        results (list): timings as returned by `run_benchmarks`.
+        baseline (list): timings of an earlier run. Benchmarks that are
+            missing in either list are skipped.
+        threshold (float): relative slowdown that counts as a regression,
+            0.25 means more than 25% slower.
+        min_seconds (float): new times below this are too noisy to count as regressions.
+
+    Returns:
+        list: one dict per regression with the benchmark name, ndim, size,
+              the baseline and new times and their ratio, slowest first.
+    """
+    baseline_seconds = {_key(result): result["seconds"] for result in baseline}
+    regressions = []
+    for result in results:
+        before = baseline_seconds.get(_key(result))
+        if before is None or before == 0 or result["seconds"] < min_seconds:
+            continue
+        ratio = result["seconds"]/before
+        if ratio > 1 + threshold:
+            name, ndim, size = _key(result)
+            regressions.append({"name": name, "ndim": ndim, "size": size,
+                                "baseline": before, "seconds": result["seconds"], "ratio": ratio})
+    return sorted(regressions, key=lambda regression: -regression["ratio"])
+
+
+def main(argv=None):
+    """Parses the command line, runs the benchmarks and writes or compares the results.
+
+    Returns:
+        int: exit status, 1 if regressions were found and 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(description="Time Array operations and compare against a baseline.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 10**3, 10**5, 10**7], help="Numbers of elements")
+    parser.add_argument("--ndims", type=int, nargs="+", choices=[1, 2], default=[1, 2], help="Array dimensions")
+    parser.add_argument("--benchmarks", nargs="+", choices=list(BENCHMARKS), help="The benchmarks to run (default all)")
+    parser.add_argument("--repeat", type=int, default=3, help="The number of runs to take the best timing of")
+    parser.add_argument("--backend", help="The Array backend to use (default: the current one)")
+    parser.add_argument("-o", "--output", help="JSON file to write the results to")
+    parser.add_argument("--compare", help="JSON file of a baseline run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Relative slowdown that counts as a regression")
+    parser.add_argument("--min-seconds", type=float, default=1e-4,
+                        help="New times below this are not counted as regressions")
+    args = parser.parse_args(argv)
+
+    if args.backend:
+        Array.set_backend(args.backend)
+    results = run_benchmarks(args.sizes, args.ndims, args.benchmarks, args.repeat)
+
+    if args.output:
+        report = {"backend": Array.get_backend(), "python": platform.python_version(),
+                  "machine": platform.machine(), "results": results}
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results are written into {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline.get("backend") != Array.get_backend():
+            print(f"Warning: the baseline was run with the {baseline.get('backend')} backend.")
+        regressions = compare(results, baseline["results"], args.threshold, args.min_seconds)
+        for regression in regressions:
+            print(f"REGRESSION {regression['name']} {regression['ndim']}D {regression['size']}: "
+                  f"{regression['baseline']:.3g}s -> {regression['seconds']:.3g}s ({regression['ratio']:.2f}x)")
+        if regressions:
+            return 1
+        print(f"No regressions over {args.threshold:.0%} against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
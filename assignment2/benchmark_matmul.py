@@ -0,0 +1,90 @@
+"""
+Timing the matrix product of our Array class.
+
+Compares a naive triple loop over `Array.values` with `Array.__matmul__`
+using the pure Python (blocked) kernel and, if NumPy is installed, the
+numpy backend.
+
+Can be executed as `python3 benchmark_matmul.py [--sizes 64 256 1024]`.
+Note that the naive loop takes minutes for the 1024 x 1024 product.
+"""
+import argparse
+import random
+import time
+
+from array_class import Array
+
+
+def naive_matmul(a, b):
+    """Multiplies two 2D Arrays with a triple loop over their nested lists.
+
+    Args:
+        a (Array): array of shape (n, m).
+        b (Array): array of shape (m, p).
+
+    Returns:
+        list: the product as a list of rows.
+    """
+    a_rows = a.values
+    b_rows = b.values
+    n, m = a.shape
+    p = b.shape[1]
+    result = [[0.0]*p for _ in range(n)]
+    for i in range(n):
+        for j in range(p):
+            total = 0.0
+            for k in range(m):
+                total += a_rows[i][k]*b_rows[k][j]
+            result[i][j] = total
+    return result
+
+
+def time_one(function, *arguments, calls=1):
+    """Returns the average time (in seconds) of `calls` calls of function(*arguments)"""
+    start_time = time.perf_counter()
+    for _ in range(calls):
+        function(*arguments)
+    return (time.perf_counter() - start_time)/calls
+
+
+def make_report(sizes=(64, 256, 1024), calls=1):
+    """Times the matrix product of two random square arrays of each size.
+
+    Args:
+        sizes (iterable): side lengths of the square arrays.
+        calls (int): the number of calls to average each timing over.
+
+    Returns:
+        list: one dict per size with the timings in seconds.
+    """
+    results = []
+    for n in sizes:
+        a = Array.from_iterable((n, n), (random.random() for _ in range(n*n)))
+        b = Array.from_iterable((n, n), (random.random() for _ in range(n*n)))
+
+        timings = {"size": n, "naive": time_one(naive_matmul, a, b, calls=calls)}
+        previous = Array.get_backend()
+        for backend in ("python", "numpy"):
+            try:
+                Array.set_backend(backend)
+            except ValueError:
+                continue  # NumPy is not installed
+            timings[backend] = time_one(a.__matmul__, b, calls=calls)
+        Array.set_backend(previous)
+
+        line = f"{n}x{n}: naive {timings['naive']:.3g}s"
+        for backend in ("python", "numpy"):
+            if backend in timings:
+                speedup = timings["naive"]/timings[backend]
+                line += f", {backend} {timings[backend]:.3g}s ({speedup=:.1f}x)"
+        print(line)
+        results.append(timings)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time Array matrix multiplication against a naive triple loop.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 256, 1024], help="Side lengths of the square arrays")
+    parser.add_argument("--calls", type=int, default=1, help="The number of calls to average over")
+    args = parser.parse_args()
+    make_report(args.sizes, args.calls)
@@ -0,0 +1,325 @@
+"""Chunked Array class for assignment 2, for data larger than memory"""
+
+import shutil
+import tempfile
+import weakref
+from itertools import chain, islice
+from math import prod
+from pathlib import Path
+
+from array_class import _END, Array, _broadcast_shapes, _min, _Moments
+
+
+class ChunkedArray:
+    """An array stored as a sequence of blocks of rows, in memory or on disk.
+
+    Every block is an Array holding a number of consecutive rows (elements,
+    for a 1D array). Blocks on disk are Array files (see `Array.save`) that
+    are memory-mapped one at a time when used, so operations run block by
+    block and only need memory for about one block at a time.
+
+    The arithmetic operators, `is_equal`, `min_element` and `mean_element`
+    behave like those of Array. Results of operations on a ChunkedArray on
+    disk are written to a new temporary directory, which the result owns:
+    it is removed by `close` (also at the end of a `with` block), or at the
+    latest when the result is garbage collected.
+
+    Attributes:
+        shape (tuple): shape of the whole array.
+        dtype (str): dtype of the elements.
+        directory (pathlib.Path): directory of the block files, None for blocks in memory.
+    """
+
+    # Makes the operators of Array return NotImplemented for a ChunkedArray,
+    # so that e.g. Array + ChunkedArray runs ChunkedArray.__radd__
+    __array_ufunc__ = None
+
+    def __init__(self, blocks, directory=None):
+        """Creates a chunked array from its blocks.
+
+        Use `from_array` or `from_iterable` to split data into blocks.
+
+        Args:
+            blocks (list): the blocks in order, Arrays or paths of Array files.
+                All blocks must have the same dtype and the same shape except
+                for the length of the first axis.
+            directory (str or pathlib.Path): directory of the block files, if any.
+
+        Raises:
+            ValueError: If there are no blocks or they do not fit together.
+        """
+        if not blocks:
+            raise ValueError("A ChunkedArray needs at least one block.")
+        self._blocks = list(blocks)
+        self.directory = None if directory is None else Path(directory)
+        self._cleanup = None
+
+        lengths = []
+        for i, block in enumerate(self._blocks):
+            array = self._block(i)
+            if i == 0:
+                trailing, self.dtype = array.shape[1:], array.dtype
+            elif array.shape[1:] != trailing or array.dtype != self.dtype:
+                raise ValueError("All blocks must have the same dtype and trailing shape.")
+            lengths.append(array.shape[0])
+        self._lengths = lengths
+        self.shape = (sum(lengths),) + trailing
+
+    @classmethod
+    def from_array(cls, array, chunk_rows, directory=None):
+        """Splits an Array into blocks of chunk_rows rows.
+
+        Args:
+            array (Array): the array to split.
+            chunk_rows (int): the number of rows per block (the last block may be shorter).
+            directory (str or pathlib.Path): if given, the blocks are saved to
+                files in this directory instead of kept in memory.
+
+        Returns:
+            ChunkedArray: the chunked array.
+        """
+        blocks = (array[start: start + chunk_rows] for start in range(0, max(len(array), 1), chunk_rows))
+        return cls._from_blocks(blocks, directory)
+
+    @classmethod
+    def from_iterable(cls, shape, values, chunk_rows, directory=None):
+        """Creates a chunked array from an iterable, one block at a time.
+
+        Only one block of values is held in memory at a time, so with a
+        directory the values may be larger than memory.
+
+        Args:
+            shape (tuple): shape of the whole array.
+            values (iterable): the elements in row-major order, all of type int, float or bool.
+            chunk_rows (int): the number of rows per block.
+            directory (str or pathlib.Path): if given, the blocks are saved to files in this directory.
+
+        Returns:
+            ChunkedArray: the chunked array.
+
+        Raises:
+            ValueError: If the number of values does not fit with the shape.
+        """
+        values = iter(values)
+        row_size = prod(shape[1:])
+
+        def blocks():
+            for start in range(0, shape[0], chunk_rows):
+                rows = min(chunk_rows, shape[0] - start)
+                yield Array.from_iterable((rows,) + shape[1:], islice(values, rows*row_size))
+            if next(values, _END) is not _END:
+                raise ValueError("The number of values does not fit with the shape.")
+
+        return cls._from_blocks(blocks(), directory)
+
+    @classmethod
+    def _from_blocks(cls, blocks, directory=None):
+        """Creates a chunked array from an iterable of Arrays, saving each
+        block to a file in directory as soon as it is produced, if given."""
+        if directory is None:
+            return cls(list(blocks))
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for i, block in enumerate(blocks):
+            path = directory / f"block-{i:06d}.bin"
+            block.save(path)
+            paths.append(path)
+        return cls(paths, directory)
+
+    def _block(self, i):
+        """Returns block i as an Array, memory-mapping it if it is a file."""
+        block = self._blocks[i]
+        return block if isinstance(block, Array) else Array.load(block, mmap=True)
+
+    def iter_blocks(self):
+        """Yields the blocks as Arrays, in order. Blocks on disk are memory-mapped and read-only."""
+        for i in range(len(self._blocks)):
+            yield self._block(i)
+
+    @property
+    def chunks(self):
+        """tuple: The number of rows of each block."""
+        return tuple(self._lengths)
+
+    @property
+    def ndim(self):
+        """int: The number of dimensions."""
+        return len(self.shape)
+
+    @property
+    def size(self):
+        """int: The number of elements."""
+        return prod(self.shape)
+
+    def __len__(self):
+        """Returns the length of the first axis."""
+        return self.shape[0]
+
+    def _rows(self, start, stop):
+        """Returns rows start to stop of the array as an Array.
+
+        A range that lies within one block is a view of it, otherwise the
+        rows of the overlapping blocks are copied together.
+        """
+        pieces = []
+        block_start = 0
+        for block, length in zip(self.iter_blocks(), self._lengths):
+            block_stop = block_start + length
+            if block_start < stop and start < block_stop:
+                pieces.append(block[max(start - block_start, 0): min(stop, block_stop) - block_start])
+            block_start = block_stop
+        if len(pieces) == 1:
+            return pieces[0]
+        values = chain.from_iterable(piece._flat() for piece in pieces)
+        return Array.from_iterable((stop - start,) + self.shape[1:], values, self.dtype)
+
+    def _map_blocks(self, function, other=None):
+        """Applies function(block, other_part) to every block and collects the results.
+
+        Args:
+            function (callable): takes an Array block and the matching part of
+                other, and returns an Array with the same number of rows.
+            other: a number, an Array broadcast against every block, an Array
+                with one row per row of this array, or a ChunkedArray of the same shape.
+
+        Returns:
+            ChunkedArray: the results, with the same chunks as this array.
+        """
+        def results():
+            start = 0
+            for block, length in zip(self.iter_blocks(), self._lengths):
+                if isinstance(other, ChunkedArray):
+                    part = other._rows(start, start + length)
+                elif isinstance(other, Array) and other.ndim == self.ndim and other.shape[0] != 1:
+                    part = other[start: start + length]
+                else:
+                    part = other
+                yield function(block, part)
+                start += length
+
+        if self.directory is None:
+            return ChunkedArray._from_blocks(results())
+        directory = tempfile.mkdtemp(prefix="chunked-array-")
+        try:
+            result = ChunkedArray._from_blocks(results(), directory)
+        except BaseException:
+            shutil.rmtree(directory, ignore_errors=True)
+            raise
+        result._cleanup = weakref.finalize(result, shutil.rmtree, directory, ignore_errors=True)
+        return result
+
+    def close(self):
+        """Removes the temporary directory of the blocks, if this array owns one.
+
+        Only results of operations own their directory, the files of an
+        array made with `from_array` or `from_iterable` are left alone.
+        The array cannot be used after closing it.
+        """
+        if self._cleanup is not None:
+            self._cleanup()
+
+    def __enter__(self):
+        """Returns the array, which is closed at the end of the with block."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Closes the array, see `close`."""
+        self.close()
+
+    def _check_other(self, other):
+        """Checks that other can be combined with this array block by block.
+
+        Raises:
+            ValueError: If the shapes cannot be broadcast to the shape of this array.
+        """
+        if isinstance(other, (Array, ChunkedArray)):
+            if _broadcast_shapes(self.shape, other.shape) != self.shape:
+                raise ValueError(f"Shape {other.shape} cannot be broadcast to the chunked shape {self.shape}.")
+
+    def __add__(self, other):
+        """Element-wise adds a ChunkedArray, Array or number, block by block, see `Array.__add__`."""
+        self._check_other(other)
+        return self._map_blocks(lambda block, part: block + part, other)
+
+    def __radd__(self, other):
+        """Element-wise adds this array to a number or Array, see `Array.__radd__`."""
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        """Element-wise subtracts a ChunkedArray, Array or number, block by block, see `Array.__sub__`."""
+        self._check_other(other)
+        return self._map_blocks(lambda block, part: block - part, other)
+
+    def __rsub__(self, other):
+        """Element-wise subtracts this array from a number or Array, see `Array.__rsub__`."""
+        self._check_other(other)
+        return self._map_blocks(lambda block, part: part - block, other)
+
+    def __mul__(self, other):
+        """Element-wise multiplies with a ChunkedArray, Array or number, block by block, see `Array.__mul__`."""
+        self._check_other(other)
+        return self._map_blocks(lambda block, part: block*part, other)
+
+    def __rmul__(self, other):
+        """Element-wise multiplies a number or Array with this array, see `Array.__rmul__`."""
+        return self.__mul__(other)
+
+    def is_equal(self, other):
+        """Compares element-wise with a ChunkedArray, Array or number, see `Array.is_equal`.
+
+        Returns:
+            ChunkedArray: boolean chunked array.
+        """
+        self._check_other(other)
+        return self._map_blocks(lambda block, part: block.is_equal(part), other)
+
+    def __eq__(self, other):
+        """Compares with another ChunkedArray or an Array, block by block, see `Array.__eq__`."""
+        if not isinstance(other, (Array, ChunkedArray)) or other.shape != self.shape:
+            return False
+        start = 0
+        for block, length in zip(self.iter_blocks(), self._lengths):
+            part = other._rows(start, start + length) if isinstance(other, ChunkedArray) \
+                else other[start: start + length]
+            if not block == part:
+                return False
+            start += length
+        return True
+
+    def min_element(self):
+        """Returns the smallest value, reducing one block at a time, see `Array.min_element`."""
+        return float(_min([block.min() for block in self.iter_blocks()]))
+
+    def mean_element(self):
+        """Returns the mean value, see `Array.mean_element`.
+
+        The moments of the blocks are merged with the pairwise update of
+        Chan et al. (see _Moments), so the mean is accurate even for very
+        long series.
+        """
+        return self._moments().mean
+
+    def sum(self):
+        """Returns the sum of all elements, see `Array.sum`."""
+        return sum(block.sum() for block in self.iter_blocks())
+
+    def _moments(self):
+        """Returns the merged _Moments of all blocks."""
+        if self.dtype == "bool":
+            raise NotImplementedError("This method is not implemented for a boolean Array.")
+        moments = _Moments()
+        for block in self.iter_blocks():
+            moments.merge(_Moments(block._flat()))
+        return moments
+
+    def to_array(self):
+        """Returns all blocks joined into one Array in memory."""
+        if len(self._blocks) == 1:
+            return self._block(0).copy()
+        return self._rows(0, self.shape[0])
+
+    def __repr__(self):
+        """Returns a short description, without the elements."""
+        where = "in memory" if self.directory is None else f"in {self.directory}"
+        return f"ChunkedArray(shape={self.shape}, dtype={self.dtype}, chunks={len(self._blocks)} {where})"
@@ -0,0 +1,14 @@
+import pytest
+
+from array_class import Array
+
+
+@pytest.fixture(autouse=True, params=["python", "numpy"])
+def backend(request):
+    """Runs every test with each computation backend of Array"""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    previous = Array.get_backend()
+    Array.set_backend(request.param)
+    yield request.param
+    Array.set_backend(previous)
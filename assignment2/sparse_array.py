@@ -0,0 +1,599 @@
+"""Sparse Array class for assignment 2, for arrays that are mostly zeros"""
+
+import operator
+from functools import partial
+from itertools import accumulate, chain, compress
+from math import nan, prod, sqrt
+
+from array_class import Array, _broadcast_shapes, _buffer, _check_dtype, _check_shape, _KINDS, _result_dtype, \
+    _sum_dtype, _zeros
+
+
+def _sum(values, n, zero):
+    """Returns the sum of a line with n elements, of which values are the stored ones."""
+    return sum(values, zero)
+
+
+def _min(values, n, zero):
+    """Returns the smallest element of a line, counting the zeros that are not stored."""
+    return min(values) if len(values) == n else min(chain(values, (zero,)))
+
+
+def _max(values, n, zero):
+    """Returns the largest element of a line, counting the zeros that are not stored."""
+    return max(values) if len(values) == n else max(chain(values, (zero,)))
+
+
+def _mean(values, n, zero):
+    """Returns the mean of a line, counting the zeros that are not stored."""
+    return sum(values, 0.0)/n
+
+
+def _var(values, n, zero, ddof=0):
+    """Returns the variance of a line, counting the zeros that are not stored.
+
+    Every zero deviates from the mean by the mean, so the squared deviations
+    of the zeros add up to (n - len(values))*mean**2.
+    """
+    if n <= ddof:
+        return nan
+    mean = sum(values, 0.0)/n
+    m2 = sum((value - mean)**2 for value in values) + (n - len(values))*mean*mean
+    return m2/(n - ddof)
+
+
+def _std(values, n, zero, ddof=0):
+    """Returns the standard deviation of a line, see _var."""
+    return sqrt(_var(values, n, zero, ddof))
+
+
+def _count_nonzero(values, n, zero):
+    """Returns the number of nonzero elements of a line."""
+    return sum(map(bool, values))
+
+
+def _any(values, n, zero):
+    """Returns True if any element of a line is nonzero."""
+    return any(values)
+
+
+def _all(values, n, zero):
+    """Returns True if every element of a line is stored and nonzero."""
+    return len(values) == n and all(values)
+
+
+class SparseArray:
+    """A 2D array that only stores its nonzero elements, in compressed sparse
+    row (CSR) format.
+
+    The column indices of the nonzero elements of row i are
+    `indices[indptr[i]:indptr[i+1]]`, in increasing order, and `data` holds
+    their values in the same order. Zeros are not stored, so the memory and
+    the time of most operations grow with the number of nonzeros (nnz)
+    instead of the size: multiplying only touches the nonzeros, adding two
+    sparse arrays merges their nonzeros row by row, and the reductions
+    account for the zeros that are not stored arithmetically.
+
+    The arithmetic operators, `is_equal`, `==`, `@` and the reductions
+    behave like those of Array. Results that are mostly nonzero (adding a
+    nonzero number or a dense Array, element-wise comparison, a product with
+    a dense matrix) are dense Arrays, the others SparseArrays.
+
+    Attributes:
+        shape (tuple): shape (rows, columns).
+        dtype (str): dtype of the elements.
+        data (memoryview): the stored values, row by row.
+        indices (memoryview): the column index of each stored value.
+        indptr (memoryview): where the values of each row start in data, followed by nnz.
+    """
+
+    # Makes the operators of Array return NotImplemented for a SparseArray,
+    # so that e.g. Array + SparseArray runs SparseArray.__radd__
+    __array_ufunc__ = None
+
+    def __init__(self, shape, data, indices, indptr, dtype=None):
+        """Creates a sparse array from its CSR components.
+
+        Use `from_array` or `from_coo` to build one from a dense Array or from
+        (row, column, value) triplets.
+
+        Args:
+            shape (tuple): shape (rows, columns).
+            data (iterable): the stored values, row by row.
+            indices (iterable): the column index of each value, increasing within each row.
+            indptr (iterable): rows + 1 offsets into data, starting at 0 and ending at len(data).
+            dtype (str): dtype of the values, see `Array`. Taken from the values if not given.
+
+        Raises:
+            TypeError: If shape or the values are of the wrong type.
+            ValueError: If shape is not 2D or the components do not fit together.
+        """
+        _check_shape(shape)
+        if len(shape) != 2:
+            raise ValueError("A SparseArray must be 2D.")
+        data = list(data)
+        values = Array.from_iterable((len(data),), data, dtype)
+        indices = _buffer("int64", indices)
+        indptr = _buffer("int64", indptr)
+
+        if len(indptr) != shape[0] + 1 or indptr[0] != 0 or indptr[-1] != len(data) or len(indices) != len(data):
+            raise ValueError("indptr must have one offset per row and the end, and fit with data and indices.")
+        for start, stop in zip(indptr, indptr[1:]):
+            row = indices[start:stop]
+            if start > stop or any(map(operator.ge, row, row[1:])) or (row and not 0 <= row[0] <= row[-1] < shape[1]):
+                raise ValueError("The column indices of each row must be increasing and within the shape.")
+
+        self.shape = shape
+        self.dtype = values.dtype
+        self.data = values._data
+        self.indices = indices
+        self.indptr = indptr
+
+    @classmethod
+    def _from_csr(cls, shape, dtype, data, indices, indptr):
+        """Creates a sparse array around CSR buffers without any checks, see `Array._from_buffer`."""
+        new = cls.__new__(cls)
+        new.shape = shape
+        new.dtype = dtype
+        new.data = data
+        new.indices = indices
+        new.indptr = indptr
+        return new
+
+    @classmethod
+    def _from_rows(cls, shape, dtype, rows):
+        """Creates a sparse array from an iterable of (columns, values) lists,
+        one pair per row with increasing columns. Zero values are dropped."""
+        indices, data, indptr = [], [], [0]
+        for columns, values in rows:
+            indices += compress(columns, values)
+            data += compress(values, values)
+            indptr.append(len(data))
+        return cls._from_csr(shape, dtype, _buffer(dtype, data), _buffer("int64", indices), _buffer("int64", indptr))
+
+    @classmethod
+    def from_array(cls, array):
+        """Converts a dense 2D Array, storing only its nonzero elements.
+
+        Args:
+            array (Array): the array to convert.
+
+        Returns:
+            SparseArray: the sparse array.
+
+        Raises:
+            ValueError: If the array is not 2D.
+        """
+        if array.ndim != 2:
+            raise ValueError("A SparseArray must be 2D.")
+        columns = range(array.shape[1])
+
+        def rows():
+            for line in array._lines():
+                values = line if isinstance(line, memoryview) else list(line)
+                yield columns, values
+
+        return cls._from_rows(array.shape, array.dtype, rows())
+
+    @classmethod
+    def from_coo(cls, shape, rows, columns, values, dtype=None):
+        """Creates a sparse array from coordinate (COO) triplets.
+
+        Values given more than once for the same position are added together
+        (or-ed for bools).
+
+        Args:
+            shape (tuple): shape (rows, columns).
+            rows (iterable): the row index of each value.
+            columns (iterable): the column index of each value.
+            values (iterable): the values.
+            dtype (str): dtype of the values, see `Array`. Taken from the values if not given.
+
+        Returns:
+            SparseArray: the sparse array.
+
+        Raises:
+            IndexError: If a position is outside the shape.
+            ValueError: If rows, columns and values differ in length.
+        """
+        _check_shape(shape)
+        if len(shape) != 2:
+            raise ValueError("A SparseArray must be 2D.")
+        rows, columns, values = list(rows), list(columns), list(values)
+        if not len(rows) == len(columns) == len(values):
+            raise ValueError("rows, columns and values must have the same length.")
+
+        entries = {}
+        for i, j, value in zip(rows, columns, values):
+            if not (0 <= i < shape[0] and 0 <= j < shape[1]):
+                raise IndexError(f"Position ({i}, {j}) is out of range for shape {shape}.")
+            if (i, j) in entries:
+                value = (entries[i, j] or value) if type(value) is bool else entries[i, j] + value
+            entries[i, j] = value
+
+        positions = sorted(entries)
+        counts = [0]*(shape[0] + 1)
+        for i, _ in positions:
+            counts[i + 1] += 1
+        return cls(shape, map(entries.__getitem__, positions), (j for _, j in positions), accumulate(counts), dtype)
+
+    def to_array(self):
+        """Returns the array as a dense Array, zeros included."""
+        columns = self.shape[1]
+        data = _zeros(self.dtype, self.size)
+        for i, (row_columns, values) in enumerate(self._rows()):
+            base = i*columns
+            for j, value in zip(row_columns, values):
+                data[base + j] = value
+        return Array._from_buffer(self.shape, self.dtype, data)
+
+    def _rows(self):
+        """Yields the column indices and the values stored in each row, as views."""
+        indptr = self.indptr
+        for start, stop in zip(indptr, indptr[1:]):
+            yield self.indices[start:stop], self.data[start:stop]
+
+    def _zero(self):
+        """Returns the zero of the dtype: False, 0 or 0.0."""
+        return {"b": False, "i": 0, "f": 0.0}[_KINDS[self.dtype]]
+
+    @property
+    def ndim(self):
+        """int: The number of dimensions, always 2."""
+        return 2
+
+    @property
+    def size(self):
+        """int: The number of elements, zeros included."""
+        return prod(self.shape)
+
+    @property
+    def nnz(self):
+        """int: The number of stored (nonzero) elements."""
+        return len(self.data)
+
+    @property
+    def density(self):
+        """float: The fraction of the elements that are stored."""
+        return self.nnz/self.size if self.size else 0.0
+
+    @property
+    def nbytes(self):
+        """int: The number of bytes of the stored values and their indices."""
+        return self.data.nbytes + self.indices.nbytes + self.indptr.nbytes
+
+    def __len__(self):
+        """Returns the number of rows."""
+        return self.shape[0]
+
+    @property
+    def T(self):
+        """SparseArray: The transposed array, in a new CSR structure."""
+        rows, columns = self.shape
+        counts = [0]*(columns + 1)
+        for j in self.indices:
+            counts[j + 1] += 1
+        indptr = list(accumulate(counts))
+        positions = indptr[:-1]
+        indices = [0]*self.nnz
+        data = [self._zero()]*self.nnz
+        for i, (row_columns, values) in enumerate(self._rows()):
+            for j, value in zip(row_columns, values):
+                indices[positions[j]] = i
+                data[positions[j]] = value
+                positions[j] += 1
+        return SparseArray._from_csr((columns, rows), self.dtype, _buffer(self.dtype, data),
+                                     _buffer("int64", indices), _buffer("int64", indptr))
+
+    def copy(self):
+        """Returns a copy with its own buffers."""
+        return SparseArray._from_csr(self.shape, self.dtype, _buffer(self.dtype, self.data),
+                                     _buffer("int64", self.indices), _buffer("int64", self.indptr))
+
+    def astype(self, dtype):
+        """Returns a copy with the values converted to dtype, see `Array.astype`."""
+        _check_dtype(dtype)
+        values = Array._from_buffer((self.nnz,), self.dtype, self.data).astype(dtype)
+        return SparseArray._from_csr(self.shape, dtype, values._data,
+                                     _buffer("int64", self.indices), _buffer("int64", self.indptr))
+
+    def _result_dtype(self, other):
+        """Returns the dtype of an arithmetic result with other, see `Array._arithmetic`.
+
+        Raises:
+            NotImplementedError: if either operand is boolean or `other` is of an unsupported type.
+            ValueError: if other is an array whose shape cannot be broadcast to the shape of this array.
+        """
+        if self.dtype == "bool":
+            raise NotImplementedError("This method is not implemented for a boolean Array.")
+        if isinstance(other, (Array, SparseArray)):
+            if other.dtype == "bool":
+                raise NotImplementedError("The method does not support given value types.")
+            if _broadcast_shapes(self.shape, other.shape) != self.shape or \
+                    (isinstance(other, SparseArray) and other.shape != self.shape):
+                raise ValueError(f"Shape {other.shape} does not match the sparse shape {self.shape}.")
+            return _result_dtype(self.dtype, other.dtype)
+        if type(other) in (int, float):
+            return _result_dtype(self.dtype, scalars=(other,))
+        raise NotImplementedError("The method does not support given value types.")
+
+    def _merge(self, other, op, dtype):
+        """Applies op to the elements of two sparse arrays where either has a nonzero."""
+        def rows():
+            for (a_columns, a_values), (b_columns, b_values) in zip(self._rows(), other._rows()):
+                row = dict(zip(a_columns, a_values))
+                for j, value in zip(b_columns, b_values):
+                    row[j] = op(row.get(j, 0), value)
+                columns = sorted(row)
+                yield columns, list(map(row.__getitem__, columns))
+
+        return SparseArray._from_rows(self.shape, dtype, rows())
+
+    def _scatter(self, dense, op):
+        """Applies op(element, value) to the elements of a new, contiguous
+        dense Array at the nonzeros of this array, and returns it.
+
+        Raises:
+            OverflowError: If an int result does not fit in the dtype of dense.
+        """
+        data, columns = dense._data, self.shape[1]
+        for i, (row_columns, values) in enumerate(self._rows()):
+            base = i*columns
+            for j, value in zip(row_columns, values):
+                try:
+                    data[base + j] = op(data[base + j], value)
+                except ValueError:
+                    raise OverflowError(f"A result does not fit in {dense.dtype}.") from None
+        return dense
+
+    def __add__(self, other):
+        """Element-wise adds a SparseArray, Array or number, see `Array.__add__`.
+
+        Returns:
+            SparseArray for a SparseArray or 0, otherwise a dense Array.
+        """
+        dtype = self._result_dtype(other)
+        if isinstance(other, SparseArray):
+            return self._merge(other, operator.add, dtype)
+        if isinstance(other, Array):
+            return self._scatter(other.broadcast_to(self.shape).astype(dtype), operator.add)
+        if other == 0:
+            return self.astype(dtype)
+        return self.to_array() + other
+
+    def __radd__(self, other):
+        """Element-wise adds this array to a number or Array, see `Array.__radd__`."""
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        """Element-wise subtracts a SparseArray, Array or number, see `Array.__sub__`.
+
+        Returns:
+            SparseArray for a SparseArray or 0, otherwise a dense Array.
+        """
+        dtype = self._result_dtype(other)
+        if isinstance(other, SparseArray):
+            return self._merge(other, operator.sub, dtype)
+        if isinstance(other, Array):
+            return self._scatter((0 - other).broadcast_to(self.shape).astype(dtype), operator.add)
+        if other == 0:
+            return self.astype(dtype)
+        return self.to_array() - other
+
+    def __rsub__(self, other):
+        """Element-wise subtracts this array from a number or Array, see `Array.__rsub__`."""
+        dtype = self._result_dtype(other)
+        if isinstance(other, Array):
+            return self._scatter(other.broadcast_to(self.shape).astype(dtype), operator.sub)
+        if other == 0:
+            return (self*-1).astype(dtype)
+        return other - self.to_array()
+
+    def __mul__(self, other):
+        """Element-wise multiplies with a SparseArray, Array or number, see `Array.__mul__`.
+
+        Only the nonzeros of this array are multiplied, so the result is
+        always a SparseArray.
+        """
+        dtype = self._result_dtype(other)
+        if isinstance(other, SparseArray):
+            def rows():
+                for (a_columns, a_values), (b_columns, b_values) in zip(self._rows(), other._rows()):
+                    b_row = dict(zip(b_columns, b_values))
+                    columns = list(filter(b_row.__contains__, a_columns))
+                    a_row = dict(zip(a_columns, a_values))
+                    yield columns, [a_row[j]*b_row[j] for j in columns]
+        elif isinstance(other, Array):
+            other = other.broadcast_to(self.shape)
+            row_step, column_step = other.strides
+
+            def rows():
+                for i, (columns, values) in enumerate(self._rows()):
+                    base = other._offset + i*row_step
+                    positions = map(partial(operator.add, base), map(partial(operator.mul, column_step), columns))
+                    yield columns, list(map(operator.mul, values, map(other._data.__getitem__, positions)))
+        else:
+            def rows():
+                for columns, values in self._rows():
+                    yield columns, list(map(partial(operator.mul, other), values))
+
+        return SparseArray._from_rows(self.shape, dtype, rows())
+
+    def __rmul__(self, other):
+        """Element-wise multiplies a number or Array with this array, see `Array.__rmul__`."""
+        return self.__mul__(other)
+
+    def __matmul__(self, other):
+        """Matrix multiplication with a SparseArray or a 1D or 2D Array, see `Array.__matmul__`.
+
+        Every stored value of row i of this array scales a row of other,
+        and these are summed, so zeros are skipped.
+
+        Returns:
+            SparseArray for a SparseArray, otherwise a dense Array.
+
+        Raises:
+            NotImplementedError: if either array is boolean or `other` is not an array.
+            ValueError: if the inner dimensions differ.
+        """
+        if self.dtype == "bool" or not isinstance(other, (Array, SparseArray)) or other.dtype == "bool":
+            raise NotImplementedError("The method does not support given value types.")
+        if other.ndim > 2 or self.shape[1] != other.shape[0]:
+            raise ValueError(f"Shapes {self.shape} and {other.shape} are not aligned for matrix multiplication.")
+        dtype = _result_dtype(self.dtype, other.dtype)
+
+        if isinstance(other, SparseArray):
+            other_rows = list(other._rows())
+
+            def rows():
+                for columns, values in self._rows():
+                    row = {}
+                    for k, value in zip(columns, values):
+                        for j, other_value in zip(*other_rows[k]):
+                            row[j] = row.get(j, 0) + value*other_value
+                    row_columns = sorted(row)
+                    yield row_columns, list(map(row.__getitem__, row_columns))
+
+            return SparseArray._from_rows((self.shape[0], other.shape[1]), dtype, rows())
+
+        right = other if other.ndim == 2 else other.reshape(-1, 1)
+        other_rows = [list(line) for line in right._lines()]
+        width = right.shape[1]
+
+        def results():
+            for columns, values in self._rows():
+                row = [0]*width
+                for k, value in zip(columns, values):
+                    row = list(map(operator.add, row, map(partial(operator.mul, value), other_rows[k])))
+                yield from row
+
+        result = Array._from_buffer((self.shape[0], width), dtype, _buffer(dtype, results()))
+        return result if other.ndim == 2 else result.reshape(self.shape[0])
+
+    def __rmatmul__(self, other):
+        """Matrix multiplication of a 1D or 2D Array with this array, computed as (self.T @ other.T).T."""
+        if not isinstance(other, Array):
+            return NotImplemented
+        if other.ndim == 1:
+            return self.T @ other
+        return (self.T @ other.T).T.copy()
+
+    def dot(self, other):
+        """Returns the matrix product self @ other, see `__matmul__`."""
+        return self @ other
+
+    def is_equal(self, other):
+        """Compares element-wise with a SparseArray, Array or number, see `Array.is_equal`.
+
+        Returns:
+            Array: dense boolean array, as the zeros of both arrays compare equal.
+        """
+        if isinstance(other, SparseArray):
+            other = other.to_array()
+        return self.to_array().is_equal(other)
+
+    def __eq__(self, other):
+        """Compares with a SparseArray or Array, see `Array.__eq__`.
+
+        Two sparse arrays are compared by their nonzeros, row by row.
+        """
+        if isinstance(other, Array):
+            return other.shape == self.shape and self.to_array() == other
+        if not isinstance(other, SparseArray) or other.shape != self.shape:
+            return False
+        for (a_columns, a_values), (b_columns, b_values) in zip(self._rows(), other._rows()):
+            a_row = {j: value for j, value in zip(a_columns, a_values) if value}
+            b_row = {j: value for j, value in zip(b_columns, b_values) if value}
+            if a_row != b_row:
+                return False
+        return True
+
+    def _check_reduce(self, axis, logical=False):
+        """Checks that the array can be reduced along axis, see `Array._check_reduce`."""
+        if self.dtype == "bool" and not logical:
+            raise NotImplementedError("This method is not implemented for a boolean Array.")
+        if axis is not None:
+            if type(axis) is not int or not -2 <= axis < 2:
+                raise ValueError(f"axis {axis} is out of bounds for an array with 2 dimension(s).")
+            axis %= 2
+        if self.size == 0 and not logical:
+            raise ValueError("Cannot reduce an empty array.")
+        return axis
+
+    def _reduce(self, reducer, axis, dtype, logical=False, **kwargs):
+        """Reduces all elements (axis None) or the rows (axis 1) or columns (axis 0).
+
+        Args:
+            reducer (callable): function(values, n, zero, **kwargs) of the
+                stored values of a line of n elements and the zero of the dtype.
+            axis (int): axis to reduce along, or None.
+            dtype (str): dtype of the result Array if axis is given.
+            logical (bool): True for count_nonzero, any and all.
+
+        Returns:
+            The reduced value if axis is None, otherwise a 1D Array.
+        """
+        axis = self._check_reduce(axis, logical)
+        zero = self._zero()
+        if axis is None:
+            return reducer(self.data, self.size, zero, **kwargs)
+        lines = self._rows() if axis == 1 else self.T._rows()
+        n = self.shape[axis]
+        values = (reducer(line_values, n, zero, **kwargs) for _, line_values in lines)
+        return Array._from_buffer((self.shape[1 - axis],), dtype, _buffer(dtype, values))
+
+    def sum(self, axis=None):
+        """Returns the sum of the elements, see `Array.sum`."""
+        return self._reduce(_sum, axis, _sum_dtype(self.dtype))
+
+    def min(self, axis=None):
+        """Returns the smallest element, see `Array.min`."""
+        return self._reduce(_min, axis, self.dtype)
+
+    def max(self, axis=None):
+        """Returns the largest element, see `Array.max`."""
+        return self._reduce(_max, axis, self.dtype)
+
+    def argmin(self, axis=None):
+        """Returns the index of the smallest element, see `Array.argmin`. Converts to a dense Array."""
+        return self.to_array().argmin(axis)
+
+    def argmax(self, axis=None):
+        """Returns the index of the largest element, see `Array.argmax`. Converts to a dense Array."""
+        return self.to_array().argmax(axis)
+
+    def count_nonzero(self, axis=None):
+        """Returns the number of nonzero elements, see `Array.count_nonzero`."""
+        return self._reduce(_count_nonzero, axis, "int64", logical=True)
+
+    def any(self, axis=None):
+        """Returns True if any element is nonzero, see `Array.any`."""
+        return self._reduce(_any, axis, "bool", logical=True)
+
+    def all(self, axis=None):
+        """Returns True if every element is nonzero, see `Array.all`."""
+        return self._reduce(_all, axis, "bool", logical=True)
+
+    def mean(self, axis=None):
+        """Returns the mean of the elements, see `Array.mean`."""
+        return self._reduce(_mean, axis, "float64")
+
+    def var(self, axis=None, ddof=0):
+        """Returns the variance of the elements, see `Array.var`."""
+        return self._reduce(_var, axis, "float64", ddof=ddof)
+
+    def std(self, axis=None, ddof=0):
+        """Returns the standard deviation of the elements, see `Array.std`."""
+        return self._reduce(_std, axis, "float64", ddof=ddof)
+
+    def min_element(self):
+        """Returns the smallest value as a float, see `Array.min_element`."""
+        return float(self.min())
+
+    def mean_element(self):
+        """Returns the mean value, see `Array.mean_element`."""
+        return self.mean()
+
+    def __repr__(self):
+        """Returns a short description, without the elements."""
+        return f"SparseArray(shape={self.shape}, dtype={self.dtype}, nnz={self.nnz})"
@@ -5,7 +5,8 @@
 
 # Task 4:Unit Tests for 1D Arrays (4 points)
 
-from array_class import Array
+from array_class import Array, LazyArray
+from math import isnan
 import pytest
 
 int_array = Array((5,), 1,2,3,4,5)
@@ -180,6 +181,690 @@ def test_mean_2d():
     with pytest.raises(NotImplementedError):
         bool_array_2d.mean_element()
 
+# Typed storage
+
+def test_storage():
+    """Checks that the values are kept in a flat typed buffer and that the
+    nested list is only built on request.
+    """
+    assert int_array.dtype == 'int64'
+    assert float_array_2d.dtype == 'float64'
+    assert bool_array_2d.dtype == 'bool'
+    assert int_array_2d.strides == (2, 1)
+    assert int_array.nbytes == 5*8
+    assert bool_array_2d.nbytes == 6
+    assert int_array_2d.values == [[1,2],[3,4]]
+    assert bool_array_2d[1, 0] == True
+    assert int_array[1] == 2
+    assert int_array_2d.flatten2d() == [1,2,3,4]
+    with pytest.raises(OverflowError):
+        Array((1,), 2**63)
+
+def test_from_buffer():
+    """Checks the trusted constructor used by the operators: it shares the
+    buffer it is given and the operator results get the right dtype.
+    """
+    a = Array._from_buffer((2,2), int_array_2d.dtype, int_array_2d._data)
+    assert a == int_array_2d
+    assert a._data is int_array_2d._data
+    assert (int_array_2d + 1).dtype == 'int64'
+    assert (int_array_2d * 0.5).dtype == 'float64'
+    assert (int_array - float_array).dtype == 'float64'
+    assert int_array.is_equal(3).dtype == 'bool'
+    assert 10 - int_array_2d == Array((2,2), 9,8,7,6)
+
+# N-dimensional arrays and views
+
+int_array_3d = Array((2,3,2), *range(12))
+
+def test_nd():
+    """Checks shapes with more than two dimensions."""
+    assert int_array_3d.ndim == 3
+    assert int_array_3d.strides == (6, 2, 1)
+    assert int_array_3d.values == [[[0,1],[2,3],[4,5]], [[6,7],[8,9],[10,11]]]
+    assert int_array_3d[1, 2, 0] == 10
+    assert int_array_3d + int_array_3d == Array((2,3,2), *range(0, 24, 2))
+    assert int_array_3d.mean_element() == 5.5
+    with pytest.raises(ValueError):
+        Array((2,-1), 1)
+    with pytest.raises(TypeError):
+        Array((), 1)
+
+def test_views():
+    """Checks that slicing, reshape and transpose share the buffer of the
+    original array instead of copying it.
+    """
+    row = int_array_2d[1]
+    assert row == Array((2,), 3,4)
+    assert row._data is int_array_2d._data
+    assert int_array[1:4] == Array((3,), 2,3,4)
+    assert int_array[::-2] == Array((3,), 5,3,1)
+    assert int_array_2d[:, 1] == Array((2,), 2,4)
+    assert int_array_3d[:, 1:, ::-1][1].values == [[9,8],[11,10]]
+
+    reshaped = int_array_3d.reshape(3, -1)
+    assert reshaped.shape == (3, 4)
+    assert reshaped._data is int_array_3d._data
+    assert reshaped.values == [[0,1,2,3],[4,5,6,7],[8,9,10,11]]
+    assert int_array_3d.ravel()._data is int_array_3d._data
+
+    transposed = int_array_2d.T
+    assert transposed._data is int_array_2d._data
+    assert transposed == Array((2,2), 1,3,2,4)
+    assert transposed + int_array_2d == Array((2,2), 2,5,5,8)
+    assert transposed.reshape(4) == Array((4,), 1,3,2,4)
+    assert int_array_3d.transpose(1, 0, 2).shape == (3, 2, 2)
+    assert int_array_3d.transpose(1, 0, 2)[2].values == [[4,5],[10,11]]
+
+    with pytest.raises(IndexError):
+        int_array[5]
+    with pytest.raises(IndexError):
+        int_array[0, 0]
+    with pytest.raises(ValueError):
+        int_array_3d.reshape(5, -1)
+    with pytest.raises(ValueError):
+        int_array_3d.transpose(0, 0, 1)
+
+def test_broadcast():
+    """Checks NumPy-style broadcasting in the binary operators."""
+    row = Array((2,), 10,20)
+    column = Array((2,1), 1,2)
+    assert int_array_2d + row == Array((2,2), 11,22,13,24)
+    assert row - int_array_2d == Array((2,2), 9,18,7,16)
+    assert column * Array((1,3), 1,2,3) == Array((2,3), 1,2,3,2,4,6)
+    assert int_array_3d + Array((2,), 100,200) == Array((2,3,2), *[v + (100, 200)[v % 2] for v in range(12)])
+    assert int_array_2d.is_equal(Array((2,), 1,4)) == Array((2,2), True,False,False,True)
+
+    broadcast = row.broadcast_to((3,2))
+    assert broadcast.strides == (0, 1)
+    assert broadcast._data is row._data
+    assert broadcast.values == [[10,20],[10,20],[10,20]]
+
+    # copies of strided views are contiguous and have their own buffer
+    for view in (broadcast, int_array_3d[:, ::2, ::-1], int_array_3d.T, bool_array_2d.T, float_array[::-2]):
+        copy = view.copy()
+        assert copy == view and copy.values == view.values
+        assert copy._is_contiguous() and copy._data is not view._data
+    assert int_array_3d.T.reshape(-1).values == int_array_3d.T.copy()._flat().tolist()
+    assert int_array_3d.T == int_array_3d.T and int_array_3d.T != int_array_3d.transpose((2, 0, 1)).reshape(2, 3, 2)
+
+    with pytest.raises(ValueError):
+        int_array_2d + Array((3,), 1,2,3)
+    with pytest.raises(ValueError):
+        row.broadcast_to((2,3))
+
+def test_inplace():
+    """Checks that the in-place operators and `out=` write into the existing
+    buffer instead of allocating a new array.
+    """
+    a = Array((2,2), 1,2,3,4)
+    data = a._data
+    a += 1
+    a *= Array((2,), 2,3)
+    a -= Array((2,2), 1,1,1,1)
+    assert a == Array((2,2), 3,8,7,14)
+    assert a._data is data
+
+    b = Array((2,2), 0.0,0.0,0.0,0.0)
+    assert int_array_2d.__add__(0.5, out=b) is b
+    assert b == Array((2,2), 1.5,2.5,3.5,4.5)
+    int_array_2d.__mul__(int_array_2d, out=b)
+    assert b == Array((2,2), 1.0,4.0,9.0,16.0)
+    b.T.__sub__(b, out=b[::-1])
+    assert b == Array((2,2), -5.0,0.0,0.0,5.0)
+
+    # overlapping operands are read before they are overwritten
+    c = Array((2,2), 1,2,3,4)
+    c += c.T
+    assert c == Array((2,2), 2,5,5,8)
+    c -= c[0]
+    assert c == Array((2,2), 0,0,3,3)
+
+    with pytest.raises(TypeError):
+        c += 0.5
+    with pytest.raises(ValueError):
+        c += Array((3,), 1,2,3)
+    with pytest.raises(ValueError):
+        int_array_2d.__add__(1, out=Array((4,), 0,0,0,0))
+    with pytest.raises(ValueError):
+        int_array.__add__(1, out=Array((1,), 0).broadcast_to((5,)))
+    with pytest.raises(NotImplementedError):
+        bool_array.__iadd__(1)
+
+def test_reductions():
+    """Checks the reductions over all elements and along an axis."""
+    assert int_array.sum() == 15
+    assert int_array_2d.sum(axis=0) == Array((2,), 4,6)
+    assert int_array_2d.sum(axis=-1) == Array((2,), 3,7)
+    assert int_array_3d.max() == 11
+    assert int_array_3d.min(axis=1) == Array((2,2), 0,1,6,7)
+    assert float_array.argmin() == 0
+    assert Array((2,3), 3,1,2,0,5,0).argmin(axis=1) == Array((2,), 1,0)
+    assert Array((2,3), 3,1,2,0,5,0).argmax() == 4
+    assert int_array_2d.T.mean(axis=1) == Array((2,), 2.0,3.0)
+    assert int_array.var() == 2.0
+    assert int_array.var(ddof=1) == 2.5
+    assert int_array_2d.std(axis=0) == Array((2,), 1.0,1.0)
+    # The deviations from the chunk means keep the variance accurate for a large offset
+    assert Array((4,), 1e9+4, 1e9+7, 1e9+13, 1e9+16).var() == 22.5
+
+    stats = float_array.describe()
+    assert stats == {"count": 5, "mean": 2.0, "std": 0.4472135954999579, "var": 0.2,
+                     "min": 1.5, "max": 2.5}
+    stats = int_array_2d.describe(axis=0)
+    assert stats["count"] == 2
+    assert stats["mean"] == Array((2,), 2.0,3.0)
+    assert stats["max"] == Array((2,), 3,4)
+
+    # the same as the separate reductions, with every backend
+    a = Array((3,4), *[float(i*i % 7) - 2.5 for i in range(12)])
+    for axis in (None, 0, 1):
+        stats = a.describe(axis=axis, ddof=1)
+        for name, value in (("mean", a.mean(axis)), ("std", a.std(axis, ddof=1)), ("var", a.var(axis, ddof=1)),
+                            ("min", a.min(axis)), ("max", a.max(axis))):
+            if axis is None:
+                assert abs(stats[name] - value) < 1e-12
+            else:
+                assert stats[name].allclose(value, rtol=0, atol=1e-12)
+    assert int_array.describe()["min"] == 1 and isinstance(int_array.describe()["max"], int)
+
+    with pytest.raises(NotImplementedError):
+        bool_array.sum()
+    with pytest.raises(ValueError):
+        int_array_2d.sum(axis=2)
+    with pytest.raises(ValueError):
+        int_array[0:0].max()
+
+def test_backend():
+    """Checks backend selection and zero-copy interchange with NumPy."""
+    with pytest.raises(ValueError):
+        Array.set_backend('fortran')
+
+    np = pytest.importorskip('numpy')
+    nd = np.asarray(int_array_2d)
+    assert nd.tolist() == [[1,2],[3,4]]
+    assert np.shares_memory(nd, np.asarray(int_array_2d))
+    assert np.asarray(int_array_3d[:, ::2, ::-1]).tolist() == [[[1,0],[5,4]], [[7,6],[11,10]]]
+    assert np.asarray(bool_array).tolist() == [True,False,False,True,False]
+
+    source = np.arange(6.0).reshape(2, 3)
+    a = Array.from_numpy(source)
+    assert a == Array((2,3), 0.0,1.0,2.0,3.0,4.0,5.0)
+    source[0, 0] = 10.0
+    assert a[0, 0] == 10.0
+    assert Array.from_numpy(source.T) == a.T
+    assert (a + 1).dtype == 'float64'
+    with pytest.raises(TypeError):
+        Array.from_numpy(np.zeros(3, dtype=np.complex128))
+
+def test_overflow():
+    """Checks that int results that do not fit in their dtype raise an
+    OverflowError, for every int width and with every backend."""
+    for dtype, high in (('int8', 2**7 - 1), ('int16', 2**15 - 1), ('int32', 2**31 - 1), ('int64', 2**63 - 1)):
+        a = Array((2,), high, 1, dtype=dtype)
+        assert (a - 1)[0] == high - 1
+        assert (a - a)[0] == 0
+        with pytest.raises(OverflowError):
+            a + 1
+        with pytest.raises(OverflowError):
+            -1 - a*2
+        with pytest.raises(OverflowError):
+            a*a
+        with pytest.raises(OverflowError):
+            Array((2,), -high, high, dtype=dtype).diff()
+        with pytest.raises(OverflowError):
+            (a.lazy() + 1).compute()
+    with pytest.raises(OverflowError):
+        Array((3,), 2**40, 2**40, 1).cumprod()
+    with pytest.raises(OverflowError):
+        Array((2,), 2**62, 2**62).cumsum()
+    with pytest.raises(OverflowError):
+        Array((1,2), 2**62, 2**62) @ Array((2,1), 1, 1)
+    with pytest.raises(OverflowError):
+        Array((2,), 300, 1).astype('int8')
+    assert Array((2,), 2**62, 2**62).sum() == 2**63
+
+    # numbers outside the dtype are fine if the results fit
+    small = Array((2,), -100, -90, dtype='int8')
+    assert small + 200 == Array((2,), 100, 110) and (small + 200).dtype == 'int8'
+    assert 200 - Array((1,), 100, dtype='int8') == Array((1,), 100)
+    assert Array((3,), 0, 0, 0, dtype='int8')*1000 == Array((3,), 0, 0, 0)
+    assert (small.lazy() + 200).compute() == Array((2,), 100, 110)
+    assert small + Array((2,), 100, 90, dtype='int8') == Array((2,), 0, 0)
+    with pytest.raises(OverflowError):
+        small + 300
+
+def test_nan_and_float32():
+    """Checks that NaNs and float32 sums give the same results with every backend."""
+    a = Array((2,3), 0.5, float('nan'), 2.0, 1.0, 3.0, float('nan'))
+    assert isnan(a.min()) and isnan(a.max())
+    assert a.argmin() == 1 and a.argmax() == 1
+    assert a.min(axis=1).array_equal(Array((2,), float('nan'), float('nan')), equal_nan=True)
+    assert a.min(axis=0).array_equal(Array((3,), 0.5, float('nan'), float('nan')), equal_nan=True)
+    assert isnan(a.describe()['min'])
+    rolling = Array((4,), 1.0, float('nan'), 3.0, 0.0).rolling(2)
+    assert rolling.min().array_equal(Array((3,), float('nan'), float('nan'), 0.0), equal_nan=True)
+
+    f = Array((3,), 0.1, 0.1, 0.1, dtype='float32')
+    assert f.sum() == 0.30000000447034836
+    assert f.mean() == 0.10000000149011612
+
+def test_matmul():
+    """Checks the matrix product against hand-computed results."""
+    a = Array((2,3), 1,2,3,4,5,6)
+    b = Array((3,2), 7,8,9,10,11,12)
+    assert a @ b == Array((2,2), 58,64,139,154)
+    assert (a @ b).dtype == 'int64'
+    assert a.dot(b) == a @ b
+    assert b.T @ a.T == (a @ b).T
+    assert a @ Array((3,), 1.0,0.0,-1.0) == Array((2,), -2.0,-2.0)
+    assert Array((2,), 1,1) @ a == Array((3,), 5,7,9)
+    assert int_array @ int_array == 55
+
+    # larger than one tile of the blocked kernel
+    n = 70
+    c = Array((n,n), *range(n*n))
+    identity = Array((n,n), *[int(i == j) for i in range(n) for j in range(n)])
+    assert c @ identity == c
+    assert identity @ c.T == c.T
+
+    with pytest.raises(ValueError):
+        a @ a
+    with pytest.raises(ValueError):
+        int_array_3d @ int_array_2d
+    with pytest.raises(NotImplementedError):
+        bool_array_2d @ int_array_2d
+    with pytest.raises(NotImplementedError):
+        a @ 2
+
+def test_lazy():
+    """Checks that lazy expressions build a tree and evaluate to the same
+    result as the eager operators.
+    """
+    a = Array((2,2), 1,2,3,4)
+    b = Array((2,), 10,20)
+    expression = a.lazy()*2 + b - a
+    assert isinstance(expression, LazyArray)
+    assert expression.shape == (2,2)
+    assert expression.dtype == 'int64'
+    assert expression == a*2 + b - a
+    assert expression[1, 0] == 13
+    assert str(expression) == str(a*2 + b - a)
+    assert (10 - a.lazy()*0.5).compute() == Array((2,2), 9.5,9.0,8.5,8.0)
+    assert (b.lazy() + b.lazy() + a).compute() == Array((2,2), 21,42,23,44)
+    assert (2*b.lazy() + Array((2,1), 1,2)).compute() == Array((2,2), 21,41,22,42)
+
+    out = Array((2,2), 0.0,0.0,0.0,0.0)
+    assert (a.lazy()*1.5 + 1).compute(out=out) is out
+    assert out == Array((2,2), 2.5,4.0,5.5,7.0)
+    # the operands are read before out is overwritten
+    (a.lazy() + a.T).compute(out=a)
+    assert a == Array((2,2), 2,5,5,8)
+
+    # in-place operators write an expression into the buffer of the array
+    data = a._data
+    a += b.lazy()*2
+    assert isinstance(a, Array) and a._data is data
+    assert a == Array((2,2), 22,45,25,48)
+    a -= a.lazy() - 1
+    a *= b.lazy() + 0
+    assert a == Array((2,2), 10,20,10,20)
+    with pytest.raises(TypeError):
+        a += b.lazy()*0.5
+
+    assert repr(b.lazy() + 1) == "LazyArray(shape=(2,), dtype=int64, values=" + str(b + 1) + ")"
+    assert (b.lazy() + 1).is_equal(b.lazy() + 1) == Array((2,), True, True)
+    assert b.is_equal(b.lazy()*1) == Array((2,), True, True)
+
+    with pytest.raises(NotImplementedError):
+        bool_array.lazy() + 1
+    with pytest.raises(NotImplementedError):
+        int_array.lazy() + 'a'
+    with pytest.raises(ValueError):
+        int_array.lazy() + int_array_2d
+    with pytest.raises(TypeError):
+        (int_array.lazy() + 0.5).compute(out=Array((5,), 0,0,0,0,0))
+
+def test_mask_indexing():
+    """Checks boolean masks, integer index arrays and where/count_nonzero/any/all."""
+    a = Array((2,3), 1,5,2,8,3,9)
+    mask = a.is_equal(5)
+    assert a[mask] == Array((1,), 5)
+    assert a[Array((2,3), True,False,True,False,False,True)] == Array((3,), 1,2,9)
+    assert a.T[Array((3,2), True,True,False,False,True,False)] == Array((3,), 1,8,2)
+    assert a[Array((2,), False,True)] == Array((1,3), 8,3,9)
+    assert a[Array((3,), 1,0,-1)] == Array((3,3), 8,3,9,1,5,2,8,3,9)
+    assert a[[1]] == Array((1,3), 8,3,9)
+    assert int_array[Array((2,2), 0,4,4,0)] == Array((2,2), 1,5,5,1)
+
+    assert Array.where(mask, a, 0) == Array((2,3), 0,5,0,0,0,0)
+    assert Array.where(Array((3,), True,False,True), a, Array((2,1), 0.5,1.5)) == Array((2,3), 1.0,0.5,2.0,8.0,1.5,9.0)
+    assert Array.where(bool_array, True, False) == bool_array
+
+    assert bool_array.count_nonzero() == 2
+    assert Array((2,2), 0,1,2,0).count_nonzero(axis=0) == Array((2,), 1,1)
+    assert bool_array.any() == True
+    assert bool_array.all() == False
+    assert bool_array_2d.any(axis=1) == Array((2,), True,True)
+    assert int_array.all() == True
+    assert int_array[0:0].any() == False
+
+    b = Array((2,3), 1,5,2,8,3,9)
+    b[b.is_equal(5)] = 0
+    assert b == Array((2,3), 1,0,2,8,3,9)
+    b[Array((2,3), True,False,False,False,False,True)] = Array((2,), 10,20)
+    assert b == Array((2,3), 10,0,2,8,3,20)
+    b[0] = 7
+    b[:, 1] = Array((2,), 1,2)
+    b[1, 2] = -1
+    assert b == Array((2,3), 7,1,7,8,2,-1)
+
+    with pytest.raises(IndexError):
+        a[Array((3,), True,False,True)]
+    with pytest.raises(IndexError):
+        a[Array((1,), 2)]
+    with pytest.raises(IndexError):
+        a[Array((1,), 0.5)]
+    with pytest.raises(TypeError):
+        b[0] = 0.5
+    with pytest.raises(TypeError):
+        Array.where(a, 1, 2)
+    with pytest.raises(TypeError):
+        Array.where(mask, True, 2)
+
+def test_save_load(tmp_path):
+    """Checks that arrays survive a round trip through a file, both read
+    into memory and memory-mapped.
+    """
+    for a in (int_array, float_array_2d, bool_array_2d, int_array_3d[:, ::2].T):
+        path = tmp_path / "array.bin"
+        a.save(path)
+        assert (path.stat().st_size - a.nbytes) % 64 == 0
+        for mmap in (True, False):
+            loaded = Array.load(path, mmap=mmap)
+            assert loaded.shape == a.shape
+            assert loaded.dtype == a.dtype
+            assert loaded == a
+
+    mapped = Array.load(path)
+    assert mapped._data.readonly
+    assert mapped + 1 == int_array_3d[:, ::2].T + 1
+    with pytest.raises(ValueError):
+        mapped += 1
+    with pytest.raises(ValueError):
+        mapped[0] = 1
+    copied = Array.load(path, mmap=False)
+    copied += 1
+
+    path.write_bytes(b"not an array")
+    with pytest.raises(ValueError):
+        Array.load(path)
+
+    # truncated in the prefix, in the header and in the elements
+    int_array.save(path)
+    raw = path.read_bytes()
+    for length in (7, 20, len(raw) - 1):
+        path.write_bytes(raw[:length])
+        with pytest.raises(ValueError):
+            Array.load(path)
+
+    # unknown dtype, missing field and bad shape, padded to the same header length
+    for old, new in ((b"dtype=int64", b"dtype=int99"), (b"shape=5", b"shape  "), (b"shape=5", b"shape=x")):
+        path.write_bytes(raw.replace(old, new))
+        with pytest.raises(ValueError):
+            Array.load(path)
+
+def test_parallel(monkeypatch):
+    """Checks that operations and reductions in worker processes match the serial results."""
+    import pickle
+    import array_class
+
+    monkeypatch.setattr(array_class, "_PARALLEL_MIN_SIZE", 4)
+    a = Array((5, 3), *[float(i*i % 7) for i in range(15)])
+    b = Array((3,), 1.0, 2.0, 3.0)
+    expected = [a + b, b - a, a*2, (a - b).sum(), a.mean(), a.var(ddof=1), a.min(), a.max(), a.is_equal(4.0).any()]
+
+    Array.set_num_threads(2)
+    try:
+        assert Array.get_num_threads() == 2
+        results = [a + b, b - a, a*2, (a - b).sum(), a.mean(), a.var(ddof=1), a.min(), a.max(), a.is_equal(4.0).any()]
+        out = a.copy()
+        out += b
+        assert out == expected[0]
+    finally:
+        Array.set_num_threads(1)
+    assert Array.get_num_threads() == 1
+    for result, value in zip(results, expected):
+        if isinstance(value, Array):
+            assert result == value
+        else:
+            assert abs(result - value) < 1e-12
+
+    # Arrays are sent to worker processes by pickling
+    assert pickle.loads(pickle.dumps(a.T)) == a.T
+    assert pickle.loads(pickle.dumps(a.is_equal(4.0))) == a.is_equal(4.0)
+
+    with pytest.raises(ValueError):
+        Array.set_num_threads(0)
+
+def test_constructors():
+    """Checks the constructors that do not take the values as arguments."""
+    assert Array.from_iterable((2,3), (i for i in range(6))) == Array((2,3), *range(6))
+    assert Array.from_iterable((5,), iter([1.5,1.5,2.0,2.5,2.5])) == float_array
+    assert Array.from_iterable((2,), [1, 2], dtype='float64') == Array((2,), 1.0, 2.0)
+    assert Array.from_iterable((0,), []).dtype == 'float64'
+    with pytest.raises(ValueError):
+        Array.from_iterable((3,), range(4))
+    with pytest.raises(ValueError):
+        Array.from_iterable((3,), range(2))
+    with pytest.raises(ValueError):
+        Array.from_iterable((2,), [1, 2.0])
+    with pytest.raises(TypeError):
+        Array.from_iterable((2,), [1, '2'])
+    with pytest.raises(TypeError):
+        Array.from_iterable((2,), [1, 2], dtype='int128')
+
+    from array import array
+    buffer = array('q', range(6))
+    a = Array.from_buffer((3,2), buffer)
+    assert a == Array((3,2), *range(6))
+    a[0, 0] = 10
+    assert buffer[0] == 10
+    assert Array.from_buffer((2,), bytes(16), 'float64') == Array((2,), 0.0, 0.0)
+    with pytest.raises(ValueError):
+        Array.from_buffer((4,), buffer)
+    with pytest.raises(TypeError):
+        Array.from_buffer((2,), b'ab')
+    with pytest.raises(ValueError):
+        Array.from_buffer((3,), bytes(3), 'bool')[0] = True
+
+    assert Array.zeros((2,2)) == Array((2,2), 0.0, 0.0, 0.0, 0.0)
+    assert Array.zeros((3,), 'bool') == Array((3,), False, False, False)
+    assert Array.ones((2,), 'int64') == Array((2,), 1, 1)
+    assert Array.full((2,1), 7) == Array((2,1), 7, 7)
+    assert Array.full((2,), 7, 'float64') == Array((2,), 7.0, 7.0)
+    with pytest.raises(TypeError):
+        Array.full((2,), 0.5, 'int64')
+    assert Array.arange(5) == int_array - 1
+    assert Array.arange(5, 0, -2) == Array((3,), 5, 3, 1)
+    assert Array.arange(0, 1, 0.25) == Array((4,), 0.0, 0.25, 0.5, 0.75)
+    assert Array.arange(3, dtype='float64') == Array((3,), 0.0, 1.0, 2.0)
+    assert len(Array.arange(3, 1)) == 0
+    with pytest.raises(ValueError):
+        Array.arange(0, 5, 0)
+
+def test_dtypes(tmp_path):
+    """Checks the narrow dtypes, astype and the promotion rules."""
+    a = Array((2,2), 1, 2, 3, 4, dtype='int8')
+    assert a.dtype == 'int8' and a.nbytes == 4
+    assert a.values == [[1, 2], [3, 4]]
+    f = Array((2,), 1, 2.5, dtype='float32')
+    assert f.dtype == 'float32' and f.nbytes == 8
+    assert Array((0,), dtype='int16').shape == (0,)
+    with pytest.raises(TypeError):
+        Array((2,), 1.5, 2.5, dtype='int32')
+    with pytest.raises(TypeError):
+        Array((1,), 1, dtype='uint8')
+    with pytest.raises(OverflowError):
+        Array((1,), 200, dtype='int8')
+
+    # Arrays promote to the narrowest dtype that holds both, numbers keep the dtype of the array
+    assert (a + Array((2,), 1, 1, dtype='int16')).dtype == 'int16'
+    assert (a + Array((2,), 1, 1, dtype='int32')).dtype == 'int32'
+    assert (a[0] + f).dtype == 'float32'
+    assert (Array((2,), 1, 2, dtype='int32') + f).dtype == 'float64'
+    assert (a + 1).dtype == 'int8'
+    assert a + 1 == Array((2,2), 2, 3, 4, 5)
+    assert (a*0.5).dtype == 'float64'
+    assert (f*0.5).dtype == 'float32'
+    assert int_array + float_array == Array((5,), 2.5, 3.5, 5.0, 6.5, 7.5)
+    assert (a.lazy() + f).compute().dtype == 'float32'
+    assert Array.where(Array((2,), True, False), a[0], 0).dtype == 'int8'
+
+    # Sums of ints are int64, other reductions keep the dtype
+    assert a.sum() == 10
+    assert a.sum(axis=0).dtype == 'int64'
+    assert a.max(axis=1).dtype == 'int8'
+    assert f.mean() == 1.75
+
+    b = a.copy()
+    b[0, 0] = 7
+    b[1] = Array((2,), 0, 0, dtype='int8')
+    assert b.values == [[7, 2], [0, 0]]
+    with pytest.raises(TypeError):
+        b[0, 0] = 1.5
+    with pytest.raises(TypeError):
+        b[0] = Array((2,), 1, 1)
+    with pytest.raises(TypeError):
+        b += 1.5
+
+    assert a.astype('float32') == Array((2,2), 1.0, 2.0, 3.0, 4.0)
+    assert a.astype('float32').dtype == 'float32'
+    assert Array((3,), -1.7, 0.0, 2.9).astype('int16') == Array((3,), -1, 0, 2)
+    assert Array((3,), -1.7, 0.0, 2.9).astype('bool') == Array((3,), True, False, True)
+    assert a.T.astype('int64') == int_array_2d.T
+    with pytest.raises(TypeError):
+        a.astype('complex128')
+
+    assert Array.zeros((2,), 'int32').dtype == 'int32'
+    assert Array.from_buffer((2,), a._data[:2]).dtype == 'int8'
+    a.save(tmp_path / 'a.bin')
+    loaded = Array.load(tmp_path / 'a.bin')
+    assert loaded.dtype == 'int8' and loaded == a
+
+def test_text(tmp_path):
+    """Checks that large arrays are summarised and to_text writes every element."""
+    import io
+
+    assert repr(int_array) == 'Array(shape=(5,), dtype=int64, values=[1,2,3,4,5])'
+    assert str(Array.arange(1000)) == '[' + ','.join(map(str, range(1000))) + ']'
+    assert str(Array.arange(1001)) == '[0,1,2,...,998,999,1000]'
+    large = Array.arange(2000).reshape(40, 50)
+    assert str(large) == ('[[0, 1, 2, ..., 47, 48, 49],\n[50, 51, 52, ..., 97, 98, 99],\n'
+                          '[100, 101, 102, ..., 147, 148, 149],\n...,\n'
+                          '[1850, 1851, 1852, ..., 1897, 1898, 1899],\n[1900, 1901, 1902, ..., 1947, 1948, 1949],\n'
+                          '[1950, 1951, 1952, ..., 1997, 1998, 1999]]')
+    assert str(Array.arange(2000).reshape(2, 1000)).startswith('[[0, 1, 2, ..., 997, 998, 999],\n[1000, ')
+
+    text = io.StringIO()
+    int_array_3d.to_text(text, chunk_rows=1)
+    assert text.getvalue() == str(int_array_3d)
+    large.to_text(tmp_path / 'large.txt', chunk_rows=7)
+    assert (tmp_path / 'large.txt').read_text() == '[' + ',\n'.join(map(str, large.values)) + ']'
+    text = io.StringIO()
+    Array.arange(2500)[::2].to_text(text, chunk_rows=100)
+    assert text.getvalue() == '[' + ','.join(map(str, range(0, 2500, 2))) + ']'
+
+def test_equality():
+    """Checks array_equal, allclose and hashing."""
+    a = Array.arange(10).astype('float64')
+    assert a.array_equal(Array.arange(10))
+    assert a[::2].array_equal(Array((5,), 0, 2, 4, 6, 8))
+    assert not a.array_equal(a.reshape(2, 5))
+    assert not a.array_equal(Array.arange(1, 11))
+    assert not a.array_equal([0.0]*10)
+    nan_array = Array((2,), 1.0, float('nan'))
+    assert nan_array != nan_array
+    assert nan_array.array_equal(nan_array, equal_nan=True)
+
+    assert a.allclose(a + 1e-9)
+    assert not a.allclose(a + 1e-3)
+    assert a.allclose(a + 1e-3, atol=1e-2)
+    assert Array((2,), 1e10, 2e10).allclose(Array((2,), 1.00001e10, 2e10))
+    assert Array((2,2), 1.0, 2.0, 1.0, 2.0).allclose(Array((2,), 1.0, 2.0))
+    assert not Array((1,), 1.0).allclose(float('inf'))
+    assert Array((1,), float('inf')).allclose(float('inf'))
+    assert nan_array.allclose(nan_array, equal_nan=True)
+    with pytest.raises(NotImplementedError):
+        bool_array.allclose(bool_array)
+    with pytest.raises(ValueError):
+        a.allclose(Array.arange(3))
+
+    b = a.copy()
+    assert hash(a) == hash(b) == hash(Array.arange(10))
+    assert len({a, b, Array.arange(10), a.reshape(2, 5)}) == 2
+    cache = {a: 'a'}
+    assert cache[b] == 'a'
+    b[0] = 100.0
+    assert hash(a) != hash(b) and a != b
+    b[:1] = Array((1,), 0.0)
+    assert hash(a) == hash(b)
+    b += 1
+    assert b not in cache
+
+    nans, other_nans = Array.full((1000,), float('nan')), Array.full((1000,), float('nan'))
+    assert hash(nans) == hash(other_nans)
+    assert nans.array_equal(other_nans, equal_nan=True)
+
+    # changes through a shared buffer are seen after hashing
+    np = pytest.importorskip('numpy')
+    source = np.zeros(3)
+    shared, changed = Array.from_numpy(source), Array((3,), 5.0, 0.0, 0.0)
+    assert hash(shared) != hash(changed)
+    source[0] = 5.0
+    assert shared == changed and hash(shared) == hash(changed)
+
+def test_cumulative():
+    """Checks cumsum, cumprod, diff and rolling windows, also along an axis."""
+    a = Array((2,4), 1, 3, 2, 5, 4, 0, 6, 1)
+    assert a.cumsum() == Array((8,), 1, 4, 6, 11, 15, 15, 21, 22)
+    assert a.cumsum(axis=0) == Array((2,4), 1, 3, 2, 5, 5, 3, 8, 6)
+    assert a.cumsum(axis=1) == Array((2,4), 1, 4, 6, 11, 4, 4, 10, 11)
+    assert a.cumprod(axis=1) == Array((2,4), 1, 3, 6, 30, 4, 0, 0, 0)
+    assert Array((3,), 0.5, 2.0, 3.0).cumprod() == Array((3,), 0.5, 1.0, 3.0)
+    assert Array((2,), 100, 100).astype('int8').cumsum().dtype == 'int64'
+
+    assert a.diff() == Array((2,3), 2, -1, 3, -4, 6, -5)
+    assert a.diff(2) == Array((2,2), -3, 4, 10, -11)
+    assert a.diff(axis=0) == Array((1,4), 3, -3, 4, -4)
+    assert a.diff(0) == a
+    assert a.diff(5).shape == (2, 0)
+
+    rolling = a.rolling(2)
+    assert rolling.sum() == Array((2,3), 4, 5, 7, 4, 6, 7)
+    assert rolling.mean() == Array((2,3), 2.0, 2.5, 3.5, 2.0, 3.0, 3.5)
+    assert rolling.min() == Array((2,3), 1, 2, 2, 0, 0, 1)
+    assert rolling.max() == Array((2,3), 3, 3, 5, 4, 6, 6)
+    assert a.rolling(3, axis=1).max() == Array((2,2), 3, 5, 6, 6)
+    assert a.rolling(2, axis=0).min() == Array((1,4), 1, 0, 2, 1)
+    assert a.rolling(4).mean() == a.mean(axis=1).reshape(2, 1)
+
+    series = Array((8,), 5.0, 3.0, 4.0, 1.0, 2.0, 6.0, 7.0, 0.0)
+    assert series.rolling(3).min() == Array((6,), 3.0, 1.0, 1.0, 1.0, 2.0, 0.0)
+    assert series.rolling(3).max() == Array((6,), 5.0, 4.0, 4.0, 6.0, 7.0, 7.0)
+    assert series.rolling(1).max() == series
+
+    with pytest.raises(ValueError):
+        a.rolling(5)
+    with pytest.raises(ValueError):
+        a.rolling(0)
+    with pytest.raises(ValueError):
+        a.diff(-1)
+    with pytest.raises(ValueError):
+        a.cumsum(axis=2)
+    with pytest.raises(NotImplementedError):
+        bool_array.cumsum()
+
 if __name__ == "__main__":
     """
     Note: Write "pytest" in terminal in the same folder as this file is in to run all tests
@@ -202,3 +887,19 @@ if __name__ == "__main__":
     test_mult_2d()
     test_same_2d()
     test_mean_2d()
+
+    # Storage tests
+    test_storage()
+    test_from_buffer()
+    test_nd()
+    test_views()
+    test_broadcast()
+    test_inplace()
+    test_reductions()
+    test_backend()
+    test_matmul()
+    test_lazy()
+    test_mask_indexing()
+    test_constructors()
+    test_equality()
+    test_cumulative()
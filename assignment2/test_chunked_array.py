@@ -0,0 +1,83 @@
+"""Tests for the ChunkedArray class"""
+
+from array_class import Array
+from chunked_array import ChunkedArray
+import pytest
+
+array_1d = Array((10,), *range(10))
+array_2d = Array((5,2), 1.5,2.5,3.5,4.5,5.5,6.5,7.5,8.5,9.5,10.5)
+
+
+def test_chunks():
+    """Checks that arrays are split into blocks of rows and joined back."""
+    chunked = ChunkedArray.from_array(array_1d, 4)
+    assert chunked.shape == (10,)
+    assert chunked.chunks == (4, 4, 2)
+    assert chunked.to_array() == array_1d
+    assert chunked == array_1d
+    assert ChunkedArray.from_iterable((5,2), array_2d.flatten2d(), 2) == array_2d
+    with pytest.raises(ValueError):
+        ChunkedArray.from_iterable((3,), range(4), 2)
+    with pytest.raises(ValueError):
+        ChunkedArray([Array((2,), 1,2), Array((2,), 1.0,2.0)])
+
+
+def test_operations():
+    """Checks that operations evaluated block by block match those of Array."""
+    chunked = ChunkedArray.from_array(array_1d, 4)
+    assert chunked + 1 == array_1d + 1
+    assert 2*chunked - chunked == array_1d
+    assert chunked + ChunkedArray.from_array(array_1d, 3) == array_1d*2
+    assert chunked*array_1d == array_1d*array_1d
+    assert chunked.is_equal(3) == array_1d.is_equal(3)
+
+    chunked_2d = ChunkedArray.from_array(array_2d, 2)
+    assert chunked_2d + Array((2,), 1.0,2.0) == array_2d + Array((2,), 1.0,2.0)
+    assert chunked_2d.min_element() == 1.5
+    assert chunked_2d.mean_element() == array_2d.mean_element()
+    assert chunked.sum() == 45
+
+    with pytest.raises(ValueError):
+        chunked + Array((3,), 1,2,3)
+    with pytest.raises(NotImplementedError):
+        chunked.is_equal(3).mean_element()
+
+
+def test_on_disk(tmp_path):
+    """Checks blocks stored as memory-mapped files."""
+    chunked = ChunkedArray.from_iterable((1000,), (float(v) for v in range(1000)), 300, directory=tmp_path)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [f"block-00000{i}.bin" for i in range(4)]
+    assert chunked.mean_element() == 499.5
+    assert chunked.min_element() == 0.0
+
+    result = chunked*2
+    assert result.directory is not None
+    assert result.chunks == chunked.chunks
+    assert result.mean_element() == 999.0
+
+
+def test_array_left_operand():
+    """Checks that Array operators hand off to a ChunkedArray right operand."""
+    chunked = ChunkedArray.from_array(array_1d, 4)
+    assert array_1d == chunked and chunked == array_1d
+    assert array_1d + chunked == array_1d*2
+    assert array_1d - chunked == array_1d*0
+    assert array_1d*chunked == array_1d*array_1d
+    assert array_1d.is_equal(chunked) == array_1d.is_equal(array_1d)
+    assert isinstance(array_1d + chunked, ChunkedArray)
+
+
+def test_temporary_directory(tmp_path):
+    """Checks that results on disk remove their temporary directories."""
+    chunked = ChunkedArray.from_array(array_1d, 4, directory=tmp_path)
+    with chunked + 1 as result:
+        directory = result.directory
+        assert directory.is_dir()
+        assert result == array_1d + 1
+    assert not directory.exists()
+
+    directory = (chunked*2).directory
+    assert not directory.exists()  # removed when the result was garbage collected
+
+    chunked.close()
+    assert sorted(p.name for p in tmp_path.iterdir()) == [f"block-00000{i}.bin" for i in range(3)]
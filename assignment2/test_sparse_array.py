@@ -0,0 +1,88 @@
+"""Tests for the SparseArray class"""
+
+from array_class import Array
+from sparse_array import SparseArray
+import pytest
+
+dense = Array((3,4), 0,2,0,0, 0,0,0,0, -1,0,0,3)
+dense_float = Array((3,4), 0.5,0.0,0.0,0.0, 0.0,0.0,0.0,0.0, 1.5,0.0,0.0,2.5)
+
+
+def test_conversion():
+    """Checks the CSR structure and conversion to and from dense arrays."""
+    sparse = SparseArray.from_array(dense)
+    assert sparse.nnz == 3
+    assert list(sparse.indptr) == [0, 1, 1, 3]
+    assert list(sparse.indices) == [1, 0, 3]
+    assert list(sparse.data) == [2, -1, 3]
+    assert sparse.to_array() == dense
+    assert sparse == dense and dense == sparse
+    assert SparseArray.from_array(dense.T) == dense.T
+    assert sparse.T == SparseArray.from_array(dense.T)
+    assert SparseArray((3,4), [2,-1,3], [1,0,3], [0,1,1,3]) == sparse
+    assert SparseArray.from_coo((3,4), [2,0,2,2], [0,1,3,3], [-1,2,1,2]) == sparse
+    with pytest.raises(ValueError):
+        SparseArray((3,4), [2,-1,3], [1,3,0], [0,1,1,3])
+    with pytest.raises(ValueError):
+        SparseArray.from_array(Array((2,), 1,2))
+    with pytest.raises(IndexError):
+        SparseArray.from_coo((3,4), [3], [0], [1])
+
+
+def test_operators():
+    """Checks that the operators match those of the dense arrays."""
+    sparse = SparseArray.from_array(dense)
+    sparse_float = SparseArray.from_array(dense_float)
+    assert isinstance(sparse + sparse_float, SparseArray)
+    assert sparse + sparse_float == dense + dense_float
+    assert sparse - sparse == Array.zeros((3,4), 'int64')
+    assert (sparse - sparse).nnz == 0
+    assert sparse*sparse_float == dense*dense_float
+    assert (sparse*sparse_float).nnz == 2
+    assert sparse*2 == dense*2 and 2*sparse == dense*2
+    assert sparse*Array((4,), 1.0,2.0,3.0,4.0) == dense*Array((4,), 1.0,2.0,3.0,4.0)
+
+    # Adding numbers or dense arrays gives dense arrays
+    assert isinstance(sparse + 1, Array)
+    assert sparse + 1 == dense + 1
+    assert 1 - sparse == 1 - dense
+    assert sparse + dense_float == dense + dense_float
+    assert dense_float - sparse == dense_float - dense
+    assert sparse - dense_float == dense - dense_float
+    assert sparse.is_equal(0) == dense.is_equal(0)
+
+    matrix = Array((4,2), *range(8))
+    assert sparse @ matrix == dense @ matrix
+    assert sparse @ Array((4,), 1,1,1,1) == Array((3,), 2,0,2)
+    assert sparse @ sparse.T == SparseArray.from_array(dense @ dense.T)
+    assert matrix.T @ sparse.T == matrix.T @ dense.T
+
+    with pytest.raises(ValueError):
+        sparse + SparseArray.from_array(dense.T)
+    with pytest.raises(ValueError):
+        sparse @ sparse
+    with pytest.raises(NotImplementedError):
+        SparseArray.from_array(dense.is_equal(0)) + 1
+
+    # Int overflow raises an OverflowError as with dense arrays
+    small = SparseArray.from_array(Array((2,2), 100,0,0,-100).astype('int8'))
+    with pytest.raises(OverflowError):
+        small + Array((2,2), 100,100,100,100).astype('int8')
+    with pytest.raises(OverflowError):
+        Array((2,), 100,100).astype('int8') - small
+    with pytest.raises(OverflowError):
+        small + small
+
+
+def test_reductions():
+    """Checks that the reductions count the zeros that are not stored."""
+    sparse = SparseArray.from_array(dense)
+    for name in ("sum", "min", "max", "mean", "var", "std", "count_nonzero", "any", "all", "argmin", "argmax"):
+        assert getattr(sparse, name)() == getattr(dense, name)()
+        for axis in (0, 1):
+            assert getattr(sparse, name)(axis=axis) == getattr(dense, name)(axis=axis)
+    assert sparse.var(ddof=1) == pytest.approx(dense.var(ddof=1))
+    assert SparseArray.from_array(dense_float).min_element() == 0.0
+    assert sparse.mean_element() == dense.mean_element()
+    with pytest.raises(ValueError):
+        sparse.sum(axis=2)
@@ -1,6 +1,8 @@
 """This file is used when invoked as `python -m instapy`"""
 
 if __name__ == "__main__":
+    import sys
+
     from .cli import main
 
-    main()
+    sys.exit(main())
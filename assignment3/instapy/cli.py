@@ -1,13 +1,36 @@
 """Command-line (script) interface to instapy"""
 
 import argparse
+import glob
+import multiprocessing
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
 
 import numpy as np
 from PIL import Image
 
 import instapy
 from . import io
+from .tiled import filter_file_in_strips, tiled_filter
+
+# File extensions of the images picked up from directories
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".tif", ".tiff", ".webp"}
+
+# The filter function of a batch worker process, loaded once by _init_worker
+_worker_filter = None
+
+
+def scale_image(image: np.array, scale: int = 1) -> np.array:
+    """Resize image by an integer scale factor"""
+    if scale == 1:
+        return image
+    width, height, channels = np.shape(image)
+    width, height = width//scale, height//scale
+    return np.resize(image, (width, height, channels))
+
 
 # Edit:
 # Filled in the two functions for run_filter() and main()
@@ -17,15 +40,21 @@ def run_filter(
     implementation: str = "python",
     filter: str = "color2gray",
     scale: int = 1,
+    tiled: bool = False,
+    strip_rows: int = None,
 ) -> None:
-    """Run the selected filter"""
-    # load the image from a file
-    image = io.read_image(file)
-    if scale != 1:
-        # Resize image, if needed
-        width, height, channels = np.shape(image)
-        width, height = width//scale, height//scale
-        image = np.resize(image, (width, height, channels))
+    """Run the selected filter
+
+    If tiled, the image is filtered in strips of strip_rows rows with
+    bounded memory (see instapy.tiled), which needs an out_file and cannot
+    be combined with scale.
+    """
+    if tiled:
+        tiled_filter(file, out_file, implementation, filter, strip_rows)
+        return
+
+    # load the image from a file, and resize it if needed
+    image = scale_image(io.read_image(file), scale)
 
     # Apply the filter
     filter_function = instapy.get_filter(filter, implementation)
@@ -38,25 +67,166 @@ def run_filter(
         io.display(filtered)
 
 
+def expand_files(patterns: list) -> list:
+    """Expand file names, directories and glob patterns to a list of image files
+
+    Directories give the image files directly in them (see IMAGE_EXTENSIONS),
+    and glob patterns (e.g. "photos/*.jpg" or "photos/**/*.png") the files
+    they match. Each file is listed once, in the order it is first found.
+
+    Raises:
+        FileNotFoundError: If a pattern matches no file.
+    """
+    files = {}
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = sorted(
+                str(path) for path in Path(pattern).iterdir()
+                if path.is_file() and path.suffix.lower() in IMAGE_EXTENSIONS
+            )
+        elif any(character in pattern for character in "*?["):
+            matches = sorted(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+        elif os.path.isfile(pattern):
+            matches = [pattern]
+        else:
+            matches = []
+        if not matches:
+            raise FileNotFoundError(f"No image files found for {pattern!r}")
+        files.update(dict.fromkeys(matches))
+    return list(files)
+
+
+def batch_out_files(files: list, out_dir: str, filter: str = "color2gray") -> list:
+    """Return the output filenames for files in out_dir, e.g. out_dir/rain_color2gray.jpg
+
+    Raises:
+        ValueError: If two input files would be written to the same output file.
+    """
+    out_files = [str(Path(out_dir) / f"{Path(file).stem}_{filter}{Path(file).suffix}") for file in files]
+    if len(set(out_files)) != len(out_files):
+        raise ValueError("Input files with the same name would overwrite each other in the output directory")
+    return out_files
+
+
+def _init_worker(filter: str, implementation: str) -> None:
+    """Load the filter once per worker process
+
+    The filter is run once on a tiny image, so a numba filter is compiled
+    here, once per worker, and not while filtering the first file.
+    """
+    global _worker_filter
+    _worker_filter = instapy.get_filter(filter, implementation)
+    _worker_filter(io.random_image(8, 8))
+
+
+def _filter_file(
+    file: str, out_file: str, scale: int = 1, tiled: bool = False, strip_rows: int = None
+) -> Optional[str]:
+    """Filter one file with the filter of this worker and save the result
+
+    Returns:
+        None on success, or the error message
+    """
+    try:
+        if tiled:
+            filter_file_in_strips(_worker_filter, file, out_file, strip_rows)
+            return None
+        image = scale_image(io.read_image(file), scale)
+        io.write_image(_worker_filter(image), out_file)
+    except Exception as error:
+        # One broken file should not stop the rest of the batch
+        return f"{type(error).__name__}: {error}"
+    return None
+
+
+def run_batch(
+    files: list,
+    out_dir: str,
+    implementation: str = "python",
+    filter: str = "color2gray",
+    scale: int = 1,
+    jobs: int = None,
+    tiled: bool = False,
+    strip_rows: int = None,
+) -> dict:
+    """Run the selected filter on many files, in a pool of worker processes
+
+    Every worker loads (and compiles) the filter once and reuses it for
+    all the files it gets, so the start-up cost is paid once per worker
+    instead of once per file.
+
+    Args:
+        files (list): the image files to filter.
+        out_dir (str): the directory to save the filtered images in
+            (created if needed), see batch_out_files for the file names.
+        implementation (str): the filter implementation (python, numba, etc.)
+        filter (str): 'color2gray' or 'color2sepia'
+        scale (int): scale factor to resize the images with
+        jobs (int): the number of worker processes, the number of CPUs if None.
+            With 1, the files are filtered in this process.
+        tiled (bool): filter each file in strips of strip_rows rows, see run_filter
+
+    The workers are started with the spawn method, which imports the
+    __main__ module in every worker, so a script that calls run_batch
+    must do so under an `if __name__ == "__main__":` guard.
+
+    Returns:
+        errors (dict): the error message for each file that failed, by filename
+
+    Raises:
+        ModuleNotFoundError, AttributeError: If the implementation or filter
+            does not exist (checked here, before any worker is started).
+    """
+    # Check the filter in this process, a worker failing to load it would
+    # only show up as a BrokenProcessPool
+    instapy.get_filter(filter, implementation)
+    os.makedirs(out_dir, exist_ok=True)
+    out_files = batch_out_files(files, out_dir, filter)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(files) == 1:
+        _init_worker(filter, implementation)
+        results = map(_filter_file, files, out_files, [scale]*len(files), [tiled]*len(files), [strip_rows]*len(files))
+        return {file: error for file, error in zip(files, results) if error}
+
+    # Workers are spawned, not forked: forking a process where numba or
+    # OpenMP threads have run (e.g. after filtering with numba_parallel)
+    # can deadlock the workers.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        jobs, mp_context=context, initializer=_init_worker, initargs=(filter, implementation)
+    ) as pool:
+        # Send the files in chunks, to keep the overhead per file low
+        chunksize = max(1, min(64, len(files) // (4*jobs)))
+        results = pool.map(
+            _filter_file, files, out_files, [scale]*len(files), [tiled]*len(files), [strip_rows]*len(files), chunksize=chunksize
+        )
+        return {file: error for file, error in zip(files, results) if error}
+
+
 def main(argv=None):
-    """Parse the command-line and call run_filter with the arguments"""
+    """Parse the command-line and call run_filter (or run_batch) with the arguments"""
     if argv is None:
         argv = sys.argv[1:]
 
     parser = argparse.ArgumentParser()
 
-    # filename is positional and required
-    parser.add_argument("file", help="The filename to apply filter to")
-    parser.add_argument("-o", "--out", help="The output filename")
+    # filenames are positional and at least one is required
+    parser.add_argument("files", nargs="+", help="The filenames, directories or glob patterns to apply filter to")
+    parser.add_argument("-o", "--out", help="The output filename (for a single file)")
+    parser.add_argument("-d", "--out-dir", help="The output directory, to filter many files in one run")
+    parser.add_argument("-j", "--jobs", type=int, help="The number of worker processes (default: the number of CPUs)")
 
     # Add required arguments
     parser.add_argument("-g", "--gray", action='store_const', const='color2gray', help="Select gray filter")
     parser.add_argument("-se", "--sepia", action='store_const', const='color2sepia', help="Select sepia filter")
     parser.add_argument("-sc", "--scale", type=int, help="Scale factor to resize image")
-    parser.add_argument("-i", "--implementation", choices=["python", "numba", "numpy"], help="The implementation")
+    parser.add_argument("-t", "--tiled", action="store_true",
+                        help="Filter in strips of rows with bounded memory, for images too large for memory")
+    parser.add_argument("--strip-rows", type=int, help="The number of rows in a strip (implies --tiled)")
+    parser.add_argument("-i", "--implementation", choices=["python", "numba", "numba_parallel", "numpy", "lut"], help="The implementation")
 
     # parse arguments and call run_filter
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     out_file = None
     implementation = 'python'
     filter = 'color2gray'
@@ -77,4 +247,32 @@ def main(argv=None):
             raise TypeError("Can't use sepia and grayscale in one.")
     if args.scale:
         scale = args.scale
-    run_filter(args.file, out_file, implementation, filter, scale)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    tiled = args.tiled or args.strip_rows is not None
+    if tiled:
+        if args.strip_rows is not None and args.strip_rows < 1:
+            parser.error("--strip-rows must be at least 1")
+        if scale != 1:
+            parser.error("--tiled cannot be combined with --scale")
+        if not (out_file or args.out_dir):
+            parser.error("--tiled needs an output file (--out) or directory (--out-dir)")
+
+    try:
+        files = expand_files(args.files)
+    except FileNotFoundError as error:
+        parser.error(str(error))
+
+    if not args.out_dir:
+        if len(files) > 1:
+            parser.error("Filtering more than one file needs an output directory (--out-dir)")
+        run_filter(files[0], out_file, implementation, filter, scale, tiled, args.strip_rows)
+        return 0
+    if out_file:
+        parser.error("Use either --out or --out-dir")
+
+    errors = run_batch(files, args.out_dir, implementation, filter, scale, args.jobs, tiled, args.strip_rows)
+    for file, error in errors.items():
+        print(f"Failed to filter {file}: {error}", file=sys.stderr)
+    print(f"Filtered {len(files) - len(errors)} of {len(files)} files into {args.out_dir}")
+    return 1 if errors else 0
@@ -1,96 +1,122 @@
 """Cython implementation of filter functions"""
 
-"""This implementation follows the guidlines 
+"""This implementation follows the guidlines
     given in the Cython documentation:
-    https://cython.readthedocs.io/en/latest/src/tutorial/numpy.html
+    https://cython.readthedocs.io/en/latest/src/userguide/memoryviews.html
+    https://cython.readthedocs.io/en/latest/src/userguide/parallelism.html
+
+The kernels read the uint8 image through a typed memoryview and write the
+uint8 result directly, without a float64 intermediate image. They release
+the GIL, and prange splits the rows over OpenMP threads when the module is
+compiled with OpenMP (see setup.py), otherwise the rows run in one thread.
 """
 
-from email.mime import image
 import numpy as np
-cimport numpy as np
 cimport cython
+from cython.parallel cimport prange
+
+
+# weights of the filters, as C arrays so the kernels can use them without the GIL
+cdef double GRAY_WEIGHTS[3]
+GRAY_WEIGHTS[:] = [0.21, 0.72, 0.07]
+
+cdef double SEPIA_MATRIX[3][3]
+SEPIA_MATRIX[0][:] = [0.393, 0.769, 0.189]
+SEPIA_MATRIX[1][:] = [0.349, 0.686, 0.168]
+SEPIA_MATRIX[2][:] = [0.272, 0.534, 0.131]
 
 
-np.import_array() # for accessing .shape of a Python's numpy array
+def _arrays(image, out):
+    """Return image as a C-contiguous uint8 array of shape (height, width, 3),
+    and out, or a new uint8 array of that shape if out is None"""
+    image = np.ascontiguousarray(image)
+    if image.ndim != 3 or image.shape[2] != 3:
+        raise ValueError(f"Expected an rgb image of shape (height, width, 3), got {image.shape}")
+    if out is None:
+        return image, np.empty_like(image)
+    if np.shape(out) != image.shape:
+        raise ValueError(f"out has shape {np.shape(out)}, but the image has shape {image.shape}")
+    return image, out
 
 
 @cython.boundscheck(False) # turn off bounds-checking for entire function
 @cython.wraparound(False)  # turn off negative index wrapping for entire function
-def cython_color2gray(np.ndarray[np.uint8_t, ndim=3] image):
-    """Convert rgb pixel array to grayscale
-
-    Args:
-        image (np.array)
-    Returns:
-        np.array: gray_image_uint8
-    """
-    cdef np.ndarray[np.double_t, ndim=3] gray_image = np.empty_like(image, dtype=np.double)
-    cdef np.ndarray[np.double_t, ndim=1] filter_weights = np.array([0.21, 0.72, 0.07], dtype=np.double)
-    
+cdef void gray_kernel(const unsigned char[:, :, ::1] image, unsigned char[:, :, ::1] out) noexcept nogil:
+    """Write the grayscale of every pixel of image into out (which may be image)"""
     # height, width of pixels will be used in the for cycle
-    cdef int height = image.shape[0]
-    cdef int width = image.shape[1]
-    cdef int channels = image.shape[2]
-    cdef int i, j, k
-    
-    cdef double gray_color = 0
-    
-    # looping through each pixel
-    for i in range(height):
-        for j in range(width):
-            gray_color = 0
-            for k in range(channels):
-                gray_color += image[i,j,k]*filter_weights[k]
-            for k in range(channels):
-                gray_image[i,j,k] = gray_color
-
-    # Image.fromarray() requires type "uint8". Must revert 
-    # the type back to "uint8".
-    gray_image_uint8 = np.array(gray_image).astype("uint8")
-    
-    return gray_image_uint8
+    cdef Py_ssize_t height = image.shape[0]
+    cdef Py_ssize_t width = image.shape[1]
+    cdef Py_ssize_t i, j
+    cdef double gray_color
+    cdef unsigned char gray
 
+    # looping through each pixel, with the rows split over the threads
+    for i in prange(height, schedule="static"):
+        for j in range(width):
+            gray_color = (image[i,j,0]*GRAY_WEIGHTS[0]
+                          + image[i,j,1]*GRAY_WEIGHTS[1]
+                          + image[i,j,2]*GRAY_WEIGHTS[2])
+            # casting to unsigned char truncates, as astype("uint8") does
+            gray = <unsigned char>gray_color
+            out[i,j,0] = gray
+            out[i,j,1] = gray
+            out[i,j,2] = gray
 
 
 @cython.boundscheck(False) # turn off bounds-checking for entire function
 @cython.wraparound(False)  # turn off negative index wrapping for entire function
-def cython_color2sepia(np.ndarray[np.uint8_t, ndim=3] image):
-    """Convert rgb pixel array to sepia
+cdef void sepia_kernel(const unsigned char[:, :, ::1] image, unsigned char[:, :, ::1] out) noexcept nogil:
+    """Write the sepia of every pixel of image into out (which may be image)"""
+    # height, width of pixels will be used in the for cycle
+    cdef Py_ssize_t height = image.shape[0]
+    cdef Py_ssize_t width = image.shape[1]
+    cdef Py_ssize_t i, j, k
+    cdef double r, g, b, val
+
+    # looping through each pixel, with the rows split over the threads
+    for i in prange(height, schedule="static"):
+        for j in range(width):
+            # read the whole pixel first, so out may be the image itself
+            r = image[i,j,0]
+            g = image[i,j,1]
+            b = image[i,j,2]
+            for k in range(3): # loop over new RGB values
+                # sum of RGB pixel values multiplied by sepia weights
+                val = r*SEPIA_MATRIX[k][0] + g*SEPIA_MATRIX[k][1] + b*SEPIA_MATRIX[k][2]
+                out[i,j,k] = <unsigned char>min(val, 255.0) # highest value must be 255
+
+
+def cython_color2gray(image, out=None):
+    """Convert rgb pixel array to grayscale
 
     Args:
-        image (np.array)
+        image (np.array): uint8 image of shape (height, width, 3)
+        out (np.array): optional C-contiguous uint8 array of the same shape to
+            write the result into (may be image itself, to filter in place)
     Returns:
-        np.array: sepia_image_uint8
+        np.array: gray_image, out if given
     """
-    
-    cdef np.ndarray[np.double_t, ndim=3] sepia_image = np.empty_like(image, dtype=np.double)
-    cdef np.ndarray[np.double_t, ndim=2] sepia_matrix = np.array([[ 0.393, 0.769, 0.189],
-                                                                  [ 0.349, 0.686, 0.168],
-                                                                  [ 0.272, 0.534, 0.131]
-                                                                  ], dtype=np.double)
-    
-    # height, width of pixels will be used in the for cycle
-    cdef int height = image.shape[0]
-    cdef int width = image.shape[1]
-    cdef int channels = image.shape[2]
-    cdef int i, j, k
-    
-    cdef double val = 0
-    
-    # looping through each pixel
-    for i in range(height):
-        for j in range(width):
-            for k in range(channels): # loop over new RGB values
-                val = 0
-                for m in range(channels): # loop over original RGB values
-                    # sum of RGB pixel values multiplied by sepia weights 
-                    val += image[i,j,m]*sepia_matrix[k][m]
-                sepia_image[i,j,k]= min(val, 255) # highest value must be 255
+    image, gray_image = _arrays(image, out)
+    cdef const unsigned char[:, :, ::1] pixels = image
+    cdef unsigned char[:, :, ::1] gray_pixels = gray_image
+    with nogil:
+        gray_kernel(pixels, gray_pixels)
+    return gray_image
 
 
-    # Image.fromarray() requires type "uint8". Must revert 
-    # the type back to "uint8".
-    sepia_image_uint8 = np.array(sepia_image).astype("uint8")
-    
-    return sepia_image_uint8
+def cython_color2sepia(image, out=None):
+    """Convert rgb pixel array to sepia
 
+    Args:
+        image (np.array): uint8 image of shape (height, width, 3)
+        out (np.array): optional C-contiguous uint8 array of the same shape to
+            write the result into (may be image itself, to filter in place)
+    Returns:
+        np.array: sepia_image, out if given
+    """
+    image, sepia_image = _arrays(image, out)
+    cdef const unsigned char[:, :, ::1] pixels = image
+    cdef unsigned char[:, :, ::1] sepia_pixels = sepia_image
+    with nogil:
+        sepia_kernel(pixels, sepia_pixels)
+    return sepia_image
@@ -4,9 +4,15 @@ for reading, writing, and displaying image files
 as numpy arrays
 """
 
+import struct
+from pathlib import Path
+
 import numpy as np
 from PIL import Image
 
+# The number of pixels in a row strip if strip_rows is not given, see read_strips
+STRIP_PIXELS = 1 << 20
+
 
 def read_image(filename: str) -> np.array:
     """Read an image file to an rgb array"""
@@ -26,3 +32,163 @@ def random_image(width: int = 320, height: int = 180) -> np.array:
 def display(array: np.array):
     """Show an image array on the screen"""
     Image.fromarray(array).show()
+
+
+def _raw_rgb_offset(image: Image.Image):
+    """Return the file offset of the pixels of an opened image, if they are
+    stored uncompressed as packed RGB rows from top to bottom, otherwise None"""
+    if image.mode != "RGB" or not image.tile:
+        return None
+    width, height = image.size
+    row_bytes = 3*width
+    start = None
+    for decoder, extents, offset, args in image.tile:
+        if not isinstance(args, tuple):
+            args = (args,)
+        stride = args[1] if len(args) > 1 and args[1] else row_bytes
+        orientation = args[2] if len(args) > 2 else 1
+        if (decoder != "raw" or args[0] != "RGB" or stride != row_bytes or orientation != 1
+                or extents[0] != 0 or extents[2] != width):
+            return None
+        # every strip must follow the previous one in the file
+        if start is None:
+            start = offset - extents[1]*row_bytes
+        elif offset != start + extents[1]*row_bytes:
+            return None
+    return start
+
+
+def read_strips(filename: str, strip_rows: int = None):
+    """Read an image file as an rgb array in strips of rows
+
+    Uncompressed images (e.g. PPM, or TIFF as written by StripWriter) are
+    memory-mapped, so only one strip at a time is in memory. Other formats
+    (e.g. JPEG, PNG) cannot be decoded in parts, so they are decoded to
+    uint8 once (and converted to rgb) and handed out in strips.
+
+    Args:
+        filename (str): the image file.
+        strip_rows (int): the number of rows in a strip,
+            by default about STRIP_PIXELS pixels.
+
+    Returns:
+        (width, height), strips: the size of the image, and an iterator over
+        the strips, arrays of shape (rows, width, channels) from top to bottom
+    """
+    image = Image.open(filename)
+    width, height = image.size
+    if strip_rows is None:
+        strip_rows = max(1, STRIP_PIXELS // width)
+    offset = _raw_rgb_offset(image)
+    if offset is not None:
+        image.close()
+        pixels = np.memmap(filename, np.uint8, "r", offset=offset, shape=(height, width, 3))
+        strips = (np.array(pixels[top:top + strip_rows]) for top in range(0, height, strip_rows))
+    else:
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        strips = (
+            np.asarray(image.crop((0, top, width, min(top + strip_rows, height))))
+            for top in range(0, height, strip_rows)
+        )
+    return (width, height), strips
+
+
+class StripWriter:
+    """Write an rgb image to a file in strips of rows, from top to bottom
+
+    PPM (.ppm, .pnm) and TIFF (.tif, .tiff) files are written uncompressed
+    as the strips come, so only one strip at a time is in memory. Other
+    formats (e.g. JPEG, PNG) are collected into one uint8 array and saved
+    with PIL on close.
+
+    Use as a context manager:
+
+        with StripWriter("out.tif", width, height) as writer:
+            for strip in strips:
+                writer.write(strip)
+    """
+
+    def __init__(self, filename: str, width: int, height: int):
+        self.filename = filename
+        self.width = width
+        self.height = height
+        self.row = 0
+        self._file = None
+        self._pixels = None
+        suffix = Path(filename).suffix.lower()
+        if suffix in (".ppm", ".pnm"):
+            self._file = open(filename, "wb")
+            self._file.write(f"P6\n{width} {height}\n255\n".encode())
+        elif suffix in (".tif", ".tiff"):
+            self._file = open(filename, "wb")
+            self._file.write(self._tiff_header())
+        else:
+            self._pixels = np.empty((height, width, 3), np.uint8)
+
+    def _tiff_header(self) -> bytes:
+        """Return the header of an uncompressed rgb TIFF with a single strip,
+        followed by the pixels"""
+        size = 3*self.width*self.height
+        if size >= 1 << 32:
+            raise ValueError("Images of 4 GB or more cannot be written as TIFF, use PPM instead")
+        # header, then an IFD of 10 entries at offset 8, then the bits per sample at 134
+        bits_offset, pixels_offset = 134, 140
+        entries = [
+            (256, 4, 1, self.width),  # ImageWidth
+            (257, 4, 1, self.height),  # ImageLength
+            (258, 3, 3, bits_offset),  # BitsPerSample
+            (259, 3, 1, 1),  # Compression: none
+            (262, 3, 1, 2),  # PhotometricInterpretation: RGB
+            (273, 4, 1, pixels_offset),  # StripOffsets
+            (277, 3, 1, 3),  # SamplesPerPixel
+            (278, 4, 1, self.height),  # RowsPerStrip
+            (279, 4, 1, size),  # StripByteCounts
+            (284, 3, 1, 1),  # PlanarConfiguration: contiguous
+        ]
+        header = b"II*\x00" + struct.pack("<I", 8) + struct.pack("<H", len(entries))
+        header += b"".join(struct.pack("<HHII", *entry) for entry in entries)
+        header += struct.pack("<I", 0) + struct.pack("<HHH", 8, 8, 8)
+        return header
+
+    def write(self, strip: np.array) -> None:
+        """Write the next strip of rows, a uint8 array of shape (rows, width, 3)"""
+        rows = strip.shape[0]
+        if strip.shape[1:] != (self.width, 3) or self.row + rows > self.height:
+            raise ValueError(f"Strip of shape {strip.shape} does not fit in a {self.width}x{self.height} rgb image")
+        if self._file is not None:
+            self._file.write(np.ascontiguousarray(strip, dtype=np.uint8).tobytes())
+        else:
+            self._pixels[self.row:self.row + rows] = strip
+        self.row += rows
+
+    def close(self) -> None:
+        """Finish the file
+
+        Raises:
+            ValueError: If fewer rows than the height of the image were written.
+        """
+        if self.row != self.height and (self._file is not None or self._pixels is not None):
+            self.abort()
+            raise ValueError(f"Only {self.row} of {self.height} rows were written to {self.filename}")
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        elif self._pixels is not None:
+            write_image(self._pixels, self.filename)
+            self._pixels = None
+
+    def __enter__(self):
+        return self
+
+    def abort(self) -> None:
+        """Stop writing, leaving an incomplete file (if any)"""
+        if self._file is not None:
+            self._file.close()
+        self._file = self._pixels = None
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
@@ -0,0 +1,112 @@
+"""lookup-table implementation of image filters
+
+The input is uint8, so every channel has only 256 values, and the
+contribution of each input channel to each output channel can be
+precomputed in a table of 256 integers. A filtered channel is then three
+table lookups and an add, instead of three float multiplications.
+
+The weights of the filters have (at most) three decimals, so the tables
+hold the contributions in thousandths (integer fixed point) and the sums
+are exact. An integer division of the sum by 1000 truncates like
+astype("uint8"), and the result saturates at 255.
+
+The lookups run in a numba kernel (compiled once and cached on disk, as
+in numba_filters): as numpy fancy indexing, every lookup would be a pass
+over the whole image, which is slower than the float filters.
+"""
+from numba import jit
+import numpy as np
+
+# Fixed point: the number of units in 1
+SCALE = 1000
+
+# the weights of the filters in thousandths (0.21, 0.72, 0.07 for gray)
+GRAY_WEIGHTS = ((210, 720, 70),)
+SEPIA_MATRIX = (
+    (393, 769, 189),
+    (349, 686, 168),
+    (272, 534, 131),
+)
+
+
+def channel_tables(matrix: tuple) -> np.array:
+    """Return the tables of weight*value for every value 0-255
+
+    Args:
+        matrix (tuple): one row of weights (in thousandths) per output channel
+    Returns:
+        np.array: int32 tables of shape (rows, 3, 256)
+    """
+    weights = np.array(matrix, dtype=np.int32)
+    return weights[:, :, np.newaxis]*np.arange(256, dtype=np.int32)
+
+
+GRAY_TABLES = channel_tables(GRAY_WEIGHTS)
+SEPIA_TABLES = channel_tables(SEPIA_MATRIX)
+
+
+@jit(nopython=True, cache=True)
+def apply_tables(image: np.array, tables: np.array, out: np.array) -> np.array:
+    """Looks up the new RGB values of every pixel.
+
+    Args:
+        image (np.array): image in the numpy array form, type uint8
+        tables (np.array): int32 tables of shape (rows, 3, 256), see channel_tables.
+            With a single row, its value is used for every channel (gray).
+        out (np.array): uint8 array of the shape of image to write into
+
+    Returns:
+        np.array: out, the filtered image
+    """
+    # height, width of pixels will be used in the for cycle
+    height, width, channels = image.shape
+    rows = tables.shape[0]
+
+    for i in range(height):
+        for j in range(width):
+            # read the whole pixel first, so out may be the image itself
+            r = image[i,j,0]
+            g = image[i,j,1]
+            b = image[i,j,2]
+            value = np.uint8(0)
+            for k in range(channels): # loop over new RGB values
+                if k < rows:
+                    # from thousandths to the truncated value, saturated at 255
+                    value = np.uint8(min((tables[k,0,r] + tables[k,1,g] + tables[k,2,b])//SCALE, 255))
+                out[i,j,k] = value
+
+    return out
+
+
+def _check_image(image: np.array) -> None:
+    """Check that image is a uint8 rgb image, which the tables are made for"""
+    if image.dtype != np.uint8:
+        raise ValueError(f"The lookup tables need a uint8 image, got {image.dtype}")
+    if image.ndim != 3 or image.shape[2] != 3:
+        raise ValueError(f"Expected an rgb image of shape (height, width, 3), got {image.shape}")
+
+
+def lut_color2gray(image: np.array) -> np.array:
+    """Convert rgb pixel array to grayscale
+
+    Args:
+        image (np.array): uint8 image
+    Returns:
+        np.array: gray_image
+    """
+    _check_image(image)
+    gray_image = np.empty(image.shape, dtype=np.uint8)
+    return apply_tables(image, GRAY_TABLES, gray_image)
+
+
+def lut_color2sepia(image: np.array) -> np.array:
+    """Convert rgb pixel array to sepia
+
+    Args:
+        image (np.array): uint8 image
+    Returns:
+        np.array: sepia_image
+    """
+    _check_image(image)
+    sepia_image = np.empty(image.shape, dtype=np.uint8)
+    return apply_tables(image, SEPIA_TABLES, sepia_image)
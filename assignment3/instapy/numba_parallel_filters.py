@@ -0,0 +1,70 @@
+"""numba-optimized filters, running the rows in parallel threads
+
+The same kernels as in numba_filters, compiled with parallel=True, where
+`prange` splits the rows of the image over numba's threads.
+The number of threads can be set with numba.set_num_threads
+(or the NUMBA_NUM_THREADS environment variable).
+"""
+from numba import jit, prange
+import numpy as np
+
+from .numba_filters import GRAY_WEIGHTS, SEPIA_MATRIX
+
+
+@jit(nopython=True, cache=True, parallel=True)
+def apply_grayscale_parallel(image: np.array, filter_arr: np.array, out: np.array) -> np.array:
+    """Computes the weighted sum of the channels of every pixel,
+    see numba_filters.apply_grayscale."""
+    height, width, channels = image.shape
+
+    # every row is independent, so the rows are split over the threads
+    for i in prange(height):
+        for j in range(width):
+            gray_color = 0.0
+            for k in range(channels):
+                gray_color += image[i,j,k]*filter_arr[k]
+            for k in range(channels):
+                out[i,j,k] = np.float32(gray_color)
+
+    return out
+
+
+@jit(nopython=True, cache=True, parallel=True)
+def apply_sepia_parallel(image: np.array, filter_matrix: np.array, out: np.array) -> np.array:
+    """Computes the multiplication of every pixel with the sepia matrix,
+    see numba_filters.apply_sepia."""
+    height, width, channels = image.shape
+
+    for i in prange(height):
+        for j in range(width):
+            for k in range(channels):
+                val = 0.0
+                for m in range(channels):
+                    val += image[i,j,m]*filter_matrix[k,m]
+                out[i,j,k] = np.float32(min(val, 255.0))
+
+    return out
+
+
+def numba_parallel_color2gray(image: np.array) -> np.array:
+    """Convert rgb pixel array to grayscale
+
+    Args:
+        image (np.array)
+    Returns:
+        np.array: gray_image
+    """
+    gray_image = np.empty(image.shape, dtype=np.uint8)
+    return apply_grayscale_parallel(image, GRAY_WEIGHTS, gray_image)
+
+
+def numba_parallel_color2sepia(image: np.array) -> np.array:
+    """Convert rgb pixel array to sepia
+
+    Args:
+        image (np.array)
+    Returns:
+        np.array: sepia_image
+    """
+    sepia_image = np.empty(image.shape, dtype=np.uint8)
+    return apply_sepia_parallel(image, SEPIA_MATRIX, sepia_image)
@@ -0,0 +1,62 @@
+"""Tiled (streaming) filtering of images that are too large for memory
+
+The filters only look at one pixel at a time, so an image can be filtered
+in strips of rows: each strip is read, filtered and written before the
+next one is read. Only a strip (and the temporary copies a filter makes of
+it) is in memory at a time, instead of the whole image and its copies.
+"""
+
+import numpy as np
+
+import instapy
+from . import io
+
+
+def filter_strips(strips, filter_function):
+    """Apply a filter to every strip of an image
+
+    Args:
+        strips (iterable): rgb arrays of shape (rows, width, channels)
+        filter_function (function): any filter returned by instapy.get_filter
+
+    Yields:
+        np.array: the filtered strips
+    """
+    for strip in strips:
+        # memory-mapped and cropped strips are read-only, and not every
+        # implementation takes a non-contiguous array
+        yield filter_function(np.ascontiguousarray(strip))
+
+
+def tiled_filter(
+    file: str,
+    out_file: str,
+    implementation: str = "python",
+    filter: str = "color2gray",
+    strip_rows: int = None,
+) -> None:
+    """Filter an image file in strips of rows, with bounded memory
+
+    The whole image is never in memory when it is read from and written to
+    uncompressed PPM or TIFF files (see io.read_strips and io.StripWriter).
+    Compressed inputs are decoded once to uint8, and compressed outputs are
+    collected as uint8, but the filters still only run on one strip at a time.
+
+    Args:
+        file (str): the image file to filter
+        out_file (str): the file to save the filtered image to
+        implementation (str): the filter implementation (python, numba, etc.)
+        filter (str): 'color2gray' or 'color2sepia'
+        strip_rows (int): the number of rows in a strip,
+            by default about io.STRIP_PIXELS pixels
+    """
+    filter_function = instapy.get_filter(filter, implementation)
+    filter_file_in_strips(filter_function, file, out_file, strip_rows)
+
+
+def filter_file_in_strips(filter_function, file: str, out_file: str, strip_rows: int = None) -> None:
+    """Filter an image file in strips of rows with a loaded filter function, see tiled_filter"""
+    (width, height), strips = io.read_strips(file, strip_rows)
+    with io.StripWriter(out_file, width, height) as writer:
+        for filtered in filter_strips(strips, filter_function):
+            writer.write(filtered)
@@ -81,7 +81,7 @@ def make_reports(filename: str = "test/rain.jpg", calls: int = 3):
         report_lines.append(s)
         
         # iterate through the implementations
-        implementations = ("numpy", "numba", "cython")
+        implementations = ("numpy", "numba", "numba_parallel", "cython", "lut")
         for implementation in implementations:
             filter_function = instapy.get_filter(filter = filter_name, implementation=implementation)
             # time the filter
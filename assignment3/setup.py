@@ -1,14 +1,55 @@
+import os
+import sys
+
 from setuptools import setup
 
 # IN4110: set to True when you are ready for the Cython implementation in Task 5
 use_cython = True
 
+# Debug build, for profiling the Cython filters with line_profiler:
+#     INSTAPY_DEBUG=1 python3 -m pip install --no-build-isolation .
+# Line tracing slows down every line of the compiled code (and keeps it from
+# running without the GIL), so it is only enabled in debug builds.
+debug = os.environ.get("INSTAPY_DEBUG", "0") != "0"
+
+# OpenMP runs the prange loops of the filters in parallel threads. Apple's
+# clang has no OpenMP by default, so it is off on macOS unless INSTAPY_OPENMP=1.
+use_openmp = os.environ.get("INSTAPY_OPENMP", "0" if sys.platform == "darwin" else "1") != "0"
+
 
 if use_cython:
     from setuptools import Extension
     import numpy as np
     from Cython.Build import cythonize
 
+    openmp_flags = []
+    if use_openmp:
+        openmp_flags = ["/openmp"] if sys.platform == "win32" else ["-fopenmp"]
+
+    define_macros = []
+    cython_directives = {
+        "language_level": 3,
+        "boundscheck": False,
+        "wraparound": False,
+        "initializedcheck": False,
+        "cdivision": True,
+    }
+    if debug:
+        # enable profiling
+        define_macros += [
+            ("CYTHON_TRACE", "1"),
+            ("CYTHON_TRACE_NOGIL", "1"),
+        ]
+        cython_directives.update(
+            {
+                "binding": True,
+                "profile": True,
+                "linetrace": True,
+                "boundscheck": True,
+                "initializedcheck": True,
+            }
+        )
+
     extensions = [
         # A single module that is stand alone and has no special requisites
         Extension(
@@ -17,26 +58,18 @@ if use_cython:
             include_dirs=[
                 np.get_include(),
             ],
-            # enable profiling
-            define_macros=[
-                ("CYTHON_TRACE", "1"),
-                ("CYTHON_TRACE_NOGIL", "1"),
-            ],
+            define_macros=define_macros,
+            extra_compile_args=openmp_flags,
+            extra_link_args=openmp_flags,
         ),
     ]
-    cython_directives = {
-        "language_level": 3,
-        # enable profiling
-        "binding": True,
-        "profile": True,
-        "linetrace": True,
-        # you may want to add some compiler directives here
-        # to optimize compilation
-    }
     ext_modules = cythonize(
         extensions,
         compiler_directives=cython_directives,
-        annotate=True,
+        # write the annotated cython_filters.html in debug builds
+        annotate=debug,
+        # the directives differ between builds, so always regenerate the C code
+        force=True,
     )
 else:
     ext_modules = []
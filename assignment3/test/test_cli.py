@@ -0,0 +1,51 @@
+from instapy.cli import batch_out_files, expand_files, main, run_batch
+from instapy.numpy_filters import numpy_color2gray
+
+import numpy.testing as nt
+import pytest
+from instapy import io
+
+
+def test_expand_files(tmp_path):
+    """Check that directories and globs expand to the image files in them."""
+    for name in ("a.jpg", "b.png", "notes.txt"):
+        (tmp_path / name).write_bytes(b"")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "c.jpg").write_bytes(b"")
+
+    assert expand_files([str(tmp_path)]) == [str(tmp_path / "a.jpg"), str(tmp_path / "b.png")]
+    assert expand_files([str(tmp_path / "**" / "*.jpg")]) == [str(tmp_path / "a.jpg"), str(tmp_path / "sub" / "c.jpg")]
+    # each file is listed once
+    assert expand_files([str(tmp_path / "a.jpg"), str(tmp_path)]) == [str(tmp_path / "a.jpg"), str(tmp_path / "b.png")]
+    with pytest.raises(FileNotFoundError):
+        expand_files([str(tmp_path / "*.gif")])
+    with pytest.raises(ValueError):
+        batch_out_files(["x/a.jpg", "y/a.jpg"], str(tmp_path))
+
+
+def test_run_batch(tmp_path, image):
+    """Check that a batch in worker processes gives the same images as the filter."""
+    files = []
+    for i in range(4):
+        files.append(str(tmp_path / f"image{i}.png"))
+        io.write_image(image, files[-1])
+    files.append(str(tmp_path / "broken.png"))
+    (tmp_path / "broken.png").write_bytes(b"not an image")
+
+    errors = run_batch(files, str(tmp_path / "out"), "numpy", "color2gray", jobs=2)
+    assert list(errors) == [str(tmp_path / "broken.png")]
+    for i in range(4):
+        gray_image = io.read_image(tmp_path / "out" / f"image{i}_color2gray.png")
+        nt.assert_array_equal(gray_image, numpy_color2gray(image))
+
+    # many files need an output directory
+    with pytest.raises(SystemExit):
+        main([str(tmp_path / "*.png")])
+    assert main([str(tmp_path / "image*.png"), "-d", str(tmp_path / "cli"), "-j", "1", "-i", "numpy"]) == 0
+    assert len(list((tmp_path / "cli").iterdir())) == 4
+
+    # an unknown filter fails before any worker is started
+    with pytest.raises(AttributeError):
+        run_batch(files, str(tmp_path / "out"), "numpy", "color2blue", jobs=2)
+    with pytest.raises(ModuleNotFoundError):
+        run_batch(files, str(tmp_path / "out"), "fortran", "color2gray", jobs=2)
@@ -3,6 +3,7 @@ from instapy.numpy_filters import numpy_color2gray, numpy_color2sepia
 
 import numpy as np
 import numpy.testing as nt
+import pytest
 from pathlib import Path
 from instapy import io
 
@@ -42,3 +43,21 @@ def test_color2sepia(image, reference_sepia):
     # rounding to closest integer may work 
     # differently. Therefore we must allow absolute tolerance to be 1.
     nt.assert_allclose(sepia_image, reference_sepia, atol=1)
+
+
+def test_out(image):
+    """Check that the cython filters can write into a given array, also in place."""
+    for cython_filter in (cython_color2gray, cython_color2sepia):
+        expected = cython_filter(image)
+        out = np.zeros_like(image)
+        assert cython_filter(image, out=out) is out
+        nt.assert_array_equal(out, expected)
+
+        in_place = image.copy()
+        cython_filter(in_place, out=in_place)
+        nt.assert_array_equal(in_place, expected)
+
+        # non-contiguous images are copied first
+        nt.assert_array_equal(cython_filter(image[::-1]), expected[::-1])
+        with pytest.raises(ValueError):
+            cython_filter(image, out=np.empty((2, 2, 3), np.uint8))
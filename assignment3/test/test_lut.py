@@ -0,0 +1,49 @@
+from instapy.lut_filters import lut_color2gray, lut_color2sepia
+
+import numpy as np
+import numpy.testing as nt
+import pytest
+
+
+def test_color2gray(image, reference_gray):
+    """Check that grayscale filter works in lookup-table implementation."""
+    gray_image = lut_color2gray(image)
+
+    # check that the result has the right shape, type
+    assert isinstance(gray_image, np.ndarray)
+    assert gray_image.shape == image.shape
+    assert gray_image.dtype == np.uint8
+
+    # the tables are exact, while the python implementation rounds
+    # floats, so values close to an integer may be truncated differently.
+    # Therefore we must allow absolute tolerance to be 1.
+    nt.assert_allclose(gray_image, reference_gray, atol=1)
+
+
+def test_color2sepia(image, reference_sepia):
+    """Check that sepia filter works in lookup-table implementation."""
+    sepia_image = lut_color2sepia(image)
+
+    # check that the result has the right shape, type
+    assert isinstance(sepia_image, np.ndarray)
+    assert sepia_image.shape == image.shape
+    assert sepia_image.dtype == np.uint8
+
+    nt.assert_allclose(sepia_image, reference_sepia, atol=1)
+
+
+def test_exact():
+    """Check the lookups against exact integer arithmetic, with saturation."""
+    pixels = np.array([[[0, 0, 0], [255, 255, 255], [100, 100, 100], [10, 200, 30]]], dtype=np.uint8)
+    r, g, b = (pixels[..., k].astype(int) for k in range(3))
+
+    gray = (210*r + 720*g + 70*b)//1000
+    nt.assert_array_equal(lut_color2gray(pixels), np.stack([gray]*3, axis=-1))
+
+    sepia_matrix = [[393, 769, 189], [349, 686, 168], [272, 534, 131]]
+    sepia = [np.minimum((wr*r + wg*g + wb*b)//1000, 255) for wr, wg, wb in sepia_matrix]
+    nt.assert_array_equal(lut_color2sepia(pixels), np.stack(sepia, axis=-1))
+    assert lut_color2sepia(pixels)[0, 1].tolist() == [255, 255, 238]
+
+    with pytest.raises(ValueError):
+        lut_color2gray(pixels.astype(float))
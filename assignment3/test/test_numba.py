@@ -1,4 +1,5 @@
 from instapy.numba_filters import numba_color2gray, numba_color2sepia
+from instapy.numba_parallel_filters import numba_parallel_color2gray, numba_parallel_color2sepia
 from instapy.numpy_filters import numpy_color2gray, numpy_color2sepia
 
 import numpy as np
@@ -38,3 +39,10 @@ def test_color2sepia(image, reference_sepia):
     assert sepia_image.shape[2] == 3
     
     nt.assert_allclose(sepia_image, reference_sepia)
+
+
+def test_parallel(image, reference_gray, reference_sepia):
+    """Check that the parallel numba filters give the same images as the serial ones."""
+    nt.assert_array_equal(numba_parallel_color2gray(image), numba_color2gray(image))
+    nt.assert_array_equal(numba_parallel_color2sepia(image), numba_color2sepia(image))
+    nt.assert_allclose(numba_parallel_color2sepia(image), reference_sepia)
@@ -53,7 +53,7 @@ def test_dependencies(dep):
 )
 @pytest.mark.parametrize(
     "implementation",
-    ["python", "numpy", "numba"],
+    ["python", "numpy", "numba", "numba_parallel", "lut"],
 )
 def test_get_filter(filter_name, implementation):
     """Can we load our filter functions"""
@@ -0,0 +1,41 @@
+from instapy.tiled import tiled_filter
+
+import numpy as np
+import numpy.testing as nt
+import pytest
+import instapy
+from instapy import io
+
+
+@pytest.mark.parametrize("implementation", ["python", "numpy", "numba", "numba_parallel", "lut"])
+@pytest.mark.parametrize("filter_name", ["color2gray", "color2sepia"])
+def test_tiled_filter(tmp_path, image, implementation, filter_name):
+    """Check that filtering in strips gives the same image as filtering it whole."""
+    filter_function = instapy.get_filter(filter_name, implementation)
+    expected = filter_function(image)
+    for suffix in (".tif", ".png"):
+        in_file = str(tmp_path / f"image{suffix}")
+        out_file = str(tmp_path / f"filtered{suffix}")
+        io.write_image(image, in_file)
+        # 37 rows do not divide the height, so the last strip is shorter
+        tiled_filter(in_file, out_file, implementation, filter_name, strip_rows=37)
+        nt.assert_array_equal(io.read_image(out_file), expected)
+
+
+def test_strips(tmp_path, image):
+    """Check that strips written by StripWriter are read back by read_strips."""
+    height, width, channels = image.shape
+    for name in ("image.tif", "image.ppm", "image.png"):
+        with io.StripWriter(str(tmp_path / name), width, height) as writer:
+            for top in range(0, height, 50):
+                writer.write(image[top:top + 50])
+        (size, strips) = io.read_strips(str(tmp_path / name), strip_rows=64)
+        strips = list(strips)
+        assert size == (width, height)
+        assert [strip.shape[0] for strip in strips] == [64, 64, 52]
+        nt.assert_array_equal(np.concatenate(strips), image)
+
+    writer = io.StripWriter(str(tmp_path / "short.tif"), width, height)
+    writer.write(image[:10])
+    with pytest.raises(ValueError):
+        writer.close()